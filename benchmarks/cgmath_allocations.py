@@ -0,0 +1,130 @@
+import os
+import sys
+import time
+import argparse
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import cgmath as cgm
+from cgmath.genType import genType
+
+
+class AllocationCounter:
+
+    def __init__(self):
+        self.count = 0
+        self.__original_init = None
+
+    def __enter__(self):
+        self.count = 0
+        self.__original_init = genType.__init__
+        original_init = self.__original_init
+
+        def counting_init(obj):
+            self.count += 1
+            original_init(obj)
+
+        genType.__init__ = counting_init
+        return self
+
+    def __exit__(self, *args):
+        genType.__init__ = self.__original_init
+
+
+def tbn_allocating(p0, p1, p2, st0, st1, st2):
+    v01 = p1 - p0
+    v02 = p2 - p0
+    st01 = st1 - st0
+    st02 = st2 - st0
+    normal = cgm.cross(v01, v02)
+    normal = normal / cgm.length(normal)
+    tangent = st02.t * v01 - st01.t * v02
+    bitangent = st01.s * v02 - st02.s * v01
+    return normal, tangent, bitangent
+
+
+v01_scratch = cgm.vec3()
+v02_scratch = cgm.vec3()
+temp_scratch = cgm.vec3()
+
+def tbn_out(p0, p1, p2, st0, st1, st2):
+    v01 = cgm.sub(p1, p0, out=v01_scratch)
+    v02 = cgm.sub(p2, p0, out=v02_scratch)
+    s01 = st1.s - st0.s
+    t01 = st1.t - st0.t
+    s02 = st2.s - st0.s
+    t02 = st2.t - st0.t
+    normal = cgm.cross(v01, v02)
+    normal /= cgm.length(normal)
+    tangent = t02 * v01
+    tangent -= cgm.mul(v02, t01, out=temp_scratch)
+    bitangent = s01 * v02
+    bitangent -= cgm.mul(v01, s02, out=temp_scratch)
+    return normal, tangent, bitangent
+
+
+def project_allocating(q, position, world_coord):
+    view_coord = cgm.inverse(q) * (world_coord - position)
+    return cgm.vec4(view_coord.x, view_coord.z, view_coord.y, view_coord.y)
+
+
+view_scratch = cgm.vec3()
+quat_scratch = cgm.quat()
+NDC_scratch = cgm.vec4()
+
+def project_out(q, position, world_coord):
+    cgm.sub(world_coord, position, out=view_scratch)
+    cgm.mul(cgm.inverse(q, out=quat_scratch), view_scratch, out=view_scratch)
+    x, y, z = view_scratch
+    NDC_scratch._data[:] = (x, z, y, y)
+    return NDC_scratch
+
+
+def make_cases():
+    a = cgm.vec3(1, 2, 3)
+    b = cgm.vec3(4, 5, 6)
+    c = cgm.vec3()
+    m = cgm.mat4(2, 0, 0, 0, 0, 3, 0, 0, 0, 0, 4, 0, 1, 2, 3, 1)
+    m_out = cgm.mat4()
+    v4 = cgm.vec4(1, 2, 3, 1)
+    v4_out = cgm.vec4()
+    q = cgm.normalize(cgm.quat(1, 2, 3, 4))
+    st0 = cgm.vec2(0, 0)
+    st1 = cgm.vec2(1, 0)
+    st2 = cgm.vec2(0, 1)
+
+    return [
+        ("vec3 add", lambda: a + b, lambda: cgm.add(a, b, out=c)),
+        ("vec3 cross", lambda: cgm.cross(a, b), lambda: cgm.cross(a, b, out=c)),
+        ("vec3 normalize", lambda: cgm.normalize(a), lambda: cgm.normalize(a, out=c)),
+        ("mat4 * vec4", lambda: m * v4, lambda: cgm.mul(m, v4, out=v4_out)),
+        ("mat4 * mat4", lambda: m * m, lambda: cgm.mul(m, m, out=m_out)),
+        ("mat4 inverse", lambda: cgm.inverse(m), lambda: cgm.inverse(m, out=m_out)),
+        ("quat * vec3", lambda: q * a, lambda: cgm.mul(q, a, out=c)),
+        ("generate_temp_TBN", lambda: tbn_allocating(a, b, c, st0, st1, st2), lambda: tbn_out(a, b, c, st0, st1, st2)),
+        ("Camera.project", lambda: project_allocating(q, a, b), lambda: project_out(q, a, b)),
+    ]
+
+
+def measure(func, n:int):
+    with AllocationCounter() as counter:
+        func()
+
+    start = time.perf_counter()
+    for _ in range(n):
+        func()
+    elapsed = time.perf_counter() - start
+
+    return counter.count, elapsed / n * 1e6
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="compare cgmath allocations per operation with and without out=")
+    parser.add_argument("--n", type=int, default=100000)
+    args = parser.parse_args()
+
+    print(f"{'operation':<20}{'allocs':>8}{'allocs(out=)':>14}{'us/op':>10}{'us/op(out=)':>14}")
+    for name, allocating, out in make_cases():
+        allocating_count, allocating_time = measure(allocating, args.n)
+        out_count, out_time = measure(out, args.n)
+        print(f"{name:<20}{allocating_count:>8}{out_count:>14}{allocating_time:>10.2f}{out_time:>14.2f}")
@@ -0,0 +1,39 @@
+import os
+import sys
+import gc
+import argparse
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import cgmath as cgm
+
+
+def bytes_per_object(factory, n:int)->float:
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    objects = [factory() for _ in range(n)]
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    list_bytes = sys.getsizeof(objects)
+    del objects
+    return (after - before - list_bytes) / n
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="measure memory footprint of cgmath value types")
+    parser.add_argument("--n", type=int, default=100000)
+    args = parser.parse_args()
+
+    mat = cgm.mat4()
+    cases = [
+        ("vec3", cgm.vec3),
+        ("vec4", cgm.vec4),
+        ("quat", cgm.quat),
+        ("mat4", cgm.mat4),
+        ("mat4 column", lambda: mat[0]),
+    ]
+    for name, factory in cases:
+        print(f"{name:<12}{bytes_per_object(factory, args.n):>8.1f} bytes")
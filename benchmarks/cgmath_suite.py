@@ -0,0 +1,201 @@
+import os
+import sys
+import json
+import time
+import timeit
+import fnmatch
+import argparse
+import platform
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+import cgmath as cgm
+
+try:
+    import cgmath.fast_ops as fast_ops
+except ImportError:
+    fast_ops = None
+
+
+def make_cases():
+    a = cgm.vec3(1, 2, 3)
+    b = cgm.vec3(4, 5, 6)
+    c = cgm.vec3()
+    v4 = cgm.vec4(1, 2, 3, 1)
+    m3 = cgm.mat3(2, 1, 0, 0, 3, 1, 1, 0, 4)
+    m4 = cgm.mat4(2, 0, 0, 0, 0, 3, 0, 0, 0, 0, 4, 0, 1, 2, 3, 1)
+    m4_general = cgm.mat4(2, 1, 0, 0, 0, 3, 1, 0, 1, 0, 4, 1, 0, 2, 0, 5)
+    m4_out = cgm.mat4()
+    q1 = cgm.normalize(cgm.quat(1, 2, 3, 4))
+    q2 = cgm.normalize(cgm.quat(4, 3, 2, 1))
+
+    rng = np.random.default_rng(0)
+    n = 10000
+    try:
+        va = cgm.vec3array(rng.normal(size=(n, 3)))
+        vb = cgm.vec3array(rng.normal(size=(n, 3)))
+        ma = cgm.mat4array(n)
+        ma.ndarray[:, 3, :3] = rng.normal(size=(n, 3))
+        v4a = cgm.vec4array(np.concatenate((va.ndarray, np.ones((n, 1))), axis=1))
+        qa = cgm.quatarray(rng.normal(size=(n, 4))).normalize()
+        qb = cgm.quatarray(rng.normal(size=(n, 4))).normalize()
+    except (AttributeError, TypeError, ValueError):
+        va = vb = ma = v4a = qa = qb = None
+
+    return {
+        "construct/vec3()": lambda: cgm.vec3(),
+        "construct/vec3(x,y,z)": lambda: cgm.vec3(1, 2, 3),
+        "construct/vec4(vec3,w)": lambda: cgm.vec4(a, 1),
+        "construct/mat4()": lambda: cgm.mat4(),
+        "construct/quat(w,x,y,z)": lambda: cgm.quat(1, 0, 0, 0),
+        "arith/vec3+vec3": lambda: a + b,
+        "arith/vec3*scalar": lambda: a * 2.0,
+        "arith/vec3+=vec3": lambda: c.__iadd__(a),
+        "arith/add(out=)": lambda: cgm.add(a, b, out=c),
+        "arith/dot": lambda: cgm.dot(a, b),
+        "arith/cross": lambda: cgm.cross(a, b),
+        "arith/normalize": lambda: cgm.normalize(a),
+        "swizzle/get x": lambda: a.x,
+        "swizzle/get xy": lambda: a.xy,
+        "swizzle/get zyx": lambda: a.zyx,
+        "swizzle/set x": lambda: setattr(c, "x", 1.0),
+        "swizzle/set xyz": lambda: setattr(c, "xyz", a),
+        "matrix/mat3*mat3": lambda: m3 * m3,
+        "matrix/mat4*mat4": lambda: m4 * m4,
+        "matrix/mat4*vec4": lambda: m4 * v4,
+        "matrix/mul(out=)": lambda: cgm.mul(m4, m4, out=m4_out),
+        "matrix/transpose": lambda: cgm.transpose(m4),
+        "matrix/column": lambda: m4[3],
+        "inverse/mat3": lambda: cgm.inverse(m3),
+        "inverse/mat4 general": lambda: cgm.inverse(m4_general),
+        "inverse/mat4 affine": lambda: cgm.inverse(m4),
+        "inverse/rigidInverse": lambda: cgm.rigidInverse(m4),
+        "inverse/determinant": lambda: cgm.determinant(m4_general),
+        "quat/quat*quat": lambda: q1 * q2,
+        "quat/quat*vec3": lambda: q1 * a,
+        "quat/inverse": lambda: cgm.inverse(q1),
+        "quat/mat4_cast": lambda: cgm.mat4_cast(q1),
+        "quat/quat_cast": lambda: cgm.quat_cast(m3),
+        "quat/slerp": lambda: cgm.slerp(q1, q2, 0.3),
+        "quat/quatToYawPitchRoll": lambda: cgm.quatToYawPitchRoll(q1),
+        "array/vec3array+vec3array": lambda: va + vb,
+        "array/mat4array*vec4array": lambda: ma * v4a,
+        "array/mat4array.affineInverse": lambda: ma.affineInverse(),
+        "array/quatarray*quatarray": lambda: qa * qb,
+        "array/quatarray.slerp": lambda: qa.slerp(qb, 0.3),
+        "array/quatarray.mat4_cast": lambda: qa.mat4_cast(),
+    }
+
+
+def available(func)->bool:
+    try:
+        func()
+    except (AttributeError, TypeError, NotImplementedError):
+        return False
+
+    return True
+
+
+def measure(func, min_time:float, repeat:int)->dict:
+    timer = timeit.Timer(func)
+    number, _ = timer.autorange()
+    while number * (timer.timeit(number) / number) < min_time:
+        number *= 2
+
+    samples = [timer.timeit(number) / number * 1e9 for _ in range(repeat)]
+    return {
+        "number": number,
+        "repeat": repeat,
+        "min_ns": min(samples),
+        "median_ns": sorted(samples)[len(samples) // 2],
+        "max_ns": max(samples)
+    }
+
+
+def run(args)->None:
+    cases = make_cases()
+    names = [name for name in cases if not args.filter or any(fnmatch.fnmatch(name, pattern) for pattern in args.filter)]
+
+    results = {}
+    skipped = []
+    for name in names:
+        if not available(cases[name]):
+            skipped.append(name)
+            print(f"{name:<36}{'skipped':>17}")
+            continue
+
+        results[name] = measure(cases[name], args.min_time, args.repeat)
+        print(f"{name:<36}{results[name]['min_ns']:>14.1f} ns")
+
+    if args.output:
+        report = {
+            "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "python": platform.python_version(),
+            "numpy": np.__version__,
+            "platform": platform.platform(),
+            "fast_ops": fast_ops is not None and fast_ops.enabled,
+            "skipped": skipped,
+            "results": results
+        }
+        with open(args.output, "w") as out_file:
+            json.dump(report, out_file, indent=4)
+
+
+def compare(args)->int:
+    with open(args.baseline) as in_file:
+        baseline = json.load(in_file)["results"]
+
+    with open(args.contender) as in_file:
+        contender = json.load(in_file)["results"]
+
+    n_regressions = 0
+    print(f"{'benchmark':<36}{'baseline ns':>14}{'contender ns':>14}{'ratio':>8}")
+    for name in baseline:
+        if name not in contender:
+            continue
+
+        baseline_ns = baseline[name][args.stat]
+        contender_ns = contender[name][args.stat]
+        ratio = contender_ns / baseline_ns
+        flag = ""
+        if ratio > 1 + args.threshold:
+            flag = "  slower"
+            n_regressions += 1
+        elif ratio < 1 - args.threshold:
+            flag = "  faster"
+
+        print(f"{name:<36}{baseline_ns:>14.1f}{contender_ns:>14.1f}{ratio:>8.2f}{flag}")
+
+    for name in contender:
+        if name not in baseline:
+            print(f"{name:<36}{'-':>14}{contender[name][args.stat]:>14.1f}")
+
+    return 1 if args.fail_on_regression and n_regressions > 0 else 0
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="cgmath CPU micro-benchmarks")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = subparsers.add_parser("run", help="run benchmarks")
+    run_parser.add_argument("--output", "-o", help="write results to this JSON file")
+    run_parser.add_argument("--filter", "-k", action="append", help="glob pattern of benchmark names, may be repeated")
+    run_parser.add_argument("--repeat", type=int, default=5)
+    run_parser.add_argument("--min-time", type=float, default=0.05, help="seconds per sample")
+    run_parser.add_argument("--no-fast-ops", action="store_true", help="disable cgmath.fast_ops kernels")
+
+    compare_parser = subparsers.add_parser("compare", help="compare two result files")
+    compare_parser.add_argument("baseline")
+    compare_parser.add_argument("contender")
+    compare_parser.add_argument("--stat", choices=["min_ns", "median_ns", "max_ns"], default="min_ns")
+    compare_parser.add_argument("--threshold", type=float, default=0.1, help="relative change reported as slower/faster")
+    compare_parser.add_argument("--fail-on-regression", action="store_true")
+
+    args = parser.parse_args()
+    if args.command == "run":
+        if args.no_fast_ops and fast_ops is not None:
+            fast_ops.enabled = False
+        run(args)
+    else:
+        sys.exit(compare(args))
@@ -0,0 +1,62 @@
+import os
+import sys
+import time
+import random
+import argparse
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import cgmath as cgm
+from glass_engine.SceneNode import SceneNode
+from glass_engine.FlatSceneGraph import FlatSceneGraph
+
+
+def build_tree(n_nodes:int, branching:int, seed:int = 0)->SceneNode:
+    rng = random.Random(seed)
+    root = SceneNode("root")
+    queue = [root]
+    count = 1
+    while count < n_nodes:
+        parent = queue.pop(0)
+        for _ in range(min(branching, n_nodes - count)):
+            child = SceneNode()
+            child.position = cgm.vec3(rng.uniform(-10, 10), rng.uniform(-10, 10), rng.uniform(-10, 10))
+            child.orientation = cgm.normalize(cgm.quat(rng.random(), rng.random(), rng.random(), rng.random()))
+            child.scale = cgm.vec3(rng.uniform(0.5, 2))
+            parent.add_child(child)
+            queue.append(child)
+            count += 1
+
+    return root
+
+
+def run(flat_graph:FlatSceneGraph, repeat:int)->float:
+    best = float("inf")
+    for i in range(repeat):
+        flat_graph.positions[:, 0] += 0.01
+        start = time.perf_counter()
+        flat_graph.update()
+        best = min(best, time.perf_counter() - start)
+
+    return best
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="benchmark FlatSceneGraph world transform computation")
+    parser.add_argument("--nodes", type=int, default=100000)
+    parser.add_argument("--branching", type=int, default=8)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    root = build_tree(args.nodes, args.branching)
+    flat_graph = FlatSceneGraph(root)
+
+    start = time.perf_counter()
+    flat_graph.rebuild()
+    rebuild_time = time.perf_counter() - start
+    update_time = run(flat_graph, args.repeat)
+
+    print(f"nodes:   {args.nodes}")
+    print(f"levels:  {len(flat_graph._levels)}")
+    print(f"rebuild: {rebuild_time * 1000:.1f} ms")
+    print(f"update:  {update_time * 1000:.1f} ms")
@@ -0,0 +1,80 @@
+import os
+import sys
+import time
+import argparse
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+from glass_engine.Frustum import Frustum
+from glass_engine.InstanceBVH import InstanceBVH
+
+
+def make_instances(n_instances:int, seed:int = 0):
+    rng = np.random.default_rng(seed)
+    extent = 10 * n_instances ** (1 / 3)
+    centers = rng.uniform(-extent, extent, (n_instances, 3)).astype(np.float32)
+    radii = rng.uniform(0.5, 2, n_instances).astype(np.float32)
+    return centers, radii
+
+
+def best_of(func, repeat:int)->float:
+    best = float("inf")
+    for i in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+
+    return best
+
+
+def point_light_test(position:np.ndarray, coverage:float):
+    def test(centers, radii):
+        return np.linalg.norm(centers - position, axis=1) - radii <= coverage
+
+    return test
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="benchmark InstanceBVH build, refit and queries")
+    parser.add_argument("--instances", type=int, nargs="+", default=[1000, 10000, 100000])
+    parser.add_argument("--leaf_size", type=int, default=8)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--moved", type=float, default=0.01, help="fraction of instances moved per refit")
+    args = parser.parse_args()
+
+    frustum = Frustum.perspective(1.0, 0.75, 0.1, 200)
+    light_test = point_light_test(np.zeros(3, dtype=np.float32), 30)
+    origin = np.array([0, -1e6, 0], dtype=np.float32)
+    direction = np.array([0.01, 1, 0.02], dtype=np.float32)
+
+    print(f"{'instances':>10} {'build':>9} {'refit':>9} {'frustum':>9} {'linear':>9} {'light':>9} {'linear':>9} {'ray':>9} {'visible':>8} {'mode':>7}")
+    for n_instances in args.instances:
+        centers, radii = make_instances(n_instances)
+        bvh = InstanceBVH(args.leaf_size)
+
+        build_time = best_of(lambda: bvh.update(centers, radii, object()), args.repeat)
+        moved = centers.copy()
+        rng = np.random.default_rng(1)
+        n_moved = max(1, int(n_instances * args.moved))
+
+        def refit():
+            moved[rng.choice(n_instances, n_moved, replace=False)] += 0.1
+            bvh.update(moved, radii, bvh._structure)
+
+        refit_time = best_of(refit, args.repeat)
+        frustum_time = best_of(lambda: bvh.query(frustum.test_spheres), args.repeat)
+        linear_frustum_time = best_of(lambda: frustum.test_spheres(moved, radii), args.repeat)
+        light_time = best_of(lambda: bvh.query(light_test), args.repeat)
+        linear_light_time = best_of(lambda: light_test(moved, radii), args.repeat)
+        mode = "linear" if bvh.stale else "tree"
+        ray_time = best_of(lambda: bvh.ray_cast(origin, direction), args.repeat)
+        visible = int(np.count_nonzero(bvh.query(frustum.test_spheres)))
+
+        print(
+            f"{n_instances:>10} "
+            f"{build_time * 1000:>7.2f}ms {refit_time * 1000:>7.2f}ms "
+            f"{frustum_time * 1000:>7.2f}ms {linear_frustum_time * 1000:>7.2f}ms "
+            f"{light_time * 1000:>7.2f}ms {linear_light_time * 1000:>7.2f}ms "
+            f"{ray_time * 1000:>7.2f}ms {visible:>8} {mode:>7}"
+        )
@@ -0,0 +1,79 @@
+import os
+import sys
+import time
+import random
+import argparse
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import cgmath as cgm
+import cgmath.fast_ops as fast_ops
+from glass.utils import quat_to_mat4, scale_to_mat4, translate_to_mat4
+
+
+class Node:
+
+    def __init__(self, rng:random.Random):
+        self.position = cgm.vec3(rng.uniform(-10, 10), rng.uniform(-10, 10), rng.uniform(-10, 10))
+        self.orientation = cgm.normalize(cgm.quat(rng.random(), rng.random(), rng.random(), rng.random()))
+        self.scale = cgm.vec3(rng.uniform(0.5, 2))
+        self.children = []
+
+
+def build_tree(n_nodes:int, branching:int, seed:int = 0)->Node:
+    rng = random.Random(seed)
+    root = Node(rng)
+    queue = [root]
+    count = 1
+    while count < n_nodes:
+        parent = queue.pop(0)
+        for _ in range(min(branching, n_nodes - count)):
+            child = Node(rng)
+            parent.children.append(child)
+            queue.append(child)
+            count += 1
+
+    return root
+
+
+def traverse(node:Node, current_quat:cgm.quat, current_mat:cgm.mat4, results:list)->None:
+    new_quat = current_quat * node.orientation
+    new_mat = (
+        current_mat
+        * translate_to_mat4(node.position)
+        * quat_to_mat4(node.orientation)
+        * scale_to_mat4(node.scale)
+    )
+    results.append(new_mat[3].xyz)
+    for child in node.children:
+        traverse(child, new_quat, new_mat, results)
+
+
+def run(root:Node, enabled:bool, repeat:int)->float:
+    fast_ops.enabled = enabled
+    best = float("inf")
+    for _ in range(repeat):
+        results = []
+        start = time.perf_counter()
+        traverse(root, cgm.quat(), cgm.mat4(), results)
+        best = min(best, time.perf_counter() - start)
+
+    fast_ops.enabled = True
+    return best
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="benchmark Scene.__trav style world transform computation")
+    parser.add_argument("--nodes", type=int, default=10000)
+    parser.add_argument("--branching", type=int, default=8)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    root = build_tree(args.nodes, args.branching)
+    generic_time = run(root, False, args.repeat)
+    fast_time = run(root, True, args.repeat)
+
+    print(f"nodes:        {args.nodes}")
+    print(f"generic path: {generic_time * 1000:.1f} ms")
+    print(f"fast path:    {fast_time * 1000:.1f} ms")
+    print(f"speedup:      {generic_time / fast_time:.2f}x")
@@ -0,0 +1,256 @@
+import os
+import sys
+import json
+import time
+import ctypes
+import argparse
+import platform
+import tempfile
+
+os.environ.setdefault("PYOPENGL_PLATFORM", "egl")
+os.environ.setdefault("EGL_PLATFORM", "surfaceless")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+from OpenGL import GL, EGL
+
+from glass import ShaderProgram, Vertices, Indices
+
+
+vertex_shader = """
+#version 430 core
+
+layout(location=0) in vec3 position;
+layout(location=1) in vec3 normal;
+layout(location=2) in vec3 tangent;
+layout(location=3) in vec3 bitangent;
+layout(location=4) in vec3 tex_coord;
+layout(location=5) in vec4 color;
+layout(location=6) in vec4 back_color;
+
+out vec4 v_color;
+
+void main()
+{
+    vec3 sum = normal + tangent + bitangent + tex_coord;
+    gl_Position = vec4(position + 1E-6 * sum, 1.0);
+    v_color = color + 1E-6 * back_color;
+}
+"""
+
+fragment_shader = """
+#version 430 core
+
+in vec4 v_color;
+out vec4 frag_color;
+
+void main()
+{
+    frag_color = v_color;
+}
+"""
+
+
+def create_context(width:int, height:int)->None:
+    display = EGL.eglGetDisplay(EGL.EGL_DEFAULT_DISPLAY)
+    major, minor = EGL.EGLint(), EGL.EGLint()
+    EGL.eglInitialize(display, ctypes.pointer(major), ctypes.pointer(minor))
+
+    config_attribs = (EGL.EGLint * 5)(
+        EGL.EGL_SURFACE_TYPE, EGL.EGL_PBUFFER_BIT,
+        EGL.EGL_RENDERABLE_TYPE, EGL.EGL_OPENGL_BIT,
+        EGL.EGL_NONE
+    )
+    config = EGL.EGLConfig()
+    n_configs = EGL.EGLint()
+    EGL.eglChooseConfig(display, config_attribs, ctypes.pointer(config), 1, ctypes.pointer(n_configs))
+
+    surface_attribs = (EGL.EGLint * 5)(EGL.EGL_WIDTH, width, EGL.EGL_HEIGHT, height, EGL.EGL_NONE)
+    surface = EGL.eglCreatePbufferSurface(display, config, surface_attribs)
+
+    EGL.eglBindAPI(EGL.EGL_OPENGL_API)
+    context_attribs = (EGL.EGLint * 7)(
+        EGL.EGL_CONTEXT_MAJOR_VERSION, 4,
+        EGL.EGL_CONTEXT_MINOR_VERSION, 3,
+        EGL.EGL_CONTEXT_OPENGL_PROFILE_MASK, EGL.EGL_CONTEXT_OPENGL_CORE_PROFILE_BIT,
+        EGL.EGL_NONE
+    )
+    context = EGL.eglCreateContext(display, config, EGL.EGL_NO_CONTEXT, context_attribs)
+    if not EGL.eglMakeCurrent(display, surface, surface, context):
+        raise RuntimeError("failed to create OpenGL context")
+
+    GL.glViewport(0, 0, width, height)
+
+
+def synthetic_meshes(n_vertices:int):
+    rng = np.random.default_rng(0)
+    n_triangles = n_vertices
+    arrays = {
+        "position": rng.uniform(-1, 1, (n_vertices, 3)).astype(np.float32),
+        "normal": rng.normal(size=(n_vertices, 3)).astype(np.float32),
+        "tangent": rng.normal(size=(n_vertices, 3)).astype(np.float32),
+        "bitangent": rng.normal(size=(n_vertices, 3)).astype(np.float32),
+        "tex_coord": rng.uniform(0, 1, (n_vertices, 3)).astype(np.float32),
+        "color": rng.uniform(0, 1, (n_vertices, 4)).astype(np.float32),
+        "back_color": rng.uniform(0, 1, (n_vertices, 4)).astype(np.float32),
+    }
+    indices = rng.integers(0, n_vertices, (n_triangles, 3)).astype(np.uint32)
+    return [(arrays, indices)]
+
+
+def model_meshes(file_name:str):
+    from glass_engine import Model
+    from glass_engine.Mesh import Mesh
+
+    model = Model(file_name)
+    meshes = []
+    nodes = [model]
+    visited = set()
+    while nodes:
+        node = nodes.pop()
+        if id(node) in visited:
+            continue
+
+        visited.add(id(node))
+        if isinstance(node, Mesh):
+            vertices = node.vertices
+            arrays = {key: attr_list.ndarray for key, attr_list in vertices._attr_list_map.items()}
+            meshes.append((arrays, node.indices.ndarray.astype(np.uint32)))
+
+        nodes.extend(node.children)
+
+    return meshes
+
+
+def build(meshes, interleaved:bool):
+    result = []
+    for arrays, indices in meshes:
+        vertices = Vertices.from_arrays(interleaved=interleaved, **arrays)
+        result.append((vertices, Indices(indices.reshape(-1, 3))))
+
+    return result
+
+
+def covered_pixels(size:int)->int:
+    pixels = GL.glReadPixels(0, 0, size, size, GL.GL_RGBA, GL.GL_UNSIGNED_BYTE)
+    pixels = np.frombuffer(pixels, dtype=np.uint8).reshape(size, size, 4)
+    return int(np.count_nonzero(pixels.any(axis=2)))
+
+
+def time_gpu(func, repeat:int)->float:
+    func()
+    GL.glFinish()
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        GL.glFinish()
+        samples.append(time.perf_counter() - start)
+
+    return min(samples)
+
+
+def run_layout(program, meshes, interleaved:bool, args)->dict:
+    built = build(meshes, interleaved)
+    n_vertices = sum(len(vertices) for vertices, _ in built)
+
+    def draw():
+        for vertices, indices in built:
+            program.draw_triangles(vertices, indices)
+
+    GL.glClearColor(0, 0, 0, 0)
+    GL.glClear(GL.GL_COLOR_BUFFER_BIT)
+    start = time.perf_counter()
+    draw()
+    GL.glFinish()
+    first_upload = time.perf_counter() - start
+    assert covered_pixels(args.size) > 0, "nothing was rendered, vertex attributes are not bound"
+
+    def draw_frames():
+        for _ in range(args.frames):
+            draw()
+
+    fetch = time_gpu(draw_frames, args.repeat) / args.frames
+
+    rng = np.random.default_rng(1)
+    def update():
+        for vertices, _ in built:
+            len_vertices = len(vertices)
+            n_changed = max(1, int(len_vertices * args.update_ratio))
+            start_index = int(rng.integers(0, len_vertices - n_changed + 1))
+            vertices.set_attribute(
+                "position", rng.uniform(-1, 1, (n_changed, 3)).astype(np.float32), start_index
+            )
+            vertices.set_attribute(
+                "color", rng.uniform(0, 1, (n_changed, 4)).astype(np.float32), start_index
+            )
+        draw()
+
+    update_draw = time_gpu(update, args.repeat)
+
+    n_buffers = 0
+    for vertices, _ in built:
+        n_buffers += 1 if interleaved else len(vertices._attr_list_map)
+
+    return {
+        "vertices": n_vertices,
+        "buffers": n_buffers,
+        "first_upload_ms": first_upload * 1e3,
+        "draw_ms": fetch * 1e3,
+        "vertices_per_second": n_vertices / fetch,
+        "update_draw_ms": update_draw * 1e3
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="separate vs interleaved vertex buffer layout")
+    parser.add_argument("model", nargs="?", help="model file loaded through glass_engine.Model")
+    parser.add_argument("--vertices", "-n", type=int, default=1000000, help="synthetic vertex count when no model is given")
+    parser.add_argument("--frames", type=int, default=20)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--update-ratio", type=float, default=0.01, help="fraction of vertices changed per partial upload")
+    parser.add_argument("--size", type=int, default=512, help="framebuffer size")
+    parser.add_argument("--output", "-o", help="write results to this JSON file")
+    args = parser.parse_args()
+
+    create_context(args.size, args.size)
+
+    shader_folder = tempfile.mkdtemp()
+    with open(shader_folder + "/vertex_layout.vs", "w") as out_file:
+        out_file.write(vertex_shader)
+    with open(shader_folder + "/vertex_layout.fs", "w") as out_file:
+        out_file.write(fragment_shader)
+
+    program = ShaderProgram()
+    program.compile(shader_folder + "/vertex_layout.vs")
+    program.compile(shader_folder + "/vertex_layout.fs")
+
+    meshes = model_meshes(args.model) if args.model else synthetic_meshes(args.vertices)
+
+    results = {}
+    for name, interleaved in [("separate", False), ("interleaved", True)]:
+        results[name] = run_layout(program, meshes, interleaved, args)
+
+    print(f"{'layout':<14}{'buffers':>9}{'first upload ms':>17}{'draw ms':>10}{'Mverts/s':>10}{'update+draw ms':>16}")
+    for name, result in results.items():
+        print(
+            f"{name:<14}{result['buffers']:>9}{result['first_upload_ms']:>17.2f}{result['draw_ms']:>10.3f}"
+            f"{result['vertices_per_second'] / 1e6:>10.1f}{result['update_draw_ms']:>16.3f}"
+        )
+
+    if args.output:
+        report = {
+            "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "python": platform.python_version(),
+            "numpy": np.__version__,
+            "platform": platform.platform(),
+            "renderer": GL.glGetString(GL.GL_RENDERER).decode(),
+            "model": args.model,
+            "results": results
+        }
+        with open(args.output, "w") as out_file:
+            json.dump(report, out_file, indent=4)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,101 +1,71 @@
+import sys
+import importlib
+from types import ModuleType
+from typing import Dict, List, Any
+
 from .genType import MathForm, genType
 from .genVec import genVec
-from .genVec2 import genVec2
-from .genVec3 import genVec3
-from .genVec4 import genVec4
 from .genMat import genMat
-from .genMat2x2 import genMat2x2, genMat2
-from .genMat2x3 import genMat2x3
-from .genMat2x4 import genMat2x4
-from .genMat3x2 import genMat3x2
-from .genMat3x3 import genMat3x3, genMat3
-from .genMat3x4 import genMat3x4
-from .genMat4x2 import genMat4x2
-from .genMat4x3 import genMat4x3
-from .genMat4x4 import genMat4x4, genMat4
 from .genQuat import genQuat
-
-from .bvec2 import bvec2
-from .bvec3 import bvec3
-from .bvec4 import bvec4
-
-from .ivec2 import ivec2
-from .ivec3 import ivec3
-from .ivec4 import ivec4
-
-from .uvec2 import uvec2
-from .uvec3 import uvec3
-from .uvec4 import uvec4
-
-from .vec2 import vec2
-from .vec3 import vec3
-from .vec4 import vec4
-
-from .dvec2 import dvec2
-from .dvec3 import dvec3
-from .dvec4 import dvec4
-
-from .bmat2x2 import bmat2x2, bmat2
-from .bmat2x3 import bmat2x3
-from .bmat2x4 import bmat2x4
-from .bmat3x2 import bmat3x2
-from .bmat3x3 import bmat3x3, bmat3
-from .bmat3x4 import bmat3x4
-from .bmat4x2 import bmat4x2
-from .bmat4x3 import bmat4x3
-from .bmat4x4 import bmat4x4, bmat4
-
-from .imat2x2 import imat2x2, imat2
-from .imat2x3 import imat2x3
-from .imat2x4 import imat2x4
-from .imat3x2 import imat3x2
-from .imat3x3 import imat3x3, imat3
-from .imat3x4 import imat3x4
-from .imat4x2 import imat4x2
-from .imat4x3 import imat4x3
-from .imat4x4 import imat4x4, imat4
-
-from .umat2x2 import umat2x2, umat2
-from .umat2x3 import umat2x3
-from .umat2x4 import umat2x4
-from .umat3x2 import umat3x2
-from .umat3x3 import umat3x3, umat3
-from .umat3x4 import umat3x4
-from .umat4x2 import umat4x2
-from .umat4x3 import umat4x3
-from .umat4x4 import umat4x4, umat4
-
-from .mat2x2 import mat2x2, mat2
-from .mat2x3 import mat2x3
-from .mat2x4 import mat2x4
-from .mat3x2 import mat3x2
-from .mat3x3 import mat3x3, mat3
-from .mat3x4 import mat3x4
-from .mat4x2 import mat4x2
-from .mat4x3 import mat4x3
-from .mat4x4 import mat4x4, mat4
-
-from .dmat2x2 import dmat2x2, dmat2
-from .dmat2x3 import dmat2x3
-from .dmat2x4 import dmat2x4
-from .dmat3x2 import dmat3x2
-from .dmat3x3 import dmat3x3, dmat3
-from .dmat3x4 import dmat3x4
-from .dmat4x2 import dmat4x2
-from .dmat4x3 import dmat4x3
-from .dmat4x4 import dmat4x4, dmat4
-
-from .quat import quat
-from .dquat import dquat
+from .defer_notifications import defer_notifications
 
 from .funcs import (
     abs, sign, floor, ceil, trunc, round, roundEven, fract, mod,
+    add, sub, mul, div,
     min, max, clamp, mix, step, smoothstep, sqrt, inversesqrt,
     pow, exp, exp2, exp10, log, log2, log10,
     sin, cos, tan, asin, acos, atan,
     sinh, cosh, tanh, asinh, acosh, atanh,
     length, normalize, distance, dot, cross, faceforward, reflect, refract,
-    transpose, determinant, inverse, trace, conjugate,
+    transpose, determinant, inverse, affineInverse, rigidInverse, trace, conjugate,
+    mat3_cast, mat4_cast, quat_cast, quatToYawPitchRoll, quatYawPitchRoll, slerp, nlerp,
     matrixCompMult, outerProduct, lessThan, lessThanEqual,
     greaterThan, greaterThanEqual, equal, notEqual, any, all, not_, sizeof, value_ptr
 )
+
+
+_lazy_attrs:Dict[str, str] = {
+    "genVec2": "genVec2", "genVec3": "genVec3", "genVec4": "genVec4",
+    "genMat2": "genMat2x2", "genMat3": "genMat3x3", "genMat4": "genMat4x4",
+    "genArray": "genArray", "genVecArray": "genVecArray",
+    "genMatArray": "genMatArray", "genQuatArray": "genQuatArray",
+    "quat": "quat", "dquat": "dquat",
+    "quatarray": "quatarray", "dquatarray": "dquatarray",
+}
+
+for _prefix in ["b", "i", "u", "", "d"]:
+    for _n in range(2, 5):
+        _lazy_attrs[f"{_prefix}vec{_n}"] = f"{_prefix}vec{_n}"
+        _lazy_attrs[f"{_prefix}vec{_n}array"] = f"{_prefix}vec{_n}array"
+        _lazy_attrs[f"{_prefix}mat{_n}"] = f"{_prefix}mat{_n}x{_n}"
+        _lazy_attrs[f"{_prefix}mat{_n}array"] = f"{_prefix}mat{_n}x{_n}array"
+        for _m in range(2, 5):
+            _lazy_attrs[f"genMat{_n}x{_m}"] = f"genMat{_n}x{_m}"
+            _lazy_attrs[f"{_prefix}mat{_n}x{_m}"] = f"{_prefix}mat{_n}x{_m}"
+            _lazy_attrs[f"{_prefix}mat{_n}x{_m}array"] = f"{_prefix}mat{_n}x{_m}array"
+
+
+class _LazyModule(ModuleType):
+
+    def __setattr__(self, name:str, value:Any)->None:
+        if name in _lazy_attrs and isinstance(value, ModuleType):
+            value = getattr(value, name)
+
+        ModuleType.__setattr__(self, name, value)
+
+
+def __getattr__(name:str)->Any:
+    if name not in _lazy_attrs:
+        raise AttributeError(f"module '{__name__}' has no attribute '{name}'")
+
+    module:ModuleType = importlib.import_module(f".{_lazy_attrs[name]}", __name__)
+    value:Any = getattr(module, name)
+    globals()[name] = value
+    return value
+
+
+def __dir__()->List[str]:
+    return sorted(set(globals().keys()) | set(_lazy_attrs.keys()))
+
+
+sys.modules[__name__].__class__ = _LazyModule
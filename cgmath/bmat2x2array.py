@@ -0,0 +1,9 @@
+from .genMatArray import genMatArray
+from .bmat2x2 import bmat2x2
+
+
+class bmat2x2array(genMatArray):
+
+    element_type = bmat2x2
+
+bmat2array = bmat2x2array
\ No newline at end of file
@@ -0,0 +1,7 @@
+from .genMatArray import genMatArray
+from .bmat2x3 import bmat2x3
+
+
+class bmat2x3array(genMatArray):
+
+    element_type = bmat2x3
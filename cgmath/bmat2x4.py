@@ -5,6 +5,8 @@ import ctypes
 
 class bmat2x4(genMat2x4):
 
+    __slots__ = ()
+
     @property
     def dtype(self)->type:
         return ctypes.c_bool
\ No newline at end of file
@@ -0,0 +1,7 @@
+from .genMatArray import genMatArray
+from .bmat2x4 import bmat2x4
+
+
+class bmat2x4array(genMatArray):
+
+    element_type = bmat2x4
@@ -0,0 +1,7 @@
+from .genMatArray import genMatArray
+from .bmat3x2 import bmat3x2
+
+
+class bmat3x2array(genMatArray):
+
+    element_type = bmat3x2
@@ -0,0 +1,9 @@
+from .genMatArray import genMatArray
+from .bmat3x3 import bmat3x3
+
+
+class bmat3x3array(genMatArray):
+
+    element_type = bmat3x3
+
+bmat3array = bmat3x3array
\ No newline at end of file
@@ -0,0 +1,7 @@
+from .genMatArray import genMatArray
+from .bmat3x4 import bmat3x4
+
+
+class bmat3x4array(genMatArray):
+
+    element_type = bmat3x4
@@ -0,0 +1,7 @@
+from .genMatArray import genMatArray
+from .bmat4x2 import bmat4x2
+
+
+class bmat4x2array(genMatArray):
+
+    element_type = bmat4x2
@@ -5,6 +5,8 @@ import ctypes
 
 class bmat4x3(genMat4x3):
 
+    __slots__ = ()
+
     @property
     def dtype(self)->type:
         return ctypes.c_bool
\ No newline at end of file
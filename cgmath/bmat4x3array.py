@@ -0,0 +1,7 @@
+from .genMatArray import genMatArray
+from .bmat4x3 import bmat4x3
+
+
+class bmat4x3array(genMatArray):
+
+    element_type = bmat4x3
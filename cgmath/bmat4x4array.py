@@ -0,0 +1,9 @@
+from .genMatArray import genMatArray
+from .bmat4x4 import bmat4x4
+
+
+class bmat4x4array(genMatArray):
+
+    element_type = bmat4x4
+
+bmat4array = bmat4x4array
\ No newline at end of file
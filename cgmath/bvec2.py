@@ -4,6 +4,8 @@ import ctypes
 
 
 class bvec2(genVec2):
+
+    __slots__ = ()
     
     @property
     def dtype(self)->type:
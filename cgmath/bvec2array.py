@@ -0,0 +1,7 @@
+from .genVecArray import genVecArray
+from .bvec2 import bvec2
+
+
+class bvec2array(genVecArray):
+
+    element_type = bvec2
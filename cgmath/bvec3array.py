@@ -0,0 +1,7 @@
+from .genVecArray import genVecArray
+from .bvec3 import bvec3
+
+
+class bvec3array(genVecArray):
+
+    element_type = bvec3
@@ -0,0 +1,7 @@
+from .genVecArray import genVecArray
+from .bvec4 import bvec4
+
+
+class bvec4array(genVecArray):
+
+    element_type = bvec4
@@ -0,0 +1,52 @@
+import threading
+from typing import Dict, Callable, Any
+
+class defer_notifications:
+    _local = threading.local()
+
+    @staticmethod
+    def _state()->threading.local:
+        state = defer_notifications._local
+        if not hasattr(state, "depth"):
+            state.depth = 0
+            state.pending = {}
+
+        return state
+
+    @staticmethod
+    def _deferring()->bool:
+        return defer_notifications._state().depth > 0
+
+    @staticmethod
+    def _defer(callback:Callable[[], None])->None:
+        pending:Dict[Any, Callable[[], None]] = defer_notifications._state().pending
+        try:
+            pending[callback] = callback
+        except TypeError:
+            pending[id(callback)] = callback
+
+    @staticmethod
+    def _notify(callback:Callable[[], None])->None:
+        if defer_notifications._deferring():
+            defer_notifications._defer(callback)
+        else:
+            callback()
+
+    @staticmethod
+    def _flush()->None:
+        state = defer_notifications._state()
+        while state.pending:
+            pending = state.pending
+            state.pending = {}
+            for callback in pending.values():
+                callback()
+
+    def __enter__(self):
+        defer_notifications._state().depth += 1
+        return self
+
+    def __exit__(self, *exc_details):
+        state = defer_notifications._state()
+        state.depth -= 1
+        if state.depth == 0:
+            defer_notifications._flush()
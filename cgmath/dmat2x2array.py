@@ -0,0 +1,9 @@
+from .genMatArray import genMatArray
+from .dmat2x2 import dmat2x2
+
+
+class dmat2x2array(genMatArray):
+
+    element_type = dmat2x2
+
+dmat2array = dmat2x2array
\ No newline at end of file
@@ -5,6 +5,8 @@ import ctypes
 
 class dmat2x3(genMat2x3):
 
+    __slots__ = ()
+
     @property
     def dtype(self)->type:
         return ctypes.c_double
\ No newline at end of file
@@ -0,0 +1,7 @@
+from .genMatArray import genMatArray
+from .dmat2x3 import dmat2x3
+
+
+class dmat2x3array(genMatArray):
+
+    element_type = dmat2x3
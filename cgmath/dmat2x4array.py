@@ -0,0 +1,7 @@
+from .genMatArray import genMatArray
+from .dmat2x4 import dmat2x4
+
+
+class dmat2x4array(genMatArray):
+
+    element_type = dmat2x4
@@ -0,0 +1,7 @@
+from .genMatArray import genMatArray
+from .dmat3x2 import dmat3x2
+
+
+class dmat3x2array(genMatArray):
+
+    element_type = dmat3x2
@@ -0,0 +1,9 @@
+from .genMatArray import genMatArray
+from .dmat3x3 import dmat3x3
+
+
+class dmat3x3array(genMatArray):
+
+    element_type = dmat3x3
+
+dmat3array = dmat3x3array
\ No newline at end of file
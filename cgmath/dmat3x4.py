@@ -5,6 +5,8 @@ import ctypes
 
 class dmat3x4(genMat3x4):
 
+    __slots__ = ()
+
     @property
     def dtype(self)->type:
         return ctypes.c_double
\ No newline at end of file
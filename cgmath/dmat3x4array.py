@@ -0,0 +1,7 @@
+from .genMatArray import genMatArray
+from .dmat3x4 import dmat3x4
+
+
+class dmat3x4array(genMatArray):
+
+    element_type = dmat3x4
@@ -0,0 +1,7 @@
+from .genMatArray import genMatArray
+from .dmat4x2 import dmat4x2
+
+
+class dmat4x2array(genMatArray):
+
+    element_type = dmat4x2
@@ -0,0 +1,7 @@
+from .genMatArray import genMatArray
+from .dmat4x3 import dmat4x3
+
+
+class dmat4x3array(genMatArray):
+
+    element_type = dmat4x3
@@ -5,6 +5,8 @@ import ctypes
 
 class dmat4x4(genMat4x4):
 
+    __slots__ = ()
+
     @property
     def dtype(self)->type:
         return ctypes.c_double
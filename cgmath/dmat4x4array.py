@@ -0,0 +1,9 @@
+from .genMatArray import genMatArray
+from .dmat4x4 import dmat4x4
+
+
+class dmat4x4array(genMatArray):
+
+    element_type = dmat4x4
+
+dmat4array = dmat4x4array
\ No newline at end of file
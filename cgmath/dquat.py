@@ -5,6 +5,8 @@ from .genQuat import genQuat
 
 class dquat(genQuat):
 
+    __slots__ = ()
+
     @property
     def dtype(self)->type:
         return ctypes.c_double
\ No newline at end of file
@@ -0,0 +1,7 @@
+from .genQuatArray import genQuatArray
+from .dquat import dquat
+
+
+class dquatarray(genQuatArray):
+
+    element_type = dquat
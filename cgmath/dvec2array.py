@@ -0,0 +1,7 @@
+from .genVecArray import genVecArray
+from .dvec2 import dvec2
+
+
+class dvec2array(genVecArray):
+
+    element_type = dvec2
@@ -0,0 +1,7 @@
+from .genVecArray import genVecArray
+from .dvec3 import dvec3
+
+
+class dvec3array(genVecArray):
+
+    element_type = dvec3
@@ -4,6 +4,8 @@ import ctypes
 
 
 class dvec4(genVec4):
+
+    __slots__ = ()
     
     @property
     def dtype(self)->type:
@@ -0,0 +1,7 @@
+from .genVecArray import genVecArray
+from .dvec4 import dvec4
+
+
+class dvec4array(genVecArray):
+
+    element_type = dvec4
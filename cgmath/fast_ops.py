@@ -0,0 +1,354 @@
+from typing import Dict, Tuple, Optional, Callable, Any
+import ctypes
+import math
+
+from .genType import genType, MathForm
+
+
+enabled:bool = True
+
+def mat2_mul_mat2(a, b, result):
+    a0, a1, a2, a3 = a
+    b0, b1, b2, b3 = b
+    result[:] = (
+        a0 * b0 + a2 * b1,
+        a1 * b0 + a3 * b1,
+        a0 * b2 + a2 * b3,
+        a1 * b2 + a3 * b3,
+    )
+
+def mat3_mul_mat3(a, b, result):
+    a0, a1, a2, a3, a4, a5, a6, a7, a8 = a
+    b0, b1, b2, b3, b4, b5, b6, b7, b8 = b
+    result[:] = (
+        a0 * b0 + a3 * b1 + a6 * b2,
+        a1 * b0 + a4 * b1 + a7 * b2,
+        a2 * b0 + a5 * b1 + a8 * b2,
+        a0 * b3 + a3 * b4 + a6 * b5,
+        a1 * b3 + a4 * b4 + a7 * b5,
+        a2 * b3 + a5 * b4 + a8 * b5,
+        a0 * b6 + a3 * b7 + a6 * b8,
+        a1 * b6 + a4 * b7 + a7 * b8,
+        a2 * b6 + a5 * b7 + a8 * b8,
+    )
+
+def mat4_mul_mat4(a, b, result):
+    a0, a1, a2, a3, a4, a5, a6, a7, a8, a9, a10, a11, a12, a13, a14, a15 = a
+    b0, b1, b2, b3, b4, b5, b6, b7, b8, b9, b10, b11, b12, b13, b14, b15 = b
+    result[:] = (
+        a0 * b0 + a4 * b1 + a8 * b2 + a12 * b3,
+        a1 * b0 + a5 * b1 + a9 * b2 + a13 * b3,
+        a2 * b0 + a6 * b1 + a10 * b2 + a14 * b3,
+        a3 * b0 + a7 * b1 + a11 * b2 + a15 * b3,
+        a0 * b4 + a4 * b5 + a8 * b6 + a12 * b7,
+        a1 * b4 + a5 * b5 + a9 * b6 + a13 * b7,
+        a2 * b4 + a6 * b5 + a10 * b6 + a14 * b7,
+        a3 * b4 + a7 * b5 + a11 * b6 + a15 * b7,
+        a0 * b8 + a4 * b9 + a8 * b10 + a12 * b11,
+        a1 * b8 + a5 * b9 + a9 * b10 + a13 * b11,
+        a2 * b8 + a6 * b9 + a10 * b10 + a14 * b11,
+        a3 * b8 + a7 * b9 + a11 * b10 + a15 * b11,
+        a0 * b12 + a4 * b13 + a8 * b14 + a12 * b15,
+        a1 * b12 + a5 * b13 + a9 * b14 + a13 * b15,
+        a2 * b12 + a6 * b13 + a10 * b14 + a14 * b15,
+        a3 * b12 + a7 * b13 + a11 * b14 + a15 * b15,
+    )
+
+def mat2_mul_vec2(a, v, result):
+    a0, a1, a2, a3 = a
+    v0, v1 = v
+    result[:] = (
+        a0 * v0 + a2 * v1,
+        a1 * v0 + a3 * v1,
+    )
+
+def mat3_mul_vec3(a, v, result):
+    a0, a1, a2, a3, a4, a5, a6, a7, a8 = a
+    v0, v1, v2 = v
+    result[:] = (
+        a0 * v0 + a3 * v1 + a6 * v2,
+        a1 * v0 + a4 * v1 + a7 * v2,
+        a2 * v0 + a5 * v1 + a8 * v2,
+    )
+
+def mat4_mul_vec4(a, v, result):
+    a0, a1, a2, a3, a4, a5, a6, a7, a8, a9, a10, a11, a12, a13, a14, a15 = a
+    v0, v1, v2, v3 = v
+    result[:] = (
+        a0 * v0 + a4 * v1 + a8 * v2 + a12 * v3,
+        a1 * v0 + a5 * v1 + a9 * v2 + a13 * v3,
+        a2 * v0 + a6 * v1 + a10 * v2 + a14 * v3,
+        a3 * v0 + a7 * v1 + a11 * v2 + a15 * v3,
+    )
+
+def quat_mul_quat(a, b, result):
+    w1, x1, y1, z1 = a
+    w2, x2, y2, z2 = b
+    result[:] = (
+        w1 * w2 - x1 * x2 - y1 * y2 - z1 * z2,
+        w1 * x2 + x1 * w2 + y1 * z2 - z1 * y2,
+        w1 * y2 + y1 * w2 + z1 * x2 - x1 * z2,
+        w1 * z2 + z1 * w2 + x1 * y2 - y1 * x2,
+    )
+
+def quat_mul_vec3(q, v, result):
+    w, x, y, z = q
+    vx, vy, vz = v
+    norm = math.sqrt(w * w + x * x + y * y + z * z)
+    s = (w * w - x * x - y * y - z * z) / norm
+    uv = 2 * (x * vx + y * vy + z * vz) / norm
+    w2 = 2 * w / norm
+    result[:] = (
+        s * vx + uv * x + w2 * (y * vz - z * vy),
+        s * vy + uv * y + w2 * (z * vx - x * vz),
+        s * vz + uv * z + w2 * (x * vy - y * vx),
+    )
+
+
+def mat4_determinant(m):
+    m0, m1, m2, m3, m4, m5, m6, m7, m8, m9, m10, m11, m12, m13, m14, m15 = m
+    s0 = m0 * m5 - m4 * m1
+    s1 = m0 * m6 - m4 * m2
+    s2 = m0 * m7 - m4 * m3
+    s3 = m1 * m6 - m5 * m2
+    s4 = m1 * m7 - m5 * m3
+    s5 = m2 * m7 - m6 * m3
+    c5 = m10 * m15 - m14 * m11
+    c4 = m9 * m15 - m13 * m11
+    c3 = m9 * m14 - m13 * m10
+    c2 = m8 * m15 - m12 * m11
+    c1 = m8 * m14 - m12 * m10
+    c0 = m8 * m13 - m12 * m9
+    return s0 * c5 - s1 * c4 + s2 * c3 + s3 * c2 - s4 * c1 + s5 * c0
+
+def mat4_inverse(m, result):
+    m0, m1, m2, m3, m4, m5, m6, m7, m8, m9, m10, m11, m12, m13, m14, m15 = m
+    s0 = m0 * m5 - m4 * m1
+    s1 = m0 * m6 - m4 * m2
+    s2 = m0 * m7 - m4 * m3
+    s3 = m1 * m6 - m5 * m2
+    s4 = m1 * m7 - m5 * m3
+    s5 = m2 * m7 - m6 * m3
+    c5 = m10 * m15 - m14 * m11
+    c4 = m9 * m15 - m13 * m11
+    c3 = m9 * m14 - m13 * m10
+    c2 = m8 * m15 - m12 * m11
+    c1 = m8 * m14 - m12 * m10
+    c0 = m8 * m13 - m12 * m9
+    det = s0 * c5 - s1 * c4 + s2 * c3 + s3 * c2 - s4 * c1 + s5 * c0
+    if det == 0:
+        return det
+
+    inv_det = 1 / det
+    result[:] = (
+        (m5 * c5 - m6 * c4 + m7 * c3) * inv_det,
+        (-m1 * c5 + m2 * c4 - m3 * c3) * inv_det,
+        (m13 * s5 - m14 * s4 + m15 * s3) * inv_det,
+        (-m9 * s5 + m10 * s4 - m11 * s3) * inv_det,
+        (-m4 * c5 + m6 * c2 - m7 * c1) * inv_det,
+        (m0 * c5 - m2 * c2 + m3 * c1) * inv_det,
+        (-m12 * s5 + m14 * s2 - m15 * s1) * inv_det,
+        (m8 * s5 - m10 * s2 + m11 * s1) * inv_det,
+        (m4 * c4 - m5 * c2 + m7 * c0) * inv_det,
+        (-m0 * c4 + m1 * c2 - m3 * c0) * inv_det,
+        (m12 * s4 - m13 * s2 + m15 * s0) * inv_det,
+        (-m8 * s4 + m9 * s2 - m11 * s0) * inv_det,
+        (-m4 * c3 + m5 * c1 - m6 * c0) * inv_det,
+        (m0 * c3 - m1 * c1 + m2 * c0) * inv_det,
+        (-m12 * s3 + m13 * s1 - m14 * s0) * inv_det,
+        (m8 * s3 - m9 * s1 + m10 * s0) * inv_det,
+    )
+    return det
+
+def mat4_affine_inverse(m, result):
+    m0, m1, m2, _, m4, m5, m6, _, m8, m9, m10, _, m12, m13, m14, _ = m
+    c0 = m5 * m10 - m9 * m6
+    c1 = m9 * m2 - m1 * m10
+    c2 = m1 * m6 - m5 * m2
+    det = m0 * c0 + m4 * c1 + m8 * c2
+    if det == 0:
+        return det
+
+    inv_det = 1 / det
+    i0 = c0 * inv_det
+    i1 = c1 * inv_det
+    i2 = c2 * inv_det
+    i4 = (m8 * m6 - m4 * m10) * inv_det
+    i5 = (m0 * m10 - m8 * m2) * inv_det
+    i6 = (m4 * m2 - m0 * m6) * inv_det
+    i8 = (m4 * m9 - m8 * m5) * inv_det
+    i9 = (m8 * m1 - m0 * m9) * inv_det
+    i10 = (m0 * m5 - m4 * m1) * inv_det
+    result[:] = (
+        i0, i1, i2, 0,
+        i4, i5, i6, 0,
+        i8, i9, i10, 0,
+        -(i0 * m12 + i4 * m13 + i8 * m14),
+        -(i1 * m12 + i5 * m13 + i9 * m14),
+        -(i2 * m12 + i6 * m13 + i10 * m14),
+        1,
+    )
+    return det
+
+def mat4_rigid_inverse(m, result):
+    m0, m1, m2, _, m4, m5, m6, _, m8, m9, m10, _, m12, m13, m14, _ = m
+    result[:] = (
+        m0, m4, m8, 0,
+        m1, m5, m9, 0,
+        m2, m6, m10, 0,
+        -(m0 * m12 + m1 * m13 + m2 * m14),
+        -(m4 * m12 + m5 * m13 + m6 * m14),
+        -(m8 * m12 + m9 * m13 + m10 * m14),
+        1,
+    )
+
+def mat4_is_affine(m)->bool:
+    return m[3] == 0 and m[7] == 0 and m[11] == 0 and m[15] == 1
+
+def quat_to_mat3(q, result):
+    w, x, y, z = q
+    result[:] = (
+        1 - 2 * (y * y + z * z), 2 * (x * y + w * z), 2 * (x * z - w * y),
+        2 * (x * y - w * z), 1 - 2 * (x * x + z * z), 2 * (y * z + w * x),
+        2 * (x * z + w * y), 2 * (y * z - w * x), 1 - 2 * (x * x + y * y),
+    )
+
+def quat_to_mat4(q, result):
+    w, x, y, z = q
+    result[:] = (
+        1 - 2 * (y * y + z * z), 2 * (x * y + w * z), 2 * (x * z - w * y), 0,
+        2 * (x * y - w * z), 1 - 2 * (x * x + z * z), 2 * (y * z + w * x), 0,
+        2 * (x * z + w * y), 2 * (y * z - w * x), 1 - 2 * (x * x + y * y), 0,
+        0, 0, 0, 1,
+    )
+
+def mat_to_quat(m, rows, result):
+    m00, m01, m02 = m[0], m[rows], m[2 * rows]
+    m10, m11, m12 = m[1], m[rows + 1], m[2 * rows + 1]
+    m20, m21, m22 = m[2], m[rows + 2], m[2 * rows + 2]
+    trace = m00 + m11 + m22
+    if trace > 0:
+        s = 0.5 / math.sqrt(trace + 1)
+        result[:] = (0.25 / s, (m21 - m12) * s, (m02 - m20) * s, (m10 - m01) * s)
+    elif m00 > m11 and m00 > m22:
+        s = 0.5 / math.sqrt(1 + m00 - m11 - m22)
+        result[:] = ((m21 - m12) * s, 0.25 / s, (m01 + m10) * s, (m02 + m20) * s)
+    elif m11 > m22:
+        s = 0.5 / math.sqrt(1 + m11 - m00 - m22)
+        result[:] = ((m02 - m20) * s, (m01 + m10) * s, 0.25 / s, (m12 + m21) * s)
+    else:
+        s = 0.5 / math.sqrt(1 + m22 - m00 - m11)
+        result[:] = ((m10 - m01) * s, (m02 + m20) * s, (m12 + m21) * s, 0.25 / s)
+
+def quat_to_yaw_pitch_roll(q, result):
+    w, x, y, z = q
+    result[:] = (
+        math.atan2(2 * (w * z - x * y), 1 - 2 * (x * x + z * z)),
+        math.asin(min(max(2 * (w * x + y * z), -1), 1)),
+        math.atan2(2 * (w * y - x * z), 1 - 2 * (x * x + y * y)),
+    )
+
+def yaw_pitch_roll_to_quat(angles, result):
+    yaw, pitch, roll = angles
+    cy, sy = math.cos(yaw / 2), math.sin(yaw / 2)
+    cp, sp = math.cos(pitch / 2), math.sin(pitch / 2)
+    cr, sr = math.cos(roll / 2), math.sin(roll / 2)
+    result[:] = (
+        cy * cp * cr - sy * sp * sr,
+        cy * sp * cr - sy * cp * sr,
+        cy * cp * sr + sy * sp * cr,
+        sy * cp * cr + cy * sp * sr,
+    )
+
+def quat_slerp(a, b, t, result):
+    w1, x1, y1, z1 = a
+    w2, x2, y2, z2 = b
+    cos_theta = w1 * w2 + x1 * x2 + y1 * y2 + z1 * z2
+    if cos_theta < 0:
+        w2, x2, y2, z2 = -w2, -x2, -y2, -z2
+        cos_theta = -cos_theta
+
+    if cos_theta > 1 - 1E-6:
+        k1 = 1 - t
+        k2 = t
+    else:
+        theta = math.acos(cos_theta)
+        inv_sin_theta = 1 / math.sin(theta)
+        k1 = math.sin((1 - t) * theta) * inv_sin_theta
+        k2 = math.sin(t * theta) * inv_sin_theta
+
+    result[:] = (k1 * w1 + k2 * w2, k1 * x1 + k2 * x2, k1 * y1 + k2 * y2, k1 * z1 + k2 * z2)
+
+def quat_nlerp(a, b, t, result):
+    w1, x1, y1, z1 = a
+    w2, x2, y2, z2 = b
+    if w1 * w2 + x1 * x2 + y1 * y2 + z1 * z2 < 0:
+        w2, x2, y2, z2 = -w2, -x2, -y2, -z2
+
+    w = w1 + t * (w2 - w1)
+    x = x1 + t * (x2 - x1)
+    y = y1 + t * (y2 - y1)
+    z = z1 + t * (z2 - z1)
+    inv_len = 1 / math.sqrt(w * w + x * x + y * y + z * z)
+    result[:] = (w * inv_len, x * inv_len, y * inv_len, z * inv_len)
+
+_mat_mul_mat_funcs:Dict[int, Callable] = {
+    2: mat2_mul_mat2,
+    3: mat3_mul_mat3,
+    4: mat4_mul_mat4
+}
+
+_mat_mul_vec_funcs:Dict[int, Callable] = {
+    2: mat2_mul_vec2,
+    3: mat3_mul_vec3,
+    4: mat4_mul_vec4
+}
+
+_fast_mul_map:Dict[Tuple[type, type], Optional[Tuple[Callable, type]]] = {}
+
+def _resolve_mul(left:genType, right:genType)->Optional[Tuple[Callable, type]]:
+    if not isinstance(right, genType) or left.dtype not in (ctypes.c_float, ctypes.c_double) or left.dtype != right.dtype:
+        return None
+
+    if left.math_form == MathForm.Mat:
+        n:int = left.shape[0]
+        if left.shape != (n, n) or n not in _mat_mul_mat_funcs:
+            return None
+
+        if right.__class__ is left.__class__:
+            return (_mat_mul_mat_funcs[n], left.__class__)
+
+        if right.math_form == MathForm.Vec and right.shape == (n,):
+            return (_mat_mul_vec_funcs[n], right.__class__)
+
+    elif left.math_form == MathForm.Quat:
+        if right.__class__ is left.__class__:
+            return (quat_mul_quat, left.__class__)
+
+        if right.math_form == MathForm.Vec and right.shape == (3,):
+            return (quat_mul_vec3, right.__class__)
+
+    return None
+
+def fast_mul(left:genType, right:Any, out:Optional[genType]=None)->Optional[genType]:
+    if not enabled:
+        return None
+
+    key:Tuple[type, type] = (left.__class__, right.__class__)
+    if key not in _fast_mul_map:
+        _fast_mul_map[key] = _resolve_mul(left, right)
+
+    entry:Optional[Tuple[Callable, type]] = _fast_mul_map[key]
+    if entry is None:
+        return None
+
+    func, result_type = entry
+    if out is None:
+        result:genType = result_type()
+    elif out.__class__ is result_type:
+        result:genType = out
+    else:
+        return None
+
+    func(left._data, right._data, result._data)
+    return result
@@ -1,92 +1,186 @@
-from .genType import genType
+from .genType import genType, MathForm
 from .genVec import genVec
 from .genMat import genMat
 from .genQuat import genQuat
 from .genVec3 import genVec3
+from .fast_ops import (
+    fast_mul, mat4_determinant, mat4_inverse, mat4_affine_inverse, mat4_rigid_inverse, mat4_is_affine,
+    quat_to_mat3, quat_to_mat4, mat_to_quat, quat_to_yaw_pitch_roll, yaw_pitch_roll_to_quat,
+    quat_slerp, quat_nlerp
+)
 from .helper import is_number
-from typing import Callable, Any, Union
+from typing import Callable, Any, Union, Optional
+import builtins
+import sys
+import operator
 import math
 import ctypes
 
 
-def _single_op(x:genType, op:Callable[[Any,Any], Any], op_name:str)->genType:
+def _is_array(value:Any)->bool:
+    genArray_module = sys.modules.get(f"{__package__}.genArray")
+    return genArray_module is not None and isinstance(value, genArray_module.genArray)
+
+def _check_out(out:genType, result_type:type, op_name:str)->None:
+    if out.__class__ is not result_type:
+        raise TypeError(f"out of {op_name} should be {result_type.__name__}, not {out.__class__.__name__}")
+
+def _single_op(x:genType, op:Callable[[Any,Any], Any], op_name:str, out:Optional[genType]=None)->genType:
     if is_number(x):
         return op(x)
     elif isinstance(x, genType):
-        result:genType = x.__class__()
-        for i in range(len(x._data)):
-            result._data[i] = op(x._data[i])
+        if out is None:
+            result:genType = x.__class__()
+        else:
+            _check_out(out, x.__class__, op_name)
+            result:genType = out
+
+        data = x._data
+        result._data[:] = [op(value) for value in data]
+        if out is not None:
+            out._update_data()
+
         return result
     else:
         raise TypeError(f"{op_name} not supported for type {x.__class__.__name__}")
 
-def abs(x:genType)->genType:
-    return _single_op(x, __builtins__.abs, "abs")
+def abs(x:genType, out:Optional[genType]=None)->genType:
+    return _single_op(x, builtins.abs, "abs", out)
 
-def sign(x:genType)->genType:
-    return _single_op(x, lambda x: math.copysign(1, x), "sign")
+def sign(x:genType, out:Optional[genType]=None)->genType:
+    return _single_op(x, lambda x: math.copysign(1, x), "sign", out)
 
-def floor(x:genType)->genType:
-    return _single_op(x, math.floor, "floor")
+def floor(x:genType, out:Optional[genType]=None)->genType:
+    return _single_op(x, math.floor, "floor", out)
     
-def ceil(x:genType)->genType:
-    return _single_op(x, math.ceil, "ceil")
+def ceil(x:genType, out:Optional[genType]=None)->genType:
+    return _single_op(x, math.ceil, "ceil", out)
 
-def trunc(x:genType)->genType:
-    return _single_op(x, math.trunc, "trunc")
+def trunc(x:genType, out:Optional[genType]=None)->genType:
+    return _single_op(x, math.trunc, "trunc", out)
 
-def round(x:genType)->genType:
-    return _single_op(x, lambda x: math.floor(x + 0.5) if x >= 0 else math.ceil(x - 0.5), "round")
+def round(x:genType, out:Optional[genType]=None)->genType:
+    return _single_op(x, lambda x: math.floor(x + 0.5) if x >= 0 else math.ceil(x - 0.5), "round", out)
 
-def roundEven(x:genType)->genType:
-    return _single_op(x, round, "roundEven")
+def roundEven(x:genType, out:Optional[genType]=None)->genType:
+    return _single_op(x, builtins.round, "roundEven", out)
 
-def fract(x:genType)->genType:
-    return _single_op(x, lambda x: x - math.trunc(x), "roundEven")
+def fract(x:genType, out:Optional[genType]=None)->genType:
+    return _single_op(x, lambda x: x - math.trunc(x), "fract", out)
 
-def mod(x:genType, y:genType)->genType:
-    return x % y
+def mod(x:genType, y:genType, out:Optional[genType]=None)->genType:
+    if out is None:
+        return x % y
 
-def _bin_op(x:genType, y:genType, op:Callable[[Any,Any], Any], op_name:str)->genType:
-    result_type = genType._bin_op_type(op_name, x, y)
+    return _bin_op(x, y, operator.mod, "%", out)
+
+def _bin_op(x:genType, y:genType, op:Callable[[Any,Any], Any], op_name:str, out:Optional[genType]=None)->genType:
     if is_number(x) and is_number(y):
         return op(x, y)
-    elif isinstance(x, genType) and is_number(y):
+
+    if out is not None and x.__class__ is out.__class__ and y.__class__ is out.__class__ and op_name not in ("/", "**"):
+        out._data[:] = list(map(op, x._data, y._data))
+        out._update_data()
+        return out
+
+    result_type = genType._bin_op_type(op_name, x, y)
+    if out is None:
         result:genType = result_type()
-        for i in range(len(x._data)):
-            result._data[i] = op(x._data[i], y)
-        return result
+    else:
+        _check_out(out, result_type, op_name)
+        result:genType = out
+
+    if isinstance(x, genType) and is_number(y):
+        result._data[:] = [op(value, y) for value in x._data]
     elif is_number(x) and isinstance(y, genType):
-        result:genType = result_type()
-        for i in range(len(y._data)):
-            result._data[i] = op(x, y._data[i])
-        return result
+        result._data[:] = [op(x, value) for value in y._data]
     elif isinstance(x, genType) and isinstance(y, genType):
         if x.math_form != y.math_form or x.shape != y.shape:
             raise TypeError(f"not defined {op_name} between '{x.__class__.__name__}' and '{y.__class__.__name__}'")
 
-        result:genType = result_type()
-        for i in range(len(x._data)):
-            result._data[i] = op(x._data[i], y._data[i])
-
-        return result
+        result._data[:] = [op(value1, value2) for value1, value2 in zip(x._data, y._data)]
     else:
         raise TypeError(f"not defined {op_name} between '{x.__class__.__name__}' and '{y.__class__.__name__}'")
 
-def min(x:genType, y:genType)->genType:
-    return _bin_op(x, y, __builtins__.min, "min")
+    if out is not None:
+        out._update_data()
+
+    return result
 
-def max(x:genType, y:genType)->genType:
-    return _bin_op(x, y, __builtins__.max, "max")
+def add(x:genType, y:genType, out:Optional[genType]=None)->genType:
+    if out is None:
+        return x + y
 
-def clamp(x:genType, min_value:genType, max_value:genType)->genType:
-    return min(max(x, min_value), max_value)
-    
-def mix(x:genType, y:genType, a:genType)->genType:
-    return (x * (1.0 - a)) + (y * a)
+    return _bin_op(x, y, operator.add, "+", out)
+
+def sub(x:genType, y:genType, out:Optional[genType]=None)->genType:
+    if out is None:
+        return x - y
+
+    return _bin_op(x, y, operator.sub, "-", out)
+
+def mul(x:genType, y:genType, out:Optional[genType]=None)->genType:
+    if out is None:
+        return x * y
+
+    if (
+        isinstance(x, genType) and isinstance(y, genType) and
+        (x.math_form in (MathForm.Mat, MathForm.Quat) or y.math_form in (MathForm.Mat, MathForm.Quat))
+    ):
+        if fast_mul(x, y, out) is None:
+            result:genType = x * y
+            _check_out(out, result.__class__, "*")
+            out._data[:] = result._data
+
+        out._update_data()
+        return out
+
+    return _bin_op(x, y, operator.mul, "*", out)
+
+def div(x:genType, y:genType, out:Optional[genType]=None)->genType:
+    if out is None:
+        return x / y
+
+    if isinstance(x, genType) and isinstance(y, genType) and not x._is_homo(y):
+        raise TypeError(f"not defined / between '{x.__class__.__name__}' and '{y.__class__.__name__}'")
+
+    return _bin_op(x, y, operator.truediv, "/", out)
+
+def min(x:genType, y:genType, out:Optional[genType]=None)->genType:
+    return _bin_op(x, y, builtins.min, "min", out)
+
+def max(x:genType, y:genType, out:Optional[genType]=None)->genType:
+    return _bin_op(x, y, builtins.max, "max", out)
 
-def step(edge:genType, x:genType)->genType:
-    return _bin_op(edge, x, lambda edge, x: float(x >= edge), "step")
+def clamp(x:genType, min_value:genType, max_value:genType, out:Optional[genType]=None)->genType:
+    if out is None:
+        return min(max(x, min_value), max_value)
+
+    max(x, min_value, out)
+    return min(out, max_value, out)
+    
+def mix(x:genType, y:genType, a:genType, out:Optional[genType]=None)->genType:
+    if out is None:
+        return (x * (1.0 - a)) + (y * a)
+
+    if is_number(x) and is_number(y) and is_number(a):
+        return x * (1.0 - a) + y * a
+
+    result_type:type = genType._bin_op_type("*", x if isinstance(x, genType) else y, a)
+    _check_out(out, result_type, "mix")
+    n:int = len(out._data)
+    x_data = x._data if isinstance(x, genType) else [x] * n
+    y_data = y._data if isinstance(y, genType) else [y] * n
+    a_data = a._data if isinstance(a, genType) else [a] * n
+    out._data[:] = [
+        value_x * (1.0 - value_a) + value_y * value_a
+        for value_x, value_y, value_a in zip(x_data, y_data, a_data)
+    ]
+    out._update_data()
+    return out
+
+def step(edge:genType, x:genType, out:Optional[genType]=None)->genType:
+    return _bin_op(edge, x, lambda edge, x: float(x >= edge), "step", out)
 
 def _smoothstep(edge0: float, edge1: float, x: float) -> float:
     if x <= edge0:
@@ -96,76 +190,82 @@ def _smoothstep(edge0: float, edge1: float, x: float) -> float:
     t = (x - edge0) / (edge1 - edge0)
     return t * t * (3.0 - 2.0 * t)
 
-def smoothstep(edge0: genType, edge1: genType, x: genType)->genType:
+def smoothstep(edge0: genType, edge1: genType, x: genType, out:Optional[genType]=None)->genType:
     if (not (is_number(edge0) and is_number(edge1))) and not edge0._is_homo(edge1):
         raise ValueError('edge0 and edge1 must be same type')
     
-    return _bin_op(edge1, x, lambda edge1, x: _smoothstep(edge0, edge1, x), "smoothstep")
+    return _bin_op(edge1, x, lambda edge1, x: _smoothstep(edge0, edge1, x), "smoothstep", out)
 
-def sqrt(x: genType)->genType:
-    return _single_op(x, math.sqrt, "sqrt")
+def sqrt(x:genType, out:Optional[genType]=None)->genType:
+    return _single_op(x, math.sqrt, "sqrt", out)
 
-def inversesqrt(x: genType)->genType:
-    return _single_op(x, lambda x: 1 / math.sqrt(x), "inversesqrt")
+def inversesqrt(x:genType, out:Optional[genType]=None)->genType:
+    return _single_op(x, lambda x: 1 / math.sqrt(x), "inversesqrt", out)
 
-def pow(x: genType, y: genType)->genType:
-    return x ** y
+def pow(x: genType, y: genType, out:Optional[genType]=None)->genType:
+    if out is None:
+        return x ** y
 
-def exp(x: genType)->genType:
-    return _single_op(x, math.exp, "exp")
+    return _bin_op(x, y, operator.pow, "**", out)
 
-def exp2(x: genType)->genType:
-    return _single_op(x, lambda x: 2 ** x, "exp2")
+def exp(x:genType, out:Optional[genType]=None)->genType:
+    return _single_op(x, math.exp, "exp", out)
 
-def exp10(x: genType)->genType:
-    return _single_op(x, lambda x: 10 ** x, "exp10")
+def exp2(x:genType, out:Optional[genType]=None)->genType:
+    return _single_op(x, lambda x: 2 ** x, "exp2", out)
 
-def log(x: genType)->genType:
-    return _single_op(x, math.log, "log")
+def exp10(x:genType, out:Optional[genType]=None)->genType:
+    return _single_op(x, lambda x: 10 ** x, "exp10", out)
 
-def log2(x: genType)->genType:
-    return _single_op(x, lambda x: math.log(x) / math.log(2), "log2")
+def log(x:genType, out:Optional[genType]=None)->genType:
+    return _single_op(x, math.log, "log", out)
 
-def log10(x: genType)->genType:
-    return _single_op(x, lambda x: math.log(x) / math.log(10), "log10")
+def log2(x:genType, out:Optional[genType]=None)->genType:
+    return _single_op(x, lambda x: math.log(x) / math.log(2), "log2", out)
 
-def sin(x: genType)->genType:
-    return _single_op(x, math.sin, "sin")
+def log10(x:genType, out:Optional[genType]=None)->genType:
+    return _single_op(x, lambda x: math.log(x) / math.log(10), "log10", out)
 
-def cos(x: genType)->genType:
-    return _single_op(x, math.cos, "cos")
+def sin(x:genType, out:Optional[genType]=None)->genType:
+    return _single_op(x, math.sin, "sin", out)
 
-def tan(x: genType)->genType:
-    return _single_op(x, math.tan, "tan")
+def cos(x:genType, out:Optional[genType]=None)->genType:
+    return _single_op(x, math.cos, "cos", out)
 
-def asin(x: genType)->genType:
-    return _single_op(x, math.asin, "asin")
+def tan(x:genType, out:Optional[genType]=None)->genType:
+    return _single_op(x, math.tan, "tan", out)
 
-def acos(x: genType)->genType:
-    return _single_op(x, math.acos, "acos")
+def asin(x:genType, out:Optional[genType]=None)->genType:
+    return _single_op(x, math.asin, "asin", out)
 
-def atan(x: genType)->genType:
-    return _single_op(x, math.atan, "atan")
+def acos(x:genType, out:Optional[genType]=None)->genType:
+    return _single_op(x, math.acos, "acos", out)
 
-def sinh(x: genType)->genType:
-    return _single_op(x, math.sinh, "sinh")
+def atan(x:genType, out:Optional[genType]=None)->genType:
+    return _single_op(x, math.atan, "atan", out)
 
-def cosh(x: genType)->genType:
-    return _single_op(x, math.cosh, "cosh")
+def sinh(x:genType, out:Optional[genType]=None)->genType:
+    return _single_op(x, math.sinh, "sinh", out)
 
-def tanh(x: genType)->genType:
-    return _single_op(x, math.tanh, "tanh")
+def cosh(x:genType, out:Optional[genType]=None)->genType:
+    return _single_op(x, math.cosh, "cosh", out)
 
-def asinh(x: genType)->genType:
-    return _single_op(x, math.asinh, "asinh")
+def tanh(x:genType, out:Optional[genType]=None)->genType:
+    return _single_op(x, math.tanh, "tanh", out)
 
-def acosh(x: genType)->genType:
-    return _single_op(x, math.acosh, "acosh")
+def asinh(x:genType, out:Optional[genType]=None)->genType:
+    return _single_op(x, math.asinh, "asinh", out)
 
-def atanh(x: genType)->genType:
-    return _single_op(x, math.atanh, "atanh")
+def acosh(x:genType, out:Optional[genType]=None)->genType:
+    return _single_op(x, math.acosh, "acosh", out)
+
+def atanh(x:genType, out:Optional[genType]=None)->genType:
+    return _single_op(x, math.atanh, "atanh", out)
 
 def length(x: genType)->float:
+    if _is_array(x):
+        return x.length()
+
     if is_number(x):
         return abs(x)
     
@@ -175,13 +275,31 @@ def length(x: genType)->float:
 
     return math.sqrt(sum)
 
-def normalize(x: genType)->genType:
-    return x / length(x)
+def normalize(x: genType, out:Optional[genType]=None)->genType:
+    if _is_array(x):
+        return x.normalize()
+
+    if out is None:
+        return x / length(x)
+
+    if out.__class__ is x.__class__ and x.dtype in (ctypes.c_float, ctypes.c_double):
+        len_x:float = length(x)
+        out._data[:] = [value / len_x for value in x._data]
+        out._update_data()
+        return out
+
+    return _bin_op(x, length(x), operator.truediv, "/", out)
 
 def distance(x: genType, y: genType)->float:
     return length(x - y)
 
 def dot(x: genType, y: genType)->float:
+    if _is_array(x):
+        return x.dot(y)
+
+    if _is_array(y):
+        return y.dot(x)
+
     if not isinstance(x, genType) or not isinstance(y, genType) or not x._is_homo(y):
         raise TypeError(f"not defined dot between '{x.__class__.__name__}' and '{y.__class__.__name__}'")
 
@@ -191,13 +309,27 @@ def dot(x: genType, y: genType)->float:
 
     return sum
 
-def cross(x: genVec3, y: genVec3)->genVec3:
+def cross(x: genVec3, y: genVec3, out:Optional[genVec3]=None)->genVec3:
+    if _is_array(x):
+        return x.cross(y)
+
+    if _is_array(y):
+        return -y.cross(x)
+
     if not isinstance(x, genVec3) or not isinstance(y, genVec3):
         raise TypeError(f"not defined cross between '{x.__class__.__name__}' and '{y.__class__.__name__}'")
 
     result_dtype:type = ctypes.c_double if (x.dtype == ctypes.c_double or y.dtype == ctypes.c_double) else ctypes.c_float
     result_type:type = genVec.vec_type(result_dtype, 3)
-    return result_type(x.y * y.z - x.z * y.y, x.z * y.x - x.x * y.z, x.x * y.y - x.y * y.x)
+    x0, x1, x2 = x._data
+    y0, y1, y2 = y._data
+    if out is None:
+        return result_type(x1 * y2 - x2 * y1, x2 * y0 - x0 * y2, x0 * y1 - x1 * y0)
+
+    _check_out(out, result_type, "cross")
+    out._data[:] = (x1 * y2 - x2 * y1, x2 * y0 - x0 * y2, x0 * y1 - x1 * y0)
+    out._update_data()
+    return out
 
 def reflect(I:genVec, N:genVec)->genVec:
     return I - 2 * dot(I, N) * N
@@ -209,6 +341,9 @@ def faceforward(N:genVec, I:genVec, Nref:genVec)->genVec:
     return (N if dot(Nref, I) < 0 else -N)
 
 def determinant(m:genMat)->float:
+    if _is_array(m):
+        return m.determinant()
+
     if not isinstance(m, genMat) or m.rows != m.cols:
         raise TypeError(f'not defined determinant for {m.__class__.__name__}')
 
@@ -224,40 +359,35 @@ def determinant(m:genMat)->float:
                 m[0, 1] * m[1, 0] * m[2, 2])
 
     if m.rows == 4:
-        det = 0.0
-        for col in range(4):
-            submatrix_data = []
-            for i in range(4):
-                if i == col:
-                    continue
-                for j in range(1, 4):
-                    submatrix_data.append(m[i, j])
-            
-            import ctypes
-            submatrix_type = genMat.mat_type(ctypes.c_double, 3, 3)
-            submatrix = submatrix_type()
-            for i in range(3):
-                for j in range(3):
-                    submatrix[i, j] = submatrix_data[i * 3 + j]
-            
-            cofactor = ((-1) ** col) * m[col, 0] * determinant(submatrix)
-            det += cofactor
-            
-        return det
-
-def transpose(m:genMat)->genMat:
+        return mat4_determinant(m._data)
+
+def transpose(m:genMat, out:Optional[genMat]=None)->genMat:
+    if _is_array(m):
+        return m.transpose()
+
     if not isinstance(m, genMat):
         raise TypeError(f'not defined transpose for {m.__class__.__name__}')
     
     result_type:type = genMat.mat_type(m.dtype, m.shape[::-1])
-    result:genMat = result_type()
-    for i in range(result.rows):
-        for j in range(result.cols):
-            result[j, i] = m[i, j]
+    if out is None:
+        result:genMat = result_type()
+    else:
+        _check_out(out, result_type, "transpose")
+        result:genMat = out
+
+    rows:int = m.rows
+    cols:int = m.cols
+    data = m._data
+    result._data[:] = [data[j * rows + i] for i in range(rows) for j in range(cols)]
+    if out is not None:
+        out._update_data()
 
     return result
 
 def trace(m:genMat)->float:
+    if _is_array(m):
+        return m.trace()
+
     if not isinstance(m, genMat) or m.rows != m.cols:
         raise TypeError(f'not defined trace for {m.__class__.__name__}')
     
@@ -267,15 +397,36 @@ def trace(m:genMat)->float:
     
     return trace
 
-def conjugate(m:genQuat)->genQuat:
+def conjugate(m:genQuat, out:Optional[genQuat]=None)->genQuat:
+    if _is_array(m):
+        return m.conjugate()
+
     if not isinstance(m, genQuat):
         raise TypeError(f'not defined conjugate for {m.__class__.__name__}')
     
-    return m.__class__(m.w, -m.x, -m.y, -m.z)
+    w, x, y, z = m._data
+    if out is None:
+        return m.__class__(w, -x, -y, -z)
+
+    _check_out(out, m.__class__, "conjugate")
+    out._data[:] = (w, -x, -y, -z)
+    out._update_data()
+    return out
+
+def inverse(m:Union[genMat, genQuat], out:Optional[Union[genMat, genQuat]]=None)->Union[genMat, genQuat]:
+    if _is_array(m):
+        return m.inverse()
 
-def inverse(m:Union[genMat, genQuat])->Union[genMat, genQuat]:
     if isinstance(m, genQuat):
-        return conjugate(m) / length(m)
+        if out is None:
+            return conjugate(m) / length(m)
+
+        _check_out(out, m.__class__, "inverse")
+        w, x, y, z = m._data
+        inv_len:float = 1 / length(m)
+        out._data[:] = (w * inv_len, -x * inv_len, -y * inv_len, -z * inv_len)
+        out._update_data()
+        return out
     
     if not isinstance(m, genMat) or m.rows != m.cols:
         raise TypeError(f'not defined inverse for {m.__class__.__name__}')
@@ -283,10 +434,36 @@ def inverse(m:Union[genMat, genQuat])->Union[genMat, genQuat]:
     result_dtype:type = (ctypes.c_double if m.dtype == ctypes.c_double else ctypes.c_float)
     result_type:type = genMat.mat_type(result_dtype, m.shape)
 
+    if m.rows == 4:
+        if out is None:
+            result = result_type()
+        else:
+            _check_out(out, result_type, "inverse")
+            result = out
+
+        if mat4_is_affine(m._data):
+            det = mat4_affine_inverse(m._data, result._data)
+        else:
+            det = mat4_inverse(m._data, result._data)
+
+        if det == 0:
+            raise ValueError("Matrix is not invertible (determinant is zero)")
+
+        if out is not None:
+            out._update_data()
+
+        return result
+
     det = determinant(m)
     if det == 0:
         raise ValueError("Matrix is not invertible (determinant is zero)")
 
+    if out is not None:
+        _check_out(out, result_type, "inverse")
+        out._data[:] = inverse(m)._data
+        out._update_data()
+        return out
+
     result = result_type()
 
     if m.rows == 2:
@@ -311,42 +488,166 @@ def inverse(m:Union[genMat, genQuat])->Union[genMat, genQuat]:
         
         return result
 
-    if m.rows == 4:
-        for i in range(4):
-            for j in range(4):
-                submatrix_data = []
-                for col in range(4):
-                    if col == i:
-                        continue
-                    for row in range(4):
-                        if row == j:
-                            continue
-                        submatrix_data.append(m[col, row])
-                
-                submatrix_type = genMat.mat_type(ctypes.c_double, 3, 3)
-                submatrix = submatrix_type()
-                for col in range(3):
-                    for row in range(3):
-                        submatrix[col, row] = submatrix_data[col * 3 + row]
-                
-                cofactor = ((-1) ** (i + j)) * determinant(submatrix)
-                result[j, i] = cofactor / det
-        
-        return result
+def affineInverse(m:genMat, out:Optional[genMat]=None)->genMat:
+    if _is_array(m):
+        return m.affineInverse()
+
+    if not isinstance(m, genMat) or m.shape != (4, 4):
+        raise TypeError(f'not defined affineInverse for {m.__class__.__name__}')
+
+    result_dtype:type = (ctypes.c_double if m.dtype == ctypes.c_double else ctypes.c_float)
+    result_type:type = genMat.mat_type(result_dtype, m.shape)
+    if out is None:
+        result:genMat = result_type()
+    else:
+        _check_out(out, result_type, "affineInverse")
+        result:genMat = out
+
+    if mat4_affine_inverse(m._data, result._data) == 0:
+        raise ValueError("Matrix is not invertible (determinant is zero)")
+
+    if out is not None:
+        out._update_data()
+
+    return result
+
+def rigidInverse(m:genMat, out:Optional[genMat]=None)->genMat:
+    if _is_array(m):
+        return m.rigidInverse()
+
+    if not isinstance(m, genMat) or m.shape != (4, 4):
+        raise TypeError(f'not defined rigidInverse for {m.__class__.__name__}')
+
+    result_dtype:type = (ctypes.c_double if m.dtype == ctypes.c_double else ctypes.c_float)
+    result_type:type = genMat.mat_type(result_dtype, m.shape)
+    if out is None:
+        result:genMat = result_type()
+    else:
+        _check_out(out, result_type, "rigidInverse")
+        result:genMat = out
+
+    mat4_rigid_inverse(m._data, result._data)
+    if out is not None:
+        out._update_data()
+
+    return result
     
-def matrixCompMult(x:genMat, y:genMat)->genMat:
-    if not isinstance(x, genMat) or not isinstance(y, genMat) or x.shape != y.shape:
-        raise TypeError(f"not defined matrixCompMult between '{x.__class__.__name__}' and '{y.__class__.__name__}'")
+def _cast_result(out:Optional[genType], result_type:type, op_name:str)->genType:
+    if out is None:
+        return result_type()
 
-    result_type:type = genType._bin_op_type('*', x, y)
-    result:genMat = result_type()
+    _check_out(out, result_type, op_name)
+    return out
+
+def mat3_cast(q:genQuat, out:Optional[genMat]=None)->genMat:
+    if _is_array(q):
+        return q.mat3_cast()
+
+    if not isinstance(q, genQuat):
+        raise TypeError(f'not defined mat3_cast for {q.__class__.__name__}')
+
+    result:genMat = _cast_result(out, genMat.mat_type(q.dtype, (3, 3)), "mat3_cast")
+    quat_to_mat3(q._data, result._data)
+    if out is not None:
+        out._update_data()
+
+    return result
+
+def mat4_cast(q:genQuat, out:Optional[genMat]=None)->genMat:
+    if _is_array(q):
+        return q.mat4_cast()
+
+    if not isinstance(q, genQuat):
+        raise TypeError(f'not defined mat4_cast for {q.__class__.__name__}')
 
-    for i in range(x.rows):
-        for j in range(y.cols):
-            result[j, i] = x[j, i] * y[j, i]
+    result:genMat = _cast_result(out, genMat.mat_type(q.dtype, (4, 4)), "mat4_cast")
+    quat_to_mat4(q._data, result._data)
+    if out is not None:
+        out._update_data()
 
     return result
 
+def quat_cast(m:genMat, out:Optional[genQuat]=None)->genQuat:
+    if _is_array(m):
+        return m.quat_cast()
+
+    if not isinstance(m, genMat) or m.shape not in ((3, 3), (4, 4)):
+        raise TypeError(f'not defined quat_cast for {m.__class__.__name__}')
+
+    result_dtype:type = (ctypes.c_double if m.dtype == ctypes.c_double else ctypes.c_float)
+    result:genQuat = _cast_result(out, genQuat.quat_type(result_dtype), "quat_cast")
+    mat_to_quat(m._data, m.rows, result._data)
+    if out is not None:
+        out._update_data()
+
+    return result
+
+def quatToYawPitchRoll(q:genQuat, out:Optional[genVec3]=None)->genVec3:
+    if _is_array(q):
+        return q.quatToYawPitchRoll()
+
+    if not isinstance(q, genQuat):
+        raise TypeError(f'not defined quatToYawPitchRoll for {q.__class__.__name__}')
+
+    result:genVec3 = _cast_result(out, genVec.vec_type(q.dtype, 3), "quatToYawPitchRoll")
+    quat_to_yaw_pitch_roll(q._data, result._data)
+    if out is not None:
+        out._update_data()
+
+    return result
+
+def quatYawPitchRoll(angles:genVec3, out:Optional[genQuat]=None)->genQuat:
+    if _is_array(angles):
+        from .genQuatArray import genQuatArray
+
+        if angles.element_shape != (3,):
+            raise TypeError(f'not defined quatYawPitchRoll for {angles.__class__.__name__}')
+
+        result_dtype:type = (ctypes.c_double if angles.dtype == ctypes.c_double else ctypes.c_float)
+        result_type:type = genQuatArray.quat_array_type(result_dtype)
+        return result_type(genQuatArray._from_yaw_pitch_roll(angles.ndarray))
+
+    if not isinstance(angles, genVec3):
+        raise TypeError(f'not defined quatYawPitchRoll for {angles.__class__.__name__}')
+
+    result_dtype:type = (ctypes.c_double if angles.dtype == ctypes.c_double else ctypes.c_float)
+    result:genQuat = _cast_result(out, genQuat.quat_type(result_dtype), "quatYawPitchRoll")
+    yaw_pitch_roll_to_quat(angles._data, result._data)
+    if out is not None:
+        out._update_data()
+
+    return result
+
+def _quat_interpolation(x:genQuat, y:genQuat, a:float, kernel:Callable, op_name:str, out:Optional[genQuat])->genQuat:
+    if _is_array(x):
+        return getattr(x, op_name)(y, a)
+
+    if _is_array(y):
+        return getattr(y, op_name)(x, 1 - a)
+
+    if not isinstance(x, genQuat) or not isinstance(y, genQuat):
+        raise TypeError(f"not defined {op_name} between '{x.__class__.__name__}' and '{y.__class__.__name__}'")
+
+    result_dtype:type = (ctypes.c_double if ctypes.c_double in (x.dtype, y.dtype) else ctypes.c_float)
+    result:genQuat = _cast_result(out, genQuat.quat_type(result_dtype), op_name)
+    kernel(x._data, y._data, a, result._data)
+    if out is not None:
+        out._update_data()
+
+    return result
+
+def slerp(x:genQuat, y:genQuat, a:float, out:Optional[genQuat]=None)->genQuat:
+    return _quat_interpolation(x, y, a, quat_slerp, "slerp", out)
+
+def nlerp(x:genQuat, y:genQuat, a:float, out:Optional[genQuat]=None)->genQuat:
+    return _quat_interpolation(x, y, a, quat_nlerp, "nlerp", out)
+    
+def matrixCompMult(x:genMat, y:genMat, out:Optional[genMat]=None)->genMat:
+    if not isinstance(x, genMat) or not isinstance(y, genMat) or x.shape != y.shape:
+        raise TypeError(f"not defined matrixCompMult between '{x.__class__.__name__}' and '{y.__class__.__name__}'")
+
+    return _bin_op(x, y, operator.mul, "*", out)
+
 def outerProduct(x:genVec, y:genVec)->genMat:
     if not isinstance(x, genVec) or not isinstance(y, genVec):
         raise TypeError(f"not defined outerProduct between '{x.__class__.__name__}' and '{y.__class__.__name__}'")
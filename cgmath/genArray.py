@@ -0,0 +1,352 @@
+from __future__ import annotations
+
+from typing import Dict, Tuple, Union, Any, Optional, Callable
+import ctypes
+import numpy as np
+
+from .genType import genType, MathForm
+from .helper import from_import, is_number
+
+
+class genArray:
+
+    element_type:Optional[type] = None
+
+    _np_dtype_map:Dict[type, type] = {
+        ctypes.c_bool: np.bool_,
+        ctypes.c_int: np.int32,
+        ctypes.c_uint: np.uint32,
+        ctypes.c_float: np.float32,
+        ctypes.c_double: np.float64
+    }
+    _ctypes_dtype_map:Dict[type, type] = {
+        np.dtype(np.bool_): ctypes.c_bool,
+        np.dtype(np.int32): ctypes.c_int,
+        np.dtype(np.int64): ctypes.c_int,
+        np.dtype(np.uint32): ctypes.c_uint,
+        np.dtype(np.uint64): ctypes.c_uint,
+        np.dtype(np.float32): ctypes.c_float,
+        np.dtype(np.float64): ctypes.c_double
+    }
+    __array_type_map:Dict[Tuple[MathForm, type, Tuple[int]], type] = {}
+    __dtype_prefix_map:Dict[type, str] = {
+        ctypes.c_bool: 'b',
+        ctypes.c_int: 'i',
+        ctypes.c_uint: 'u',
+        ctypes.c_float: '',
+        ctypes.c_double: 'd'
+    }
+
+    _operator_funcs:Dict[str, Callable[[Any,Any], Any]] = {
+        "+": np.add,
+        "-": np.subtract,
+        "*": np.multiply,
+        "/": np.true_divide,
+        "//": np.floor_divide,
+        "%": np.mod,
+        "**": np.power,
+        ">": np.greater,
+        ">=": np.greater_equal,
+        "<": np.less,
+        "<=": np.less_equal,
+        "==": np.equal,
+        "!=": np.not_equal
+    }
+
+    __array_ufunc__ = None
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        if cls.element_type is None:
+            return
+
+        prototype:genType = cls.element_type()
+        cls._math_form = prototype.math_form
+        cls._dtype = prototype.dtype
+        cls._element_shape = prototype.shape
+        cls._np_dtype = genArray._np_dtype_map[prototype.dtype]
+        cls._identity = np.frombuffer(prototype._data, dtype=cls._np_dtype).reshape(prototype.shape).copy()
+
+    def __init__(self, values:Union[int, list, tuple, np.ndarray, genArray, None] = None):
+        if values is None:
+            values = 0
+
+        if isinstance(values, int) and not isinstance(values, bool):
+            self._ndarray:np.ndarray = np.empty((values, *self._element_shape), dtype=self._np_dtype)
+            self._ndarray[...] = self._identity
+        elif isinstance(values, genArray):
+            self._ndarray:np.ndarray = np.array(values._ndarray, dtype=self._np_dtype).reshape((-1, *self._element_shape))
+        elif isinstance(values, np.ndarray):
+            self._ndarray:np.ndarray = np.asarray(values, dtype=self._np_dtype).reshape((-1, *self._element_shape))
+        elif isinstance(values, (list, tuple)):
+            if values and isinstance(values[0], genType):
+                values = [value._data[:] for value in values]
+            self._ndarray:np.ndarray = np.array(values, dtype=self._np_dtype).reshape((-1, *self._element_shape))
+        else:
+            raise TypeError(f"invalid argument type(s) for {self.__class__.__name__}()")
+
+    @property
+    def ndarray(self)->np.ndarray:
+        return self._ndarray
+
+    @ndarray.setter
+    def ndarray(self, array:np.ndarray)->None:
+        self._ndarray = np.asarray(array, dtype=self._np_dtype).reshape((-1, *self._element_shape))
+
+    @property
+    def dtype(self)->type:
+        return self._dtype
+
+    @property
+    def np_dtype(self)->type:
+        return self._np_dtype
+
+    @property
+    def element_shape(self)->Tuple[int]:
+        return self._element_shape
+
+    @property
+    def math_form(self)->MathForm:
+        return self._math_form
+
+    @staticmethod
+    def array_type(math_form:MathForm, dtype:type, shape:Tuple[int])->type:
+        key:Tuple[MathForm, type, Tuple[int]] = (math_form, dtype, shape)
+        if key not in genArray.__array_type_map:
+            prefix:str = genArray.__dtype_prefix_map[dtype]
+            result_name:str = ""
+            if math_form == MathForm.Vec:
+                result_name = f"{prefix}vec{shape[0]}array"
+            elif math_form == MathForm.Mat:
+                result_name = f"{prefix}mat{shape[0]}x{shape[1]}array"
+            elif math_form == MathForm.Quat:
+                result_name = f"{prefix}quatarray"
+            else:
+                raise TypeError(f"no array type for {math_form}")
+
+            genArray.__array_type_map[key] = from_import("." + result_name, result_name)
+
+        return genArray.__array_type_map[key]
+
+    def _wrap(self, ndarray:np.ndarray, dtype:type, math_form:Optional[MathForm] = None, shape:Optional[Tuple[int]] = None)->genArray:
+        if math_form is None:
+            math_form = self.math_form
+
+        if shape is None:
+            shape = self._element_shape
+
+        result_type:type = genArray.array_type(math_form, dtype, shape)
+        return result_type(ndarray)
+
+    def __len__(self)->int:
+        return self._ndarray.shape[0]
+
+    def __bool__(self)->bool:
+        return self._ndarray.shape[0] > 0
+
+    def __array__(self, dtype=None, copy=None)->np.ndarray:
+        if dtype is None:
+            return self._ndarray
+
+        return self._ndarray.astype(dtype)
+
+    def __copy__(self)->genArray:
+        return self.__class__(self._ndarray.copy())
+
+    def __deepcopy__(self, memo)->genArray:
+        return self.__class__(self._ndarray.copy())
+
+    def __repr__(self)->str:
+        return f"{self.__class__.__name__}({np.array2string(self._ndarray, separator=', ')})"
+
+    def __iter__(self):
+        for i in range(len(self)):
+            yield self[i]
+
+    def __getitem__(self, index:Union[int, slice, np.ndarray])->Union[genType, genArray]:
+        if isinstance(index, (int, np.integer)):
+            result:genType = self.element_type()
+            result._data[:] = self._ndarray[index].ravel().tolist()
+            return result
+
+        return self.__class__(self._ndarray[index])
+
+    def __setitem__(self, index:Union[int, slice, np.ndarray], value:Union[float, int, bool, genType, genArray, np.ndarray])->None:
+        self._ndarray[index] = self._operand(value)[0]
+
+    def append(self, value:Union[genType, genArray])->None:
+        self._ndarray = np.concatenate((self._ndarray, np.asarray(self._operand(value)[0], dtype=self._np_dtype).reshape((-1, *self._element_shape))))
+
+    def copy(self)->genArray:
+        return self.__copy__()
+
+    @staticmethod
+    def _operand(value:Any)->Tuple[Any, MathForm, Tuple[int], type]:
+        if isinstance(value, genArray):
+            return value._ndarray, value.math_form, value._element_shape, value._dtype
+
+        if isinstance(value, genType):
+            ndarray = np.frombuffer(value._data, dtype=genArray._np_dtype_map[value.dtype]).reshape(value.shape)
+            return ndarray, value.math_form, value.shape, value.dtype
+
+        if isinstance(value, np.ndarray):
+            if value.dtype not in genArray._ctypes_dtype_map:
+                raise TypeError(f"unsupported array dtype {value.dtype}")
+
+            return value, None, None, genArray._ctypes_dtype_map[value.dtype]
+
+        if is_number(value):
+            if isinstance(value, np.generic):
+                value = value.item()
+
+            return value, MathForm.Scalar, (), type(value)
+
+        raise TypeError(f"unsupported operand type '{value.__class__.__name__}'")
+
+    def _check_homo(self, operator:str, other:Any, math_form:Optional[MathForm], shape:Optional[Tuple[int]])->None:
+        if math_form in (MathForm.Scalar, None):
+            return
+
+        if math_form != self.math_form or shape != self._element_shape:
+            raise TypeError(f"unsupported operand type(s) for {operator}: '{self.__class__.__name__}' and '{other.__class__.__name__}'")
+
+    @staticmethod
+    def _has_negative(operator:str, value:Any)->bool:
+        if operator != "**":
+            return False
+
+        return bool(np.any(np.asarray(value) < 0))
+
+    def _op(self, operator:str, other:Any)->genArray:
+        other_ndarray, other_form, other_shape, other_dtype = self._operand(other)
+        self._check_homo(operator, other, other_form, other_shape)
+
+        result_dtype:type = genType._bin_op_dtype(operator, self._dtype, other_dtype, self._has_negative(operator, other_ndarray))
+        self_ndarray:np.ndarray = self._ndarray.astype(genArray._np_dtype_map[result_dtype], copy=False)
+        result:np.ndarray = self._operator_funcs[operator](self_ndarray, other_ndarray)
+        return self._wrap(result, result_dtype)
+
+    def _rop(self, operator:str, other:Any)->genArray:
+        other_ndarray, other_form, other_shape, other_dtype = self._operand(other)
+        self._check_homo(operator, other, other_form, other_shape)
+
+        result_dtype:type = genType._bin_op_dtype(operator, other_dtype, self._dtype, self._has_negative(operator, self._ndarray))
+        other_ndarray = np.asarray(other_ndarray, dtype=genArray._np_dtype_map[result_dtype])
+        result:np.ndarray = self._operator_funcs[operator](other_ndarray, self._ndarray)
+        return self._wrap(result, result_dtype)
+
+    def _iop(self, operator:str, other:Any)->genArray:
+        other_ndarray, other_form, other_shape, other_dtype = self._operand(other)
+        self._check_homo(operator, other, other_form, other_shape)
+
+        self._operator_funcs[operator](self._ndarray, other_ndarray, out=self._ndarray, casting="unsafe")
+        return self
+
+    def _compare_op(self, operator:str, other:Any)->genArray:
+        other_ndarray, other_form, other_shape, other_dtype = self._operand(other)
+        self._check_homo(operator, other, other_form, other_shape)
+
+        result:np.ndarray = self._operator_funcs[operator](self._ndarray, other_ndarray)
+        return self._wrap(result, ctypes.c_bool)
+
+    def _compare_rop(self, operator:str, other:Any)->genArray:
+        other_ndarray, other_form, other_shape, other_dtype = self._operand(other)
+        self._check_homo(operator, other, other_form, other_shape)
+
+        result:np.ndarray = self._operator_funcs[operator](other_ndarray, self._ndarray)
+        return self._wrap(result, ctypes.c_bool)
+
+    def __neg__(self)->genArray:
+        if self._dtype == ctypes.c_bool:
+            return self.__class__(np.logical_not(self._ndarray))
+
+        if self._dtype == ctypes.c_uint:
+            return self._wrap(-self._ndarray.astype(np.int32), ctypes.c_int)
+
+        return self.__class__(-self._ndarray)
+
+    def __add__(self, other:Any)->genArray:
+        return self._op("+", other)
+
+    def __radd__(self, other:Any)->genArray:
+        return self._rop("+", other)
+
+    def __iadd__(self, other:Any)->genArray:
+        return self._iop("+", other)
+
+    def __sub__(self, other:Any)->genArray:
+        return self._op("-", other)
+
+    def __rsub__(self, other:Any)->genArray:
+        return self._rop("-", other)
+
+    def __isub__(self, other:Any)->genArray:
+        return self._iop("-", other)
+
+    def __mul__(self, other:Any)->genArray:
+        return self._op("*", other)
+
+    def __rmul__(self, other:Any)->genArray:
+        return self._rop("*", other)
+
+    def __imul__(self, other:Any)->genArray:
+        return self._iop("*", other)
+
+    def __truediv__(self, other:Any)->genArray:
+        return self._op("/", other)
+
+    def __rtruediv__(self, other:Any)->genArray:
+        return self._rop("/", other)
+
+    def __itruediv__(self, other:Any)->genArray:
+        return self._iop("/", other)
+
+    def __floordiv__(self, other:Any)->genArray:
+        return self._op("//", other)
+
+    def __rfloordiv__(self, other:Any)->genArray:
+        return self._rop("//", other)
+
+    def __ifloordiv__(self, other:Any)->genArray:
+        return self._iop("//", other)
+
+    def __mod__(self, other:Any)->genArray:
+        return self._op("%", other)
+
+    def __rmod__(self, other:Any)->genArray:
+        return self._rop("%", other)
+
+    def __imod__(self, other:Any)->genArray:
+        return self._iop("%", other)
+
+    def __pow__(self, other:Any)->genArray:
+        return self._op("**", other)
+
+    def __rpow__(self, other:Any)->genArray:
+        return self._rop("**", other)
+
+    def __ipow__(self, other:Any)->genArray:
+        return self._iop("**", other)
+
+    def __eq__(self, other:Any)->bool:
+        if not isinstance(other, self.__class__):
+            return False
+
+        return bool(np.array_equal(self._ndarray, other._ndarray))
+
+    def __ne__(self, other:Any)->bool:
+        return not (self == other)
+
+    __hash__ = None
+
+    def __gt__(self, other:Any)->genArray:
+        return self._compare_op(">", other)
+
+    def __lt__(self, other:Any)->genArray:
+        return self._compare_op("<", other)
+
+    def __ge__(self, other:Any)->genArray:
+        return self._compare_op(">=", other)
+
+    def __le__(self, other:Any)->genArray:
+        return self._compare_op("<=", other)
@@ -2,8 +2,9 @@ from __future__ import annotations
 
 from typing import Tuple, Union, Any
 from .genVec import genVec
-from .genType import genType, MathForm
+from .genType import genType, MathForm, _MatColumnLink
 from .helper import is_number
+from .fast_ops import fast_mul
 
 
 class genMatIterator:
@@ -22,16 +23,24 @@ class genMatIterator:
 
 class genMat(genType):
 
+    __slots__ = ()
+
     def __init__(self, *args):
         genType.__init__(self)
-        n:int = min(self.rows, self.cols)
-        for i in range(n):
-            self[i, i] = 1
-
         i: int = 0
         n_data: int = len(self._data)
         n_args: int = len(args)
 
+        if n_args == n_data and all(map(is_number, args)):
+            self._data[:] = args
+            return
+
+        rows:int = self.rows
+        n:int = min(rows, self.cols)
+        for i in range(n):
+            self._data[i * rows + i] = 1
+
+        i = 0
         if n_args == 0:
             return
         
@@ -96,8 +105,7 @@ class genMat(genType):
         if isinstance(index, int):
             result_type = genVec.vec_type(self.dtype, self.rows)
             result:genVec = result_type(*self._data[self.rows * index : self.rows * (index + 1)])
-            result._mat_start_index = self.rows * index
-            result._related_mat = self
+            result._on_changed = _MatColumnLink(self, self.rows * index, result._data)
             return result
         elif isinstance(index, tuple):
             return self._data[index[0]*self.rows + index[1]]
@@ -123,6 +131,11 @@ class genMat(genType):
         return False
 
     def _op(self, operator:str, other:Union[float, bool, int, genMat, genVec])->Union[genMat, genVec]:
+        if operator == "*":
+            result = fast_mul(self, other)
+            if result is not None:
+                return result
+
         if operator == "**" or (operator in ["/", "//", "%"] and isinstance(other, genType)):
             raise TypeError(f"unsupported operand type(s) for {operator}: '{self.__class__.__name__}' and '{other.__class__.__name__}'")
         
@@ -165,8 +178,10 @@ class genMat(genType):
             if self.cols != other.rows or other.rows != other.cols:
                 raise TypeError(f"unsupported operand type(s) for {operator}=: '{self.__class__.__name__}' and '{other.__class__.__name__}'")
 
-            result:genMat = self * other
-            self._data[:] = result._data[:]
+            if fast_mul(self, other, self) is None:
+                result:genMat = self * other
+                self._data[:] = result._data[:]
+
             self._update_data()
             return self
             
@@ -4,6 +4,8 @@ from .genMat import genMat
 
 class genMat2x4(genMat):
 
+    __slots__ = ()
+
     @property
     def shape(self)->Tuple[int]:
         return (2, 4)
\ No newline at end of file
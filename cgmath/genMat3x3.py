@@ -4,6 +4,8 @@ from .genMat import genMat
 
 class genMat3x3(genMat):
 
+    __slots__ = ()
+
     @property
     def shape(self)->Tuple[int]:
         return (3, 3)
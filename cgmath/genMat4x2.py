@@ -4,6 +4,8 @@ from .genMat import genMat
 
 class genMat4x2(genMat):
 
+    __slots__ = ()
+
     @property
     def shape(self)->Tuple[int]:
         return (4, 2)
\ No newline at end of file
@@ -4,6 +4,8 @@ from .genMat import genMat
 
 class genMat4x3(genMat):
 
+    __slots__ = ()
+
     @property
     def shape(self)->Tuple[int]:
         return (4, 3)
\ No newline at end of file
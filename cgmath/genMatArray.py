@@ -0,0 +1,125 @@
+from __future__ import annotations
+
+from typing import Tuple, Any
+import ctypes
+import numpy as np
+
+from .genArray import genArray
+from .genQuatArray import genQuatArray
+from .genType import genType, MathForm
+
+
+class genMatArray(genArray):
+
+    @property
+    def rows(self)->int:
+        return self._element_shape[1]
+
+    @property
+    def cols(self)->int:
+        return self._element_shape[0]
+
+    @staticmethod
+    def mat_array_type(dtype:type, shape:Tuple[int])->type:
+        return genArray.array_type(MathForm.Mat, dtype, shape)
+
+    def column(self, index:int)->genArray:
+        return self._wrap(self._ndarray[:, index], self._dtype, MathForm.Vec, (self.rows,))
+
+    def _op(self, operator:str, other:Any)->genArray:
+        if operator == "**" or (operator in ["/", "//", "%"] and isinstance(other, (genType, genArray))):
+            raise TypeError(f"unsupported operand type(s) for {operator}: '{self.__class__.__name__}' and '{other.__class__.__name__}'")
+
+        if operator == "*" and isinstance(other, (genType, genArray)):
+            other_ndarray, other_form, other_shape, other_dtype = self._operand(other)
+            if other_form == MathForm.Mat and self.cols == other_shape[1]:
+                result_dtype:type = genType._bin_op_dtype(operator, self._dtype, other_dtype)
+                return self._wrap(np.matmul(other_ndarray, self._ndarray), result_dtype, MathForm.Mat, (other_shape[0], self.rows))
+            elif other_form == MathForm.Vec and self.cols == other_shape[0]:
+                result_dtype:type = genType._bin_op_dtype(operator, self._dtype, other_dtype)
+                result:np.ndarray = np.matmul(other_ndarray[..., np.newaxis, :], self._ndarray)[..., 0, :]
+                return self._wrap(result, result_dtype, MathForm.Vec, (self.rows,))
+            else:
+                raise TypeError(f"unsupported operand type(s) for {operator}: '{self.__class__.__name__}' and '{other.__class__.__name__}'")
+
+        return genArray._op(self, operator, other)
+
+    def _rop(self, operator:str, other:Any)->genArray:
+        if operator == "*" and isinstance(other, genType):
+            if other.math_form != MathForm.Mat:
+                raise TypeError(f"unsupported operand type(s) for {operator}: '{other.__class__.__name__}' and '{self.__class__.__name__}'")
+
+            array_type:type = self.mat_array_type(other.dtype, other.shape)
+            return array_type(self._operand(other)[0])._op(operator, self)
+
+        if operator in ["/", "//", "%", "**"] and isinstance(other, genType):
+            raise TypeError(f"unsupported operand type(s) for {operator}: '{other.__class__.__name__}' and '{self.__class__.__name__}'")
+
+        return genArray._rop(self, operator, other)
+
+    def _iop(self, operator:str, other:Any)->genMatArray:
+        if operator == "**" or (operator in ["/", "//", "%"] and isinstance(other, (genType, genArray))):
+            raise TypeError(f"unsupported operand type(s) for {operator}=: '{self.__class__.__name__}' and '{other.__class__.__name__}'")
+
+        if operator == "*" and isinstance(other, (genType, genArray)):
+            other_ndarray, other_form, other_shape, other_dtype = self._operand(other)
+            if other_form != MathForm.Mat or self.cols != other_shape[1] or other_shape[0] != other_shape[1]:
+                raise TypeError(f"unsupported operand type(s) for {operator}=: '{self.__class__.__name__}' and '{other.__class__.__name__}'")
+
+            self._ndarray[...] = np.matmul(other_ndarray, self._ndarray)
+            return self
+
+        return genArray._iop(self, operator, other)
+
+    def transpose(self)->genMatArray:
+        return self._wrap(np.swapaxes(self._ndarray, -1, -2), self._dtype, MathForm.Mat, self._element_shape[::-1])
+
+    def determinant(self)->np.ndarray:
+        if self.rows != self.cols:
+            raise TypeError(f'not defined determinant for {self.__class__.__name__}')
+
+        return np.linalg.det(self._ndarray)
+
+    def inverse(self)->genMatArray:
+        if self.rows != self.cols:
+            raise TypeError(f'not defined inverse for {self.__class__.__name__}')
+
+        result_dtype:type = (ctypes.c_double if self._dtype == ctypes.c_double else ctypes.c_float)
+        return self._wrap(np.linalg.inv(self._ndarray), result_dtype)
+
+    def affineInverse(self)->genMatArray:
+        if self._element_shape != (4, 4):
+            raise TypeError(f'not defined affineInverse for {self.__class__.__name__}')
+
+        result_dtype:type = (ctypes.c_double if self._dtype == ctypes.c_double else ctypes.c_float)
+        linear_inv:np.ndarray = np.linalg.inv(self._ndarray[:, :3, :3])
+        result:np.ndarray = np.zeros(self._ndarray.shape, dtype=linear_inv.dtype)
+        result[:, :3, :3] = linear_inv
+        result[:, 3, :3] = -np.matmul(self._ndarray[:, 3, np.newaxis, :3], linear_inv)[:, 0, :]
+        result[:, 3, 3] = 1
+        return self._wrap(result, result_dtype)
+
+    def rigidInverse(self)->genMatArray:
+        if self._element_shape != (4, 4):
+            raise TypeError(f'not defined rigidInverse for {self.__class__.__name__}')
+
+        result_dtype:type = (ctypes.c_double if self._dtype == ctypes.c_double else ctypes.c_float)
+        rotation_inv:np.ndarray = np.swapaxes(self._ndarray[:, :3, :3], -1, -2)
+        result:np.ndarray = np.zeros(self._ndarray.shape, dtype=np.result_type(rotation_inv.dtype, np.float32))
+        result[:, :3, :3] = rotation_inv
+        result[:, 3, :3] = -np.matmul(self._ndarray[:, 3, np.newaxis, :3], rotation_inv)[:, 0, :]
+        result[:, 3, 3] = 1
+        return self._wrap(result, result_dtype)
+
+    def trace(self)->np.ndarray:
+        if self.rows != self.cols:
+            raise TypeError(f'not defined trace for {self.__class__.__name__}')
+
+        return np.trace(self._ndarray, axis1=-2, axis2=-1)
+
+    def quat_cast(self)->genQuatArray:
+        if self._element_shape not in ((3, 3), (4, 4)):
+            raise TypeError(f'not defined quat_cast for {self.__class__.__name__}')
+
+        result_dtype:type = (ctypes.c_double if self._dtype == ctypes.c_double else ctypes.c_float)
+        return self._wrap(genQuatArray._from_mat(self._ndarray), result_dtype, MathForm.Quat, (4,))
@@ -4,6 +4,7 @@ from .genType import genType, MathForm
 from .genVec import genVec
 from .genVec3 import genVec3
 from .helper import is_number
+from .fast_ops import fast_mul, quat_mul_quat
 
 from typing import Tuple, Any, Union
 import math
@@ -11,6 +12,8 @@ import math
 
 class genQuat(genType):
 
+    __slots__ = ()
+
     def __init__(self, *args):
         genType.__init__(self)
         self._data[0] = 1
@@ -131,6 +134,11 @@ class genQuat(genType):
         return (value in self._data)
     
     def _op(self, operator:str, other:Union[float, bool, int, genQuat, genVec])->Union[genQuat, genVec]:
+        if operator == "*":
+            result = fast_mul(self, other)
+            if result is not None:
+                return result
+
         if operator == "**" or (operator in ["/", "//", "%"] and isinstance(other, genType)):
             raise TypeError(f"unsupported operand type(s) for {operator}: '{self.__class__.__name__}' and '{other.__class__.__name__}'")
         
@@ -168,14 +176,8 @@ class genQuat(genType):
             if not isinstance(other, genQuat):
                 raise TypeError(f"unsupported operand type(s) for {operator}: '{self.__class__.__name__}' and '{other.__class__.__name__}'")
             
-            w = self.w * other.w - self.x * other.x - self.y * other.y - self.z * other.z
-            x = self.w * other.x + self.x * other.w + self.y * other.z - self.z * other.y
-            y = self.w * other.y + self.y * other.w + self.z * other.x - self.x * other.z
-            z = self.w * other.z + self.z * other.w + self.x * other.y - self.y * other.x
-            self.w = w
-            self.x = x
-            self.y = y
-            self.z = z
+            quat_mul_quat(self._data, other._data, self._data)
+            self._update_data()
 
             return self
         
@@ -0,0 +1,234 @@
+from __future__ import annotations
+
+from typing import Tuple, Union, Any
+import ctypes
+import numpy as np
+
+from .genArray import genArray
+from .genType import genType, MathForm
+
+
+class genQuatArray(genArray):
+
+    @staticmethod
+    def quat_array_type(dtype:type)->type:
+        return genArray.array_type(MathForm.Quat, dtype, (4,))
+
+    @property
+    def w(self)->np.ndarray:
+        return self._ndarray[:, 0]
+
+    @w.setter
+    def w(self, w:Union[float, np.ndarray])->None:
+        self._ndarray[:, 0] = w
+
+    @property
+    def x(self)->np.ndarray:
+        return self._ndarray[:, 1]
+
+    @x.setter
+    def x(self, x:Union[float, np.ndarray])->None:
+        self._ndarray[:, 1] = x
+
+    @property
+    def y(self)->np.ndarray:
+        return self._ndarray[:, 2]
+
+    @y.setter
+    def y(self, y:Union[float, np.ndarray])->None:
+        self._ndarray[:, 2] = y
+
+    @property
+    def z(self)->np.ndarray:
+        return self._ndarray[:, 3]
+
+    @z.setter
+    def z(self, z:Union[float, np.ndarray])->None:
+        self._ndarray[:, 3] = z
+
+    @property
+    def xyz(self)->genArray:
+        return self._wrap(self._ndarray[:, 1:], self._dtype, MathForm.Vec, (3,))
+
+    @xyz.setter
+    def xyz(self, xyz:Any)->None:
+        self._ndarray[:, 1:] = self._operand(xyz)[0]
+
+    @staticmethod
+    def _hamilton(q1:np.ndarray, q2:np.ndarray)->np.ndarray:
+        w1, x1, y1, z1 = q1[..., 0], q1[..., 1], q1[..., 2], q1[..., 3]
+        w2, x2, y2, z2 = q2[..., 0], q2[..., 1], q2[..., 2], q2[..., 3]
+        return np.stack((
+            w1 * w2 - x1 * x2 - y1 * y2 - z1 * z2,
+            w1 * x2 + x1 * w2 + y1 * z2 - z1 * y2,
+            w1 * y2 + y1 * w2 + z1 * x2 - x1 * z2,
+            w1 * z2 + z1 * w2 + x1 * y2 - y1 * x2
+        ), axis=-1)
+
+    @staticmethod
+    def _rotate(q:np.ndarray, v:np.ndarray)->np.ndarray:
+        w:np.ndarray = q[..., 0:1]
+        u:np.ndarray = q[..., 1:]
+        norm2:np.ndarray = np.sum(q * q, axis=-1, keepdims=True)
+        uu:np.ndarray = np.sum(u * u, axis=-1, keepdims=True)
+        uv:np.ndarray = np.sum(u * v, axis=-1, keepdims=True)
+        result:np.ndarray = (w * w - uu) * v + 2 * uv * u + 2 * w * np.cross(u, v)
+        return result / np.sqrt(norm2)
+
+    @staticmethod
+    def _to_mat(q:np.ndarray, size:int)->np.ndarray:
+        w, x, y, z = q[..., 0], q[..., 1], q[..., 2], q[..., 3]
+        result:np.ndarray = np.zeros((*q.shape[:-1], size, size), dtype=q.dtype)
+        result[..., 0, 0] = 1 - 2 * (y * y + z * z)
+        result[..., 0, 1] = 2 * (x * y + w * z)
+        result[..., 0, 2] = 2 * (x * z - w * y)
+        result[..., 1, 0] = 2 * (x * y - w * z)
+        result[..., 1, 1] = 1 - 2 * (x * x + z * z)
+        result[..., 1, 2] = 2 * (y * z + w * x)
+        result[..., 2, 0] = 2 * (x * z + w * y)
+        result[..., 2, 1] = 2 * (y * z - w * x)
+        result[..., 2, 2] = 1 - 2 * (x * x + y * y)
+        if size == 4:
+            result[..., 3, 3] = 1
+
+        return result
+
+    @staticmethod
+    def _from_mat(m:np.ndarray)->np.ndarray:
+        m00, m01, m02 = m[..., 0, 0], m[..., 1, 0], m[..., 2, 0]
+        m10, m11, m12 = m[..., 0, 1], m[..., 1, 1], m[..., 2, 1]
+        m20, m21, m22 = m[..., 0, 2], m[..., 1, 2], m[..., 2, 2]
+        candidates:np.ndarray = np.stack((
+            np.stack((1 + m00 + m11 + m22, m21 - m12, m02 - m20, m10 - m01), axis=-1),
+            np.stack((m21 - m12, 1 + m00 - m11 - m22, m01 + m10, m02 + m20), axis=-1),
+            np.stack((m02 - m20, m01 + m10, 1 - m00 + m11 - m22, m12 + m21), axis=-1),
+            np.stack((m10 - m01, m02 + m20, m12 + m21, 1 - m00 - m11 + m22), axis=-1)
+        ), axis=-2)
+        best:np.ndarray = np.argmax(np.diagonal(candidates, axis1=-2, axis2=-1), axis=-1)
+        result:np.ndarray = np.take_along_axis(candidates, best[..., np.newaxis, np.newaxis], axis=-2)[..., 0, :]
+        return result * (0.5 / np.sqrt(np.take_along_axis(result, best[..., np.newaxis], axis=-1)))
+
+    @staticmethod
+    def _to_yaw_pitch_roll(q:np.ndarray)->np.ndarray:
+        w, x, y, z = q[..., 0], q[..., 1], q[..., 2], q[..., 3]
+        return np.stack((
+            np.arctan2(2 * (w * z - x * y), 1 - 2 * (x * x + z * z)),
+            np.arcsin(np.clip(2 * (w * x + y * z), -1, 1)),
+            np.arctan2(2 * (w * y - x * z), 1 - 2 * (x * x + y * y))
+        ), axis=-1)
+
+    @staticmethod
+    def _from_yaw_pitch_roll(angles:np.ndarray)->np.ndarray:
+        half:np.ndarray = angles / 2
+        cy, cp, cr = np.cos(half[..., 0]), np.cos(half[..., 1]), np.cos(half[..., 2])
+        sy, sp, sr = np.sin(half[..., 0]), np.sin(half[..., 1]), np.sin(half[..., 2])
+        return np.stack((
+            cy * cp * cr - sy * sp * sr,
+            cy * sp * cr - sy * cp * sr,
+            cy * cp * sr + sy * sp * cr,
+            sy * cp * cr + cy * sp * sr
+        ), axis=-1)
+
+    def _interpolation_operands(self, other:Any, a:Union[float, np.ndarray])->Tuple[np.ndarray, np.ndarray, np.ndarray, type]:
+        other_ndarray, other_form, other_shape, other_dtype = self._operand(other)
+        self._check_homo("mix", other, other_form, other_shape)
+        result_dtype:type = (ctypes.c_double if ctypes.c_double in (self._dtype, other_dtype) else ctypes.c_float)
+        a:np.ndarray = np.asarray(a, dtype=genArray._np_dtype_map[result_dtype])
+        if a.ndim > 0:
+            a = a[..., np.newaxis]
+
+        cos_theta:np.ndarray = np.sum(self._ndarray * other_ndarray, axis=-1, keepdims=True)
+        other_ndarray = np.where(cos_theta < 0, -other_ndarray, other_ndarray)
+        return other_ndarray, np.abs(cos_theta), a, result_dtype
+
+    def _op(self, operator:str, other:Any)->genArray:
+        if operator == "**" or (operator in ["/", "//", "%"] and isinstance(other, (genType, genArray))):
+            raise TypeError(f"unsupported operand type(s) for {operator}: '{self.__class__.__name__}' and '{other.__class__.__name__}'")
+
+        if operator == "*" and isinstance(other, (genType, genArray)):
+            other_ndarray, other_form, other_shape, other_dtype = self._operand(other)
+            result_dtype:type = genType._bin_op_dtype(operator, self._dtype, other_dtype)
+            if other_form == MathForm.Quat:
+                return self._wrap(self._hamilton(self._ndarray, other_ndarray), result_dtype)
+            elif other_form == MathForm.Vec and other_shape == (3,):
+                return self._wrap(self._rotate(self._ndarray, other_ndarray), result_dtype, MathForm.Vec, (3,))
+            else:
+                raise TypeError(f"unsupported operand type(s) for {operator}: '{self.__class__.__name__}' and '{other.__class__.__name__}'")
+
+        return genArray._op(self, operator, other)
+
+    def _rop(self, operator:str, other:Any)->genArray:
+        if operator == "*" and isinstance(other, genType):
+            if other.math_form != MathForm.Quat:
+                raise TypeError(f"unsupported operand type(s) for {operator}: '{other.__class__.__name__}' and '{self.__class__.__name__}'")
+
+            other_ndarray, other_form, other_shape, other_dtype = self._operand(other)
+            result_dtype:type = genType._bin_op_dtype(operator, other_dtype, self._dtype)
+            return self._wrap(self._hamilton(other_ndarray, self._ndarray), result_dtype)
+
+        if operator in ["/", "//", "%", "**"] and isinstance(other, genType):
+            raise TypeError(f"unsupported operand type(s) for {operator}: '{other.__class__.__name__}' and '{self.__class__.__name__}'")
+
+        return genArray._rop(self, operator, other)
+
+    def _iop(self, operator:str, other:Any)->genQuatArray:
+        if operator == "**" or (operator in ["/", "//", "%"] and isinstance(other, (genType, genArray))):
+            raise TypeError(f"unsupported operand type(s) for {operator}=: '{self.__class__.__name__}' and '{other.__class__.__name__}'")
+
+        if operator == "*" and isinstance(other, (genType, genArray)):
+            other_ndarray, other_form, other_shape, other_dtype = self._operand(other)
+            if other_form != MathForm.Quat:
+                raise TypeError(f"unsupported operand type(s) for {operator}=: '{self.__class__.__name__}' and '{other.__class__.__name__}'")
+
+            self._ndarray[...] = self._hamilton(self._ndarray, other_ndarray)
+            return self
+
+        return genArray._iop(self, operator, other)
+
+    def length(self)->np.ndarray:
+        return np.sqrt(np.sum(self._ndarray * self._ndarray, axis=-1))
+
+    def dot(self, other:Any)->np.ndarray:
+        other_ndarray, other_form, other_shape, other_dtype = self._operand(other)
+        self._check_homo("dot", other, other_form, other_shape)
+        return np.sum(self._ndarray * other_ndarray, axis=-1)
+
+    def normalize(self)->genQuatArray:
+        return self.__class__(self._ndarray / self.length()[:, np.newaxis])
+
+    def conjugate(self)->genQuatArray:
+        result:np.ndarray = self._ndarray.copy()
+        result[:, 1:] *= -1
+        return self.__class__(result)
+
+    def inverse(self)->genQuatArray:
+        result:np.ndarray = self._ndarray / self.length()[:, np.newaxis]
+        result[:, 1:] *= -1
+        return self.__class__(result)
+
+    def mat3_cast(self)->genArray:
+        result_dtype:type = (ctypes.c_double if self._dtype == ctypes.c_double else ctypes.c_float)
+        return self._wrap(self._to_mat(self._ndarray, 3), result_dtype, MathForm.Mat, (3, 3))
+
+    def mat4_cast(self)->genArray:
+        result_dtype:type = (ctypes.c_double if self._dtype == ctypes.c_double else ctypes.c_float)
+        return self._wrap(self._to_mat(self._ndarray, 4), result_dtype, MathForm.Mat, (4, 4))
+
+    def quatToYawPitchRoll(self)->genArray:
+        result_dtype:type = (ctypes.c_double if self._dtype == ctypes.c_double else ctypes.c_float)
+        return self._wrap(self._to_yaw_pitch_roll(self._ndarray), result_dtype, MathForm.Vec, (3,))
+
+    def nlerp(self, other:Any, a:Union[float, np.ndarray])->genQuatArray:
+        other_ndarray, cos_theta, a, result_dtype = self._interpolation_operands(other, a)
+        result:np.ndarray = self._ndarray + a * (other_ndarray - self._ndarray)
+        result /= np.sqrt(np.sum(result * result, axis=-1, keepdims=True))
+        return self._wrap(result, result_dtype)
+
+    def slerp(self, other:Any, a:Union[float, np.ndarray])->genQuatArray:
+        other_ndarray, cos_theta, a, result_dtype = self._interpolation_operands(other, a)
+        near:np.ndarray = (cos_theta > 1 - 1E-6)
+        theta:np.ndarray = np.arccos(np.where(near, 0, cos_theta))
+        sin_theta:np.ndarray = np.sin(theta)
+        k1:np.ndarray = np.where(near, 1 - a, np.sin((1 - a) * theta) / sin_theta)
+        k2:np.ndarray = np.where(near, a, np.sin(a * theta) / sin_theta)
+        return self._wrap(k1 * self._ndarray + k2 * other_ndarray, result_dtype)
@@ -4,6 +4,7 @@ from abc import ABC, abstractmethod
 from typing import List, Dict, Tuple, Union, Any, Optional, Callable
 import ctypes
 from .helper import from_import, is_number
+from .defer_notifications import defer_notifications
 import math
 from enum import Enum
 import importlib
@@ -16,8 +17,31 @@ class MathForm(Enum):
     Quat = 3
 
 
+class _MatColumnLink:
+
+    __slots__ = ('mat', 'start_index', 'data', 'on_changed')
+
+    def __init__(self, mat:genType, start_index:int, data:ctypes.Array):
+        self.mat:genType = mat
+        self.start_index:int = start_index
+        self.data:ctypes.Array = data
+        self.on_changed:Optional[Callable[[], None]] = None
+
+    def write_back(self):
+        start_index:int = self.start_index
+        self.mat._data[start_index:start_index + len(self.data)] = self.data
+
+    def __call__(self):
+        self.write_back()
+        self.mat._call_on_changed()
+        if self.on_changed is not None:
+            self.on_changed()
+
+
 class genType(ABC):
 
+    __slots__ = ('_data', '_on_changed')
+
     __type_order:List[type] = [
         bool, ctypes.c_bool,
         int, ctypes.c_int, ctypes.c_uint,
@@ -74,6 +98,9 @@ class genType(ABC):
 
     @property
     def on_changed(self)->Optional[Callable[[], None]]:
+        if isinstance(self._on_changed, _MatColumnLink):
+            return self._on_changed.on_changed
+
         return self._on_changed
     
     @on_changed.setter
@@ -81,7 +108,10 @@ class genType(ABC):
         if on_changed is not None and not callable(on_changed):
             raise TypeError('on_changed should be a function')
 
-        self._on_changed = on_changed
+        if isinstance(self._on_changed, _MatColumnLink):
+            self._on_changed.on_changed = on_changed
+        else:
+            self._on_changed = on_changed
 
     @property
     @abstractmethod
@@ -128,6 +158,13 @@ class genType(ABC):
         if self._on_changed is None:
             return
         
+        if defer_notifications._deferring():
+            if isinstance(self._on_changed, _MatColumnLink):
+                self._on_changed.write_back()
+
+            defer_notifications._defer(self._on_changed)
+            return
+
         self._on_changed()
 
     def _update_data(self, indices:Optional[List[int]] = None):
@@ -194,6 +231,9 @@ class genType(ABC):
         )
 
     def _op(self, operator:str, other:Union[float, bool, int, genType])->genType:
+        if not isinstance(other, genType) and not is_number(other):
+            return NotImplemented
+
         result_type = self._bin_op_type(operator, self, other)
         result:genType = result_type()
         other_is_homo:bool = self._is_homo(other)
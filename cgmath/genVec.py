@@ -1,43 +1,24 @@
 from __future__ import annotations
 
-from typing import Set, List, Dict, Union, Any, Optional, Tuple, TYPE_CHECKING
-from .helper import generate_getter_swizzles, generate_setter_swizzles, is_number
+from typing import Set, List, Dict, Union, Any, Tuple
+from .helper import (
+    getter_swizzles_map, setter_swizzles_map, total_swizzles,
+    swizzle_index_map, swizzle_indices_map, is_number
+)
 from .genType import genType, MathForm
 from abc import abstractmethod
 
-if TYPE_CHECKING:
-    from .genMat import genMat
-
 
 class genVec(genType):
 
-    _attr_index_map:Dict[str, int] = {
-        'x': 0,
-        'y': 1,
-        'z': 2,
-        'w': 3,
-        'r': 0,
-        'g': 1,
-        'b': 2,
-        'a': 3,
-        's': 0,
-        't': 1,
-        'p': 2,
-        'q': 3
-    }
-
-    _all_attrs:Set[str] = {
-        '_data', '_related_mat', '_mat_start_index', '_on_changed'
-    }
-    _all_getter_swizzles:Set[str] = set()
-    _all_setter_swizzles:Set[str] = set()
-    __all_total_swizzles:Set[str] = set()
-    __namespaces:List[str] = ['xyzw', 'rgba', 'stpq']
+    __slots__ = ()
+
+    _attr_index_map:Dict[str, int] = swizzle_index_map
+
+    _all_attrs:Set[str] = {'_data', '_on_changed'}
 
     def __init__(self, *args):
         genType.__init__(self)
-        self._related_mat:Optional[genMat] = None
-        self._mat_start_index:int = -1
 
         i: int = 0
         n_data: int = len(self._data)
@@ -97,24 +78,16 @@ class genVec(genType):
     def vec_type(dtype:type, size:int)->type:
         return genType.gen_type(MathForm.Vec, dtype, (size,))
 
-    def _update_data(self, indices:Optional[List[int]] = None):
-        genType._update_data(self, indices)
-
-        if self._related_mat is not None:
-            if indices is None:
-                indices = range(len(self))
-
-            for index in indices:
-                self._related_mat._data[self._mat_start_index + index] = self._data[index]
-
-            self._related_mat._call_on_changed()
-
     def __getattr__(self, name:str)->Union[float,bool,int,genVec]:
         if name not in self.__getter_swizzles():
             raise AttributeError(f"'{self.__class__.__name__}' object has no attribute '{name}'")
         
+        if len(name) == 1:
+            return self._data[self._attr_index_map[name]]
+
+        data = self._data
         vec_type = self.vec_type(self.dtype, len(name))
-        return vec_type(*(self._data[self._attr_index_map[ch]] for ch in name))
+        return vec_type(*[data[index] for index in swizzle_indices_map[name]])
 
     def __setattr__(self, name:str, value:Union[float,bool,int,genVec]):
         if name in self._all_attrs:
@@ -136,8 +109,7 @@ class genVec(genType):
         if not value_is_vec and not is_number(value):
             raise TypeError(f"can not set '{value.__class__.__name__}' object to property '{name}' of '{self.__class__.__name__}' object")
         
-        for i, ch in enumerate(name):
-            index:int = self._attr_index_map[ch]
+        for i, index in enumerate(swizzle_indices_map[name]):
             self._data[index] = value[i] if value_is_vec else value
             update_indices.append(index)
         self._update_data(update_indices)
@@ -171,34 +143,15 @@ class genVec(genType):
     def value_ptr(self):
         return self._data
         
-    def __getter_swizzles(self):
-        if not self.__class__._all_getter_swizzles:
-            n:int = len(self)
-            self.__class__._all_getter_swizzles = set(
-                generate_getter_swizzles(
-                    namespace[:n] for namespace in genVec.__namespaces
-                )
-            )
-
-        return self.__class__._all_getter_swizzles
+    def __getter_swizzles(self)->Set[str]:
+        return getter_swizzles_map[len(self)]
     
-    def __setter_swizzles(self):
-        if not self.__class__._all_setter_swizzles:
-            n:int = len(self)
-            self.__class__._all_setter_swizzles = set(
-                generate_setter_swizzles(
-                    namespace[:n] for namespace in genVec.__namespaces
-                )
-            )
-
-        return self.__class__._all_setter_swizzles
+    def __setter_swizzles(self)->Set[str]:
+        return setter_swizzles_map[len(self)]
     
     @staticmethod
-    def __total_swizzles():
-        if not genVec.__all_total_swizzles:
-            genVec.__all_total_swizzles = set(generate_getter_swizzles(genVec.__namespaces))
-
-        return genVec.__all_total_swizzles
+    def __total_swizzles()->Set[str]:
+        return total_swizzles
 
     def __iter__(self):
         return iter(self._data)
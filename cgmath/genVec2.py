@@ -2,6 +2,8 @@ from .genVec import genVec
 
 
 class genVec2(genVec):
+
+    __slots__ = ()
     
     def __len__(self)->int:
         return 2
\ No newline at end of file
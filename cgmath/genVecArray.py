@@ -0,0 +1,84 @@
+from __future__ import annotations
+
+from typing import Set, List, Union, Any
+import ctypes
+import numpy as np
+
+from .genArray import genArray
+from .genType import genType, MathForm
+from .genVec import genVec
+from .helper import getter_swizzles_map, setter_swizzles_map, swizzle_indices_map
+
+
+class genVecArray(genArray):
+
+    _all_attrs:Set[str] = {'_ndarray'}
+
+    @staticmethod
+    def vec_array_type(dtype:type, size:int)->type:
+        return genArray.array_type(MathForm.Vec, dtype, (size,))
+
+    def __getter_swizzles(self)->Set[str]:
+        return getter_swizzles_map[self._element_shape[0]]
+
+    def __setter_swizzles(self)->Set[str]:
+        return setter_swizzles_map[self._element_shape[0]]
+
+    def __getattr__(self, name:str)->Union[np.ndarray, genVecArray]:
+        if name.startswith("_") or name not in self.__getter_swizzles():
+            raise AttributeError(f"'{self.__class__.__name__}' object has no attribute '{name}'")
+
+        if len(name) == 1:
+            return self._ndarray[:, genVec._attr_index_map[name]]
+
+        indices:List[int] = list(swizzle_indices_map[name])
+        result_type:type = self.vec_array_type(self._dtype, len(name))
+        return result_type(self._ndarray[:, indices])
+
+    def __setattr__(self, name:str, value:Union[float, bool, int, genVec, genVecArray, np.ndarray]):
+        if name in self._all_attrs or name not in self.__setter_swizzles():
+            if name not in self._all_attrs and name in self.__getter_swizzles():
+                raise AttributeError(f"property '{name}' of '{self.__class__.__name__}' object has no setter")
+
+            super().__setattr__(name, value)
+            return
+
+        indices:List[int] = list(swizzle_indices_map[name])
+        value = self._operand(value)[0]
+        if len(name) == 1:
+            self._ndarray[:, indices[0]] = value
+        else:
+            self._ndarray[:, indices] = value
+
+    def dot(self, other:Union[genVec, genVecArray])->np.ndarray:
+        other_ndarray, other_form, other_shape, other_dtype = self._operand(other)
+        self._check_homo("dot", other, other_form, other_shape)
+        return np.sum(self._ndarray * other_ndarray, axis=-1)
+
+    def cross(self, other:Union[genVec, genVecArray])->genVecArray:
+        other_ndarray, other_form, other_shape, other_dtype = self._operand(other)
+        if self._element_shape != (3,) or other_form not in (MathForm.Vec, None) or other_shape not in ((3,), None):
+            raise TypeError(f"not defined cross between '{self.__class__.__name__}' and '{other.__class__.__name__}'")
+
+        result_dtype:type = ctypes.c_double if (self._dtype == ctypes.c_double or other_dtype == ctypes.c_double) else ctypes.c_float
+        return self._wrap(np.cross(self._ndarray, other_ndarray), result_dtype)
+
+    def length(self)->np.ndarray:
+        return np.sqrt(np.sum(self._ndarray * self._ndarray, axis=-1))
+
+    def normalize(self)->genVecArray:
+        result_dtype:type = ctypes.c_double if self._dtype == ctypes.c_double else ctypes.c_float
+        return self._wrap(self._ndarray / self.length()[:, np.newaxis], result_dtype)
+
+    def distance(self, other:Union[genVec, genVecArray])->np.ndarray:
+        return (self - other).length()
+
+    def _rop(self, operator:str, other:Any)->genArray:
+        if operator == "*" and isinstance(other, genType) and other.math_form in (MathForm.Mat, MathForm.Quat):
+            return self._lmul(other)
+
+        return genArray._rop(self, operator, other)
+
+    def _lmul(self, other:genType)->genVecArray:
+        array_type:type = genArray.array_type(other.math_form, other.dtype, other.shape)
+        return array_type(self._operand(other)[0])._op("*", self)
@@ -1,5 +1,5 @@
 import itertools
-from typing import List, Set, Dict, Any
+from typing import List, Set, Dict, Tuple, Any
 from types import ModuleType
 import importlib
 import os
@@ -20,7 +20,19 @@ def from_import(module_name:str, attr_name:str)->type:
     
     return getattr(_module_map[module_name], attr_name)
 
+_number_types:Set[type] = {
+    float, bool, int, Decimal,
+    ctypes.c_bool, ctypes.c_int8, ctypes.c_uint8,
+    ctypes.c_int16, ctypes.c_uint16,
+    ctypes.c_int32, ctypes.c_uint32,
+    ctypes.c_int64, ctypes.c_uint64,
+    ctypes.c_float, ctypes.c_double, ctypes.c_longdouble
+}
+
 def is_number(value:Any)->bool:
+    if value.__class__ in _number_types:
+        return True
+
     return isinstance(value, (
         float, bool, int, Decimal,
         ctypes.c_bool, ctypes.c_int8, ctypes.c_uint8,
@@ -57,6 +69,31 @@ def generate_setter_swizzles(char_sets:List[str])->Set[str]:
     
     return result
 
+swizzle_namespaces:List[str] = ['xyzw', 'rgba', 'stpq']
+
+swizzle_index_map:Dict[str, int] = {
+    ch: index
+    for namespace in swizzle_namespaces
+    for index, ch in enumerate(namespace)
+}
+
+getter_swizzles_map:Dict[int, Set[str]] = {
+    n: set(generate_getter_swizzles(namespace[:n] for namespace in swizzle_namespaces))
+    for n in range(2, 5)
+}
+
+setter_swizzles_map:Dict[int, Set[str]] = {
+    n: set(generate_setter_swizzles(namespace[:n] for namespace in swizzle_namespaces))
+    for n in range(2, 5)
+}
+
+total_swizzles:Set[str] = getter_swizzles_map[4]
+
+swizzle_indices_map:Dict[str, Tuple[int]] = {
+    swizzle: tuple(swizzle_index_map[ch] for ch in swizzle)
+    for swizzle in total_swizzles
+}
+
 def generate_swizzle_defines(type_name:str, dtype_name:str, char_sets:List[str])->str:
     result:str = ""
     vec_basename = type_name[:-1]
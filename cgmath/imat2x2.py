@@ -5,6 +5,8 @@ import ctypes
 
 class imat2x2(genMat2x2):
 
+    __slots__ = ()
+
     @property
     def dtype(self)->type:
         return ctypes.c_int
@@ -0,0 +1,9 @@
+from .genMatArray import genMatArray
+from .imat2x2 import imat2x2
+
+
+class imat2x2array(genMatArray):
+
+    element_type = imat2x2
+
+imat2array = imat2x2array
\ No newline at end of file
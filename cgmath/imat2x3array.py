@@ -0,0 +1,7 @@
+from .genMatArray import genMatArray
+from .imat2x3 import imat2x3
+
+
+class imat2x3array(genMatArray):
+
+    element_type = imat2x3
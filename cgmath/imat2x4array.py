@@ -0,0 +1,7 @@
+from .genMatArray import genMatArray
+from .imat2x4 import imat2x4
+
+
+class imat2x4array(genMatArray):
+
+    element_type = imat2x4
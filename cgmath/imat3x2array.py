@@ -0,0 +1,7 @@
+from .genMatArray import genMatArray
+from .imat3x2 import imat3x2
+
+
+class imat3x2array(genMatArray):
+
+    element_type = imat3x2
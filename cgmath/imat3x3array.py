@@ -0,0 +1,9 @@
+from .genMatArray import genMatArray
+from .imat3x3 import imat3x3
+
+
+class imat3x3array(genMatArray):
+
+    element_type = imat3x3
+
+imat3array = imat3x3array
\ No newline at end of file
@@ -0,0 +1,7 @@
+from .genMatArray import genMatArray
+from .imat3x4 import imat3x4
+
+
+class imat3x4array(genMatArray):
+
+    element_type = imat3x4
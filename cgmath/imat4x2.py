@@ -5,6 +5,8 @@ import ctypes
 
 class imat4x2(genMat4x2):
 
+    __slots__ = ()
+
     @property
     def dtype(self)->type:
         return ctypes.c_int
\ No newline at end of file
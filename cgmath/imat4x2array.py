@@ -0,0 +1,7 @@
+from .genMatArray import genMatArray
+from .imat4x2 import imat4x2
+
+
+class imat4x2array(genMatArray):
+
+    element_type = imat4x2
@@ -5,6 +5,8 @@ import ctypes
 
 class imat4x3(genMat4x3):
 
+    __slots__ = ()
+
     @property
     def dtype(self)->type:
         return ctypes.c_int
\ No newline at end of file
@@ -0,0 +1,7 @@
+from .genMatArray import genMatArray
+from .imat4x3 import imat4x3
+
+
+class imat4x3array(genMatArray):
+
+    element_type = imat4x3
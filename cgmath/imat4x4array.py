@@ -0,0 +1,9 @@
+from .genMatArray import genMatArray
+from .imat4x4 import imat4x4
+
+
+class imat4x4array(genMatArray):
+
+    element_type = imat4x4
+
+imat4array = imat4x4array
\ No newline at end of file
@@ -0,0 +1,7 @@
+from .genVecArray import genVecArray
+from .ivec2 import ivec2
+
+
+class ivec2array(genVecArray):
+
+    element_type = ivec2
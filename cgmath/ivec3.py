@@ -4,6 +4,8 @@ import ctypes
 
 
 class ivec3(genVec3):
+
+    __slots__ = ()
     
     @property
     def dtype(self)->type:
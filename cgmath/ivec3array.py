@@ -0,0 +1,7 @@
+from .genVecArray import genVecArray
+from .ivec3 import ivec3
+
+
+class ivec3array(genVecArray):
+
+    element_type = ivec3
@@ -0,0 +1,7 @@
+from .genVecArray import genVecArray
+from .ivec4 import ivec4
+
+
+class ivec4array(genVecArray):
+
+    element_type = ivec4
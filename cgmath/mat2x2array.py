@@ -0,0 +1,9 @@
+from .genMatArray import genMatArray
+from .mat2x2 import mat2x2
+
+
+class mat2x2array(genMatArray):
+
+    element_type = mat2x2
+
+mat2array = mat2x2array
\ No newline at end of file
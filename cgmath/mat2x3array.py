@@ -0,0 +1,7 @@
+from .genMatArray import genMatArray
+from .mat2x3 import mat2x3
+
+
+class mat2x3array(genMatArray):
+
+    element_type = mat2x3
@@ -5,6 +5,8 @@ import ctypes
 
 class mat2x4(genMat2x4):
 
+    __slots__ = ()
+
     @property
     def dtype(self)->type:
         return ctypes.c_float
\ No newline at end of file
@@ -0,0 +1,7 @@
+from .genMatArray import genMatArray
+from .mat2x4 import mat2x4
+
+
+class mat2x4array(genMatArray):
+
+    element_type = mat2x4
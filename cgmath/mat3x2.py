@@ -5,6 +5,8 @@ import ctypes
 
 class mat3x2(genMat3x2):
 
+    __slots__ = ()
+
     @property
     def dtype(self)->type:
         return ctypes.c_float
\ No newline at end of file
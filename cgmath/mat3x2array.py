@@ -0,0 +1,7 @@
+from .genMatArray import genMatArray
+from .mat3x2 import mat3x2
+
+
+class mat3x2array(genMatArray):
+
+    element_type = mat3x2
@@ -5,6 +5,8 @@ import ctypes
 
 class mat3x3(genMat3x3):
 
+    __slots__ = ()
+
     @property
     def dtype(self)->type:
         return ctypes.c_float
@@ -0,0 +1,9 @@
+from .genMatArray import genMatArray
+from .mat3x3 import mat3x3
+
+
+class mat3x3array(genMatArray):
+
+    element_type = mat3x3
+
+mat3array = mat3x3array
\ No newline at end of file
@@ -0,0 +1,7 @@
+from .genMatArray import genMatArray
+from .mat3x4 import mat3x4
+
+
+class mat3x4array(genMatArray):
+
+    element_type = mat3x4
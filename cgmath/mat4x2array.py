@@ -0,0 +1,7 @@
+from .genMatArray import genMatArray
+from .mat4x2 import mat4x2
+
+
+class mat4x2array(genMatArray):
+
+    element_type = mat4x2
@@ -0,0 +1,7 @@
+from .genMatArray import genMatArray
+from .mat4x3 import mat4x3
+
+
+class mat4x3array(genMatArray):
+
+    element_type = mat4x3
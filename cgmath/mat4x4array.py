@@ -0,0 +1,9 @@
+from .genMatArray import genMatArray
+from .mat4x4 import mat4x4
+
+
+class mat4x4array(genMatArray):
+
+    element_type = mat4x4
+
+mat4array = mat4x4array
\ No newline at end of file
@@ -5,6 +5,8 @@ from .genQuat import genQuat
 
 class quat(genQuat):
 
+    __slots__ = ()
+
     @property
     def dtype(self)->type:
         return ctypes.c_float
\ No newline at end of file
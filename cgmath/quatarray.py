@@ -0,0 +1,7 @@
+from .genQuatArray import genQuatArray
+from .quat import quat
+
+
+class quatarray(genQuatArray):
+
+    element_type = quat
@@ -5,6 +5,8 @@ import ctypes
 
 class umat2x2(genMat2x2):
 
+    __slots__ = ()
+
     @property
     def dtype(self)->type:
         return ctypes.c_uint
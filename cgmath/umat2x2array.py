@@ -0,0 +1,9 @@
+from .genMatArray import genMatArray
+from .umat2x2 import umat2x2
+
+
+class umat2x2array(genMatArray):
+
+    element_type = umat2x2
+
+umat2array = umat2x2array
\ No newline at end of file
@@ -0,0 +1,7 @@
+from .genMatArray import genMatArray
+from .umat2x3 import umat2x3
+
+
+class umat2x3array(genMatArray):
+
+    element_type = umat2x3
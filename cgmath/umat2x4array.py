@@ -0,0 +1,7 @@
+from .genMatArray import genMatArray
+from .umat2x4 import umat2x4
+
+
+class umat2x4array(genMatArray):
+
+    element_type = umat2x4
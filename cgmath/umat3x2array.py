@@ -0,0 +1,7 @@
+from .genMatArray import genMatArray
+from .umat3x2 import umat3x2
+
+
+class umat3x2array(genMatArray):
+
+    element_type = umat3x2
@@ -0,0 +1,9 @@
+from .genMatArray import genMatArray
+from .umat3x3 import umat3x3
+
+
+class umat3x3array(genMatArray):
+
+    element_type = umat3x3
+
+umat3array = umat3x3array
\ No newline at end of file
@@ -5,6 +5,8 @@ import ctypes
 
 class umat3x4(genMat3x4):
 
+    __slots__ = ()
+
     @property
     def dtype(self)->type:
         return ctypes.c_uint
\ No newline at end of file
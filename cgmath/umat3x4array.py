@@ -0,0 +1,7 @@
+from .genMatArray import genMatArray
+from .umat3x4 import umat3x4
+
+
+class umat3x4array(genMatArray):
+
+    element_type = umat3x4
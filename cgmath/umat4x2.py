@@ -5,6 +5,8 @@ import ctypes
 
 class umat4x2(genMat4x2):
 
+    __slots__ = ()
+
     @property
     def dtype(self)->type:
         return ctypes.c_uint
\ No newline at end of file
@@ -0,0 +1,7 @@
+from .genMatArray import genMatArray
+from .umat4x2 import umat4x2
+
+
+class umat4x2array(genMatArray):
+
+    element_type = umat4x2
@@ -0,0 +1,7 @@
+from .genMatArray import genMatArray
+from .umat4x3 import umat4x3
+
+
+class umat4x3array(genMatArray):
+
+    element_type = umat4x3
@@ -0,0 +1,9 @@
+from .genMatArray import genMatArray
+from .umat4x4 import umat4x4
+
+
+class umat4x4array(genMatArray):
+
+    element_type = umat4x4
+
+umat4array = umat4x4array
\ No newline at end of file
@@ -0,0 +1,7 @@
+from .genVecArray import genVecArray
+from .uvec2 import uvec2
+
+
+class uvec2array(genVecArray):
+
+    element_type = uvec2
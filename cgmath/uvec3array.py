@@ -0,0 +1,7 @@
+from .genVecArray import genVecArray
+from .uvec3 import uvec3
+
+
+class uvec3array(genVecArray):
+
+    element_type = uvec3
@@ -0,0 +1,7 @@
+from .genVecArray import genVecArray
+from .uvec4 import uvec4
+
+
+class uvec4array(genVecArray):
+
+    element_type = uvec4
@@ -5,6 +5,8 @@ import ctypes
 
 class vec2(genVec2):
 
+    __slots__ = ()
+
     @property
     def dtype(self)->type:
         return ctypes.c_float
\ No newline at end of file
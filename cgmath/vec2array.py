@@ -0,0 +1,7 @@
+from .genVecArray import genVecArray
+from .vec2 import vec2
+
+
+class vec2array(genVecArray):
+
+    element_type = vec2
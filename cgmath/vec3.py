@@ -4,6 +4,8 @@ import ctypes
 
 
 class vec3(genVec3):
+
+    __slots__ = ()
     
     @property
     def dtype(self)->type:
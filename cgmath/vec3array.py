@@ -0,0 +1,7 @@
+from .genVecArray import genVecArray
+from .vec3 import vec3
+
+
+class vec3array(genVecArray):
+
+    element_type = vec3
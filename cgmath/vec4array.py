@@ -0,0 +1,7 @@
+from .genVecArray import genVecArray
+from .vec4 import vec4
+
+
+class vec4array(genVecArray):
+
+    element_type = vec4
@@ -2,10 +2,14 @@ from .SameTypeList import SameTypeList
 from .GLInfo import GLInfo
 from .helper import sizeof
 from .VBO import VBO
+from .StreamVBO import StreamVBO
 from .Increment import Increment
+from .DirtyRanges import DirtyRanges
+from .VertexFormat import VertexFormat
 
 from OpenGL import GL
 import numpy as np
+import cgmath as cgm
 from typing import Union
 
 
@@ -13,17 +17,23 @@ class AttrList(SameTypeList):
 
     def __init__(
         self,
-        _list: Union[list, np.ndarray] = None,
+        _list: Union[list, np.ndarray, cgm.genArray] = None,
         draw_type: GLInfo.draw_types = GL.GL_STATIC_DRAW,
         dtype: GLInfo.attr_types = None,
+        numpy_storage: bool = False,
+        compression: str = None,
     ):
-        SameTypeList.__init__(self, _list, dtype)
+        SameTypeList.__init__(self, _list, dtype, numpy_storage)
 
         self._draw_type = draw_type
         self._vbo = VBO()
 
         self.stride = 0
         self.is_new_vbo = False
+        self._stream_ranges = []
+
+        self._compression = None
+        self.compression = compression
 
     @property
     def draw_type(self) -> GLInfo.draw_types:
@@ -31,7 +41,57 @@ class AttrList(SameTypeList):
 
     @draw_type.setter
     def draw_type(self, draw_type: GLInfo.draw_types):
+        if self._draw_type == draw_type:
+            return
+
         self._draw_type = draw_type
+        self._increment = None
+
+    @property
+    def compression(self) -> str:
+        return self._compression
+
+    @compression.setter
+    def compression(self, vertex_format: str):
+        if self._compression == vertex_format:
+            return
+
+        if vertex_format is not None:
+            VertexFormat.check(vertex_format, self.dtype)
+
+        self._compression = vertex_format
+        self._increment = None
+
+    @property
+    def feed_type(self):
+        if self._compression is None:
+            return self.dtype
+
+        return VertexFormat.feed_type(self._compression, self.dtype)
+
+    @property
+    def element_nbytes(self) -> int:
+        if self._compression is None:
+            return sizeof(self.const_get(0))
+
+        return VertexFormat.nbytes(self._compression, self.dtype)
+
+    def _encode(self, value_array: np.ndarray) -> np.ndarray:
+        if self._compression is None:
+            return value_array
+
+        return VertexFormat.encode(self._compression, value_array)
+
+    @property
+    def streaming(self) -> bool:
+        return self._draw_type == GL.GL_STREAM_DRAW and StreamVBO.supported()
+
+    @property
+    def offset(self) -> int:
+        if isinstance(self._vbo, StreamVBO):
+            return self._vbo.offset
+
+        return 0
 
     @property
     def dtype(self) -> GLInfo.attr_types:
@@ -54,13 +114,124 @@ class AttrList(SameTypeList):
         self.stride = sizeof(dtype)
         self._increment = None
 
+    def _share(self):
+        return self._share_into(
+            AttrList(draw_type=self._draw_type, dtype=self._dtype, compression=self._compression)
+        )
+
+    def _same_layout(self, source) -> bool:
+        return (
+            self._dtype == source._dtype
+            and self._compression == source._compression
+            and self._draw_type == source._draw_type
+        )
+
+    def _detach(self) -> None:
+        self._vbo = VBO()
+        self._increment = None
+
     def _apply(self) -> None:
         self._check_in_items()
+        source = self._shared_source()
+        if source is not None:
+            source._apply()
+            if self._vbo is not source._vbo or self.stride != source.stride:
+                self._vbo = source._vbo
+                self.stride = source.stride
+                self.is_new_vbo = True
+            return
+
+        if self.streaming:
+            self.__stream_apply()
+            return
+
         if self._increment is None:
             self.__first_apply()
-        elif self._increment.is_changed:
+            return
+
+        if self._increment.is_changed:
             self.__apply_increment()
 
+        self._upload_dirty_ranges(self._vbo, self.stride)
+
+    def __stream_apply(self) -> None:
+        if not self:
+            return
+
+        nbytes = len(self) * self.stride
+        if (
+            self._increment is None
+            or not isinstance(self._vbo, StreamVBO)
+            or self._vbo.segment_nbytes < nbytes
+        ):
+            self._increment = Increment(self)
+            self._dirty_ranges.clear()
+
+            self._vbo.delete()
+            self._vbo = StreamVBO()
+            self.stride = self.element_nbytes
+            self._vbo.malloc(self.capacity * self.stride)
+            self._vbo.write(0, len(self) * self.stride, self._encode(self.ndarray))
+            self._stream_ranges = [[(0, len(self))]]
+            self.is_new_vbo = True
+            return
+
+        if not self._increment.is_changed and not self._dirty_ranges:
+            return
+
+        if self._increment.is_changed:
+            self._increment.patch()
+            self._dirty_ranges.clear()
+            ranges = [(0, len(self))]
+        else:
+            self._dirty_ranges.clip(len(self))
+            ranges = list(self._dirty_ranges)
+            self._dirty_ranges.clear()
+
+        # the next segment was last written n_segments updates ago,
+        # so replay the rows changed since then instead of the whole array
+        stale_ranges = DirtyRanges()
+        for past_ranges in self._stream_ranges:
+            for start, stop in past_ranges:
+                stale_ranges.add(start, stop)
+        for start, stop in ranges:
+            stale_ranges.add(start, stop)
+        stale_ranges.clip(len(self))
+
+        self._stream_ranges.append(ranges)
+        del self._stream_ranges[: -(self._vbo.n_segments - 1)]
+
+        self._vbo.advance()
+        value_array = self.ndarray
+        for start, stop in stale_ranges:
+            self._vbo.bufferSubData(
+                start * self.stride, (stop - start) * self.stride, self._encode(value_array[start:stop])
+            )
+        self.is_new_vbo = True
+
+    def stream_view(self, start: int = 0, stop: int = None) -> np.ndarray:
+        if not self.streaming:
+            raise RuntimeError("stream_view is only available for GL_STREAM_DRAW AttrList when buffer storage is supported")
+
+        self._check_in_items()
+        self._change_to_ndarray()
+        if self._buffer is None:
+            raise RuntimeError("stream_view needs the AttrList dtype to be known")
+
+        len_self = len(self._list)
+        if stop is None:
+            stop = len_self
+        if start < 0 or stop > len_self or start > stop:
+            raise IndexError(f"stream range [{start}, {stop}) is out of {len_self} rows")
+
+        self._reserve(len_self)
+        self._mark_dirty(start, stop)
+        self._list_ndarray = self._list
+        self._list_dirty = False
+        self._should_retest = True
+        self._update_version()
+        return self._list[start:stop]
+
     def __first_apply(self) -> None:
         if not self:
             return
@@ -68,13 +239,18 @@ class AttrList(SameTypeList):
         if self._increment is None:
             self._increment = Increment(self)
 
+        self._dirty_ranges.clear()
+
         if self._vbo.nbytes > 0 or self._vbo.id > 0:
             self._vbo.delete()
 
-        self.stride = sizeof(self.const_get(0))
+        if isinstance(self._vbo, StreamVBO):
+            self._vbo = VBO()
+
+        self.stride = self.element_nbytes
         self._vbo.malloc(self.capacity * self.stride, self._draw_type)
 
-        value_array = self.ndarray
+        value_array = self._encode(self.ndarray)
         self._vbo.bufferSubData(0, value_array.nbytes, value_array)
 
         self.is_new_vbo = True
@@ -113,7 +289,7 @@ class AttrList(SameTypeList):
         patch_update = patch["update"]
 
         if new_data and patch_update:
-            temp_buffer = np.array(new_data)
+            temp_buffer = self._encode(np.array(new_data))
             if len(patch_update) > 1:
                 temp_vbo = VBO()
                 temp_vbo.bufferData(temp_buffer, self._draw_type)
@@ -139,10 +139,10 @@ class CSRMat:
         del self.data[start : stop]
         del self.indptr[row_start : row_stop]
         
-        delta = row_stop - row_start
+        delta = stop - start
         for i in range(row_start, len(self.indptr)):
             self.indptr[i] -= delta
 
-        delta = stop - start
+        delta = row_stop - row_start
         for i in range(start, len(self.row_indices)):
             self.row_indices[i] -= delta
@@ -1,20 +1,60 @@
 from OpenGL import GL
+import os
+import re
 import warnings
 
 from .GPUProgram import GPUProgram, LinkError, LinkWarning
 from .Shaders import ComputeShader
 from .GLConfig import GLConfig
 from .GlassConfig import GlassConfig
+from .utils import printable_path
 
 
 class ComputeProgram(GPUProgram):
 
+    __work_group_size_pattern = re.compile(
+        r"layout\s*\((?P<qualifiers>[^)]*local_size_[xyz][^)]*)\)\s*in\s*;"
+    )
+
     def __init__(self) -> None:
         GPUProgram.__init__(self)
-        self.compute_shader = ComputeShader()
+        self.compute_shader = ComputeShader(self)
         self._work_group_size: tuple = None
         self._should_join: bool = False
 
+        self._include_paths: list = []
+        self._defines: dict = {}
+
+    def define(self, name: str, value=None) -> bool:
+        if name in self._defines and self._defines[name] == value:
+            return False
+
+        self._defines[name] = value
+        return True
+
+    def undef(self, name: str) -> bool:
+        if name not in self._defines:
+            return False
+
+        del self._defines[name]
+        return True
+
+    @property
+    def defines(self) -> dict:
+        return self._defines.copy()
+
+    def add_include_path(self, include_path: str):
+        full_name = os.path.abspath(include_path).replace("\\", "/")
+        if self._include_paths and self._include_paths[0] == full_name:
+            return False
+
+        self._include_paths.insert(0, full_name)
+        return True
+
+    @property
+    def include_paths(self) -> list:
+        return self._include_paths
+
     @staticmethod
     def _check_work_group_size(work_group_size: tuple) -> None:
         max_work_group_size = GLConfig.max_compute_work_group_size
@@ -84,67 +124,98 @@ class ComputeProgram(GPUProgram):
                 + " were given"
             )
 
+    @staticmethod
+    def _parse_work_group_size(code: str) -> tuple:
+        work_group_size = [1, 1, 1]
+        for match in ComputeProgram.__work_group_size_pattern.finditer(code):
+            for qualifier in match.group("qualifiers").split(","):
+                if "=" not in qualifier:
+                    continue
+
+                name, value = qualifier.split("=")
+                name = name.strip()
+                if name in ("local_size_x", "local_size_y", "local_size_z"):
+                    work_group_size["xyz".index(name[-1])] = int(value.strip())
+
+        return tuple(work_group_size)
+
     def compile(self, file_name: str) -> None:
-        self.compute_shader = ComputeShader.load(file_name)
+        self.compute_shader.compile(file_name)
+        shader_parser = self.compute_shader._shader_parser
 
-        self._work_group_size = self.compute_shader.work_group_side
-        self._uniforms_info = self.compute_shader.uniforms_info
-        self._uniform_blocks_info = self.compute_shader.uniform_blocks_info
-        self._shader_storage_blocks_info = (
-            self.compute_shader._shader_storage_blocks_info
-        )
-        self._structs_info = self.compute_shader._structs_info
+        self._work_group_size = ComputeProgram._parse_work_group_size(shader_parser.clean_code)
+        self._uniforms.update_info(shader_parser.uniforms)
+        self._uniform_blocks.info.update(shader_parser.uniform_blocks)
+        self._shader_storage_blocks.info.update(shader_parser.shader_storage_blocks)
+        self._structs_info.update(shader_parser.structs)
 
         ComputeProgram._check_work_group_size(self._work_group_size)
 
+        self._is_collected = False
         self._is_linked = False
 
-    def _apply(self) -> None:
-        if not self._linked_but_not_applied:
+    def collect_info(self) -> None:
+        if self._is_collected:
             return
 
+        if not self.compute_shader.is_compiled:
+            raise RuntimeError("should compile compute shader before link")
+
+        self._resolve_uniforms()
+        self._is_collected = True
+        self._is_linked = False
+
+    def _link(self) -> None:
+        if self._is_linked:
+            return
+
+        self.delete()
+        self._id = GL.glCreateProgram()
         if self._id == 0:
-            self._id = GL.glCreateProgram()
-            if self._id == 0:
-                raise MemoryError("failed to create ComputeProgram")
+            raise MemoryError("failed to create ComputeProgram")
 
+        self.compute_shader._apply_compile()
         GL.glAttachShader(self._id, self.compute_shader._id)
-        GL.glLinkProgram(self._id)
-
-        if GlassConfig.debug:
-            message_bytes = GL.glGetProgramInfoLog(self._id)
-            message = message_bytes
-            if isinstance(message_bytes, bytes):
-                message = str(message_bytes, encoding="utf-8")
 
-            error_messages, warning_messages = self._format_error_warning(message)
-            if warning_messages and GlassConfig.warning:
-                warnings.warn("\n" + "\n".join(warning_messages), category=LinkWarning)
+        related_files = "\n  " + "\n  ".join(
+            [printable_path(file_name) for file_name in self.related_files]
+        )
+        if GlassConfig.print:
+            print(f"linking program: {related_files}")
 
-            if error_messages:
-                self._is_linked = False
-                raise LinkError("\n" + "\n".join(error_messages))
+        GL.glLinkProgram(self._id)
 
-        self._apply_uniform_blocks()
-        self._apply_shader_storage_blocks()
+        message_bytes = GL.glGetProgramInfoLog(self._id)
+        message = message_bytes
+        if isinstance(message_bytes, bytes):
+            message = str(message_bytes, encoding="utf-8")
 
-        self._linked_but_not_applied = True
+        error_messages, warning_messages = self._format_error_warning(message)
+        if warning_messages and GlassConfig.warning:
+            warning_message = (
+                f"Warning when linking following files:{related_files}\n"
+                + "\n".join(warning_messages)
+            )
+            warnings.warn(warning_message, category=LinkWarning)
 
-    def _link(self) -> None:
-        if self._is_linked:
-            return
+        if error_messages:
+            error_message = (
+                f"Error when linking following files:{related_files}\n"
+                + "\n".join(error_messages)
+            )
+            raise LinkError(error_message)
 
-        if not self.compute_shader.is_compiled:
-            raise RuntimeError("should compile compute shader before link")
+        status = GL.glGetProgramiv(self._id, GL.GL_LINK_STATUS)
+        if status != GL.GL_TRUE:
+            raise LinkError(message)
 
-        self._resolve_uniforms()
-        self._resolve_uniform_blocks()
-        self._resolve_shader_storage_blocks()
+        self._apply_uniform_blocks()
+        self._apply_shader_storage_blocks()
 
         self._is_linked = True
-        self._linked_but_not_applied = True
-        if GL.glCreateProgram:
-            self._apply()
+
+        if GlassConfig.print:
+            print("done")
 
     def start_computing(
         self,
@@ -156,6 +227,12 @@ class ComputeProgram(GPUProgram):
             (x_work_group_count, y_work_group_count, z_work_group_count)
         )
         self.use()
+        self._uniforms._apply_waiting_set()
+        if self._uniform_blocks.auto_upload:
+            self._uniform_blocks.upload()
+        if self._shader_storage_blocks.auto_upload:
+            self._shader_storage_blocks.upload()
+
         GL.glDispatchCompute(x_work_group_count, y_work_group_count, z_work_group_count)
         self._should_join = True
 
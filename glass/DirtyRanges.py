@@ -0,0 +1,91 @@
+import numpy as np
+
+
+class DirtyRanges:
+
+    def __init__(self, gap: int = 0):
+        self.gap = gap
+        self._starts = np.empty(0, dtype=np.int64)
+        self._stops = np.empty(0, dtype=np.int64)
+        self._pending_starts = []
+        self._pending_stops = []
+
+    def add(self, start: int, stop: int = None) -> None:
+        if stop is None:
+            stop = start + 1
+
+        if stop <= start:
+            return
+
+        if self._pending_stops and self._pending_starts[-1] <= start <= self._pending_stops[-1] + self.gap:
+            if stop > self._pending_stops[-1]:
+                self._pending_stops[-1] = stop
+            return
+
+        self._pending_starts.append(start)
+        self._pending_stops.append(stop)
+
+    def add_indices(self, indices) -> None:
+        indices = np.unique(np.asarray(indices, dtype=np.int64))
+        if len(indices) == 0:
+            return
+
+        breaks = np.nonzero(np.diff(indices) > self.gap + 1)[0]
+        self._extend(
+            indices[np.concatenate(([0], breaks + 1))],
+            indices[np.concatenate((breaks, [len(indices) - 1]))] + 1,
+        )
+
+    def _extend(self, starts: np.ndarray, stops: np.ndarray) -> None:
+        self._flush_pending()
+        self._starts = np.concatenate((self._starts, starts))
+        self._stops = np.concatenate((self._stops, stops))
+
+    def _flush_pending(self) -> None:
+        if not self._pending_starts:
+            return
+
+        self._starts = np.concatenate((self._starts, np.array(self._pending_starts, dtype=np.int64)))
+        self._stops = np.concatenate((self._stops, np.array(self._pending_stops, dtype=np.int64)))
+        self._pending_starts.clear()
+        self._pending_stops.clear()
+
+    def merged(self):
+        self._flush_pending()
+        if len(self._starts) <= 1:
+            return self._starts, self._stops
+
+        order = np.argsort(self._starts, kind="stable")
+        starts = self._starts[order]
+        stops = np.maximum.accumulate(self._stops[order])
+        new_group = np.empty(len(starts), dtype=bool)
+        new_group[0] = True
+        new_group[1:] = starts[1:] > stops[:-1] + self.gap
+        group_starts = np.nonzero(new_group)[0]
+        group_stops = np.concatenate((group_starts[1:], [len(starts)])) - 1
+
+        self._starts = starts[group_starts]
+        self._stops = stops[group_stops]
+        return self._starts, self._stops
+
+    def clip(self, length: int) -> None:
+        starts, stops = self.merged()
+        keep = starts < length
+        self._starts = starts[keep]
+        self._stops = np.minimum(stops[keep], length)
+
+    def clear(self) -> None:
+        self._starts = np.empty(0, dtype=np.int64)
+        self._stops = np.empty(0, dtype=np.int64)
+        self._pending_starts.clear()
+        self._pending_stops.clear()
+
+    def __iter__(self):
+        starts, stops = self.merged()
+        return zip(starts.tolist(), stops.tolist())
+
+    def __len__(self):
+        return len(self.merged()[0])
+
+    def __bool__(self):
+        return bool(self._pending_starts) or len(self._starts) > 0
@@ -794,6 +794,8 @@ class GLInfo:
 
     triangle_types: TypeAlias = CustomLiteral[GL.GL_TRIANGLES, GL.GL_TRIANGLE_STRIP, GL.GL_TRIANGLE_FAN]
 
+    index_types: TypeAlias = CustomLiteral[GL.GL_UNSIGNED_SHORT, GL.GL_UNSIGNED_INT]
+
     line_types: TypeAlias = CustomLiteral[GL.GL_LINES, GL.GL_LINE_LOOP, GL.GL_LINE_STRIP]
 
     primitive_types: TypeAlias = CustomLiteral[GL.GL_TRIANGLES, GL.GL_TRIANGLE_STRIP, GL.GL_TRIANGLE_FAN, GL.GL_LINES, GL.GL_LINE_LOOP, GL.GL_LINE_STRIP, GL.GL_POINTS, GL.GL_PATCHES]
@@ -48,7 +48,7 @@ class Increment(CSRMat):
                 self.data.append(value)
                 self.col_indices.append(self.cols - 1)
                 self.row_indices.append(self.rows)
-                self.indptr.append(len_data)
+                self.indptr.append(len_data + 1)
 
             self._is_changed = True
 
@@ -119,7 +119,7 @@ class Increment(CSRMat):
             last_i = -2
             update = None
             len_new_data = len(result["new_data"])
-            for i, d in col_dict[self_cols_1].items():
+            for i, d in col_dict.get(self_cols_1, {}).items():
                 result["new_data"].append(d)
                 len_new_data += 1
                 if i != last_i + 1:
@@ -130,8 +130,8 @@ class Increment(CSRMat):
 
                 last_i = i
 
-            delta = 0
-
+            left_moves = []
+            right_moves = []
             move = None
             for j in sorted(col_dict.keys()):
                 if len(col_dict[j]) != 1 or j == self_cols_1:
@@ -141,15 +141,24 @@ class Increment(CSRMat):
                     assert col_dict[j][i] == 1
                     current_delta = i - j
                     if current_delta == 0:
+                        move = None
                         continue
 
-                    if current_delta != delta:
+                    if (
+                        move is None
+                        or current_delta != move["new_start"] - move["old_start"]
+                        or j != move["old_start"] + move["size"]
+                    ):
                         move = {"old_start": j, "size": 1, "new_start": i}
-                        result["move"].insert(0, move)
-                        delta = current_delta
+                        if current_delta < 0:
+                            left_moves.append(move)
+                        else:
+                            right_moves.insert(0, move)
                     else:
                         move["size"] += 1
 
+            result["move"] = left_moves + right_moves
+
             CSRMat.__init__(self, self_rows, self_rows + 1, eye=True)
             self._is_changed = False
 
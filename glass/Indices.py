@@ -18,17 +18,30 @@ class Indices(SameTypeList):
         _list: Union[list, np.ndarray] = None,
         draw_type: GLInfo.draw_types = GL.GL_STATIC_DRAW,
         dtype=None,
+        index_type: GLInfo.index_types = None,
     ):
         SameTypeList.__init__(self, _list, cgm.uvec3)
 
-        self.stride = sizeof(cgm.uvec3)
+        self.stride = sizeof(cgm.uvec3())
         self._ebo = EBO()
         self._draw_type = draw_type
+        self._index_type = index_type
+        self._gl_type = GL.GL_UNSIGNED_INT
 
         self._temp_buffer = None
         self._temp_buffer_changed = False
         self._temp_ebo = EBO()
 
+    def _share(self):
+        return self._share_into(Indices(draw_type=self._draw_type, index_type=self._index_type))
+
+    def _same_layout(self, source) -> bool:
+        return self._dtype == source._dtype and self._index_type == source._index_type
+
+    def _detach(self) -> None:
+        self._ebo = EBO()
+        self._increment = None
+
     def _check_type(self, triangle):
         if not isinstance(triangle, cgm.uvec3):
             raise TypeError("indices should be in type uvec3")
@@ -48,6 +61,60 @@ class Indices(SameTypeList):
     def draw_type(self, value):
         self._draw_type = value
 
+    @property
+    def index_type(self):
+        return self._index_type
+
+    @index_type.setter
+    @checktype
+    def index_type(self, index_type: GLInfo.index_types):
+        if self._index_type == index_type:
+            return
+
+        self._index_type = index_type
+        self._increment = None
+
+    @property
+    def gl_type(self):
+        if self._temp_buffer is not None:
+            return GL.GL_UNSIGNED_INT
+
+        return self._gl_type
+
+    def _encode(self, value_array: np.ndarray) -> np.ndarray:
+        if self._gl_type == GL.GL_UNSIGNED_SHORT:
+            return value_array.astype(np.uint16)
+
+        return value_array.astype(np.uint32, copy=False)
+
+    def __select_gl_type(self):
+        if self._index_type is not None:
+            self._gl_type = self._index_type
+        elif self.ndarray.max() <= 0xFFFF:
+            self._gl_type = GL.GL_UNSIGNED_SHORT
+        else:
+            self._gl_type = GL.GL_UNSIGNED_INT
+
+        self.stride = 6 if self._gl_type == GL.GL_UNSIGNED_SHORT else sizeof(cgm.uvec3())
+
+    def __overflows(self, patch) -> bool:
+        if self._gl_type != GL.GL_UNSIGNED_SHORT:
+            return False
+
+        if patch is not None and patch["new_data"] and np.max(np.array(patch["new_data"])) > 0xFFFF:
+            return True
+
+        if not self._dirty_ranges:
+            return False
+
+        self._dirty_ranges.clip(len(self))
+        value_array = self.ndarray
+        for start, stop in self._dirty_ranges:
+            if value_array[start:stop].max() > 0xFFFF:
+                return True
+
+        return False
+
     @property
     def temp_buffer(self):
         return self._temp_buffer
@@ -70,16 +137,29 @@ class Indices(SameTypeList):
 
         self._increment = Increment(self)
 
-        if self._ebo.nbytes == 0:
-            self._ebo.bufferData(self.buffer, draw_type=self._draw_type)
+        self._dirty_ranges.clear()
+
+        self.__select_gl_type()
+        self._ebo.bufferData(self.buffer, draw_type=self._draw_type)
 
         return True
 
     def _apply_increment(self):
-        if not self._increment.is_changed:
+        patch = None
+        if self._increment.is_changed:
+            patch = self._increment.patch()
+
+        if self.__overflows(patch):
+            self._increment = None
+            self._first_apply()
             return
 
-        patch = self._increment.patch()
+        if patch is not None:
+            self.__apply_patch(patch)
+
+        self._upload_dirty_ranges(self._ebo, self.stride)
+
+    def __apply_patch(self, patch):
 
         if patch["old_capacity"] == patch["new_capacity"]:
             for move in patch["move"]:
@@ -110,7 +190,7 @@ class Indices(SameTypeList):
         len_patch_update = len(patch_update)
 
         if new_data and patch_update:
-            temp_buffer = np.array(new_data).tobytes()
+            temp_buffer = self._encode(np.array(new_data, dtype=np.uint32)).tobytes()
             if len_patch_update > 1:
                 temp_ebo = EBO()
                 temp_ebo.bufferData(temp_buffer, self._draw_type)
@@ -143,6 +223,14 @@ class Indices(SameTypeList):
                 self._temp_ebo.delete()
 
         self._check_in_items()
+        source = self._shared_source()
+        if source is not None:
+            source._apply()
+            self._ebo = source._ebo
+            self._gl_type = source._gl_type
+            self.stride = source.stride
+            self._ebo.bind()
+            return
 
         success = False
         if self._increment is None:
@@ -156,6 +244,6 @@ class Indices(SameTypeList):
 
     @property
     def buffer(self):
-        return bytearray(self.ndarray.tobytes()) + bytearray(
+        return bytearray(self._encode(self.ndarray).tobytes()) + bytearray(
             (self.capacity - len(self)) * self.stride
         )
@@ -20,7 +20,7 @@ class Instances(Vertices):
         self._path_index_map = {}
 
         if isinstance(values, (list, type(None))):
-            Vertices.__init__(self, values=values, draw_type=draw_type)
+            Vertices.__init__(self, values, draw_type=draw_type)
         else:
             Vertices.__init__(self, draw_type=draw_type)
             self.update(values)
@@ -58,7 +58,7 @@ class Instances(Vertices):
         if isinstance(index, str):
             path = index
             if path in self._path_index_map:
-                index = self._path_index_map[path]
+                index = self._path_index_map.pop(path)
                 Vertices.__delitem__(self, index)
                 for p in self._path_index_map:
                     i = self._path_index_map[p]
@@ -81,7 +81,7 @@ class Instances(Vertices):
         if isinstance(index, str):
             path = index
             if path in self._path_index_map:
-                index = self._path_index_map[path]
+                index = self._path_index_map.pop(path)
                 value = Vertices.pop(self, index)
                 for p in self._path_index_map:
                     i = self._path_index_map[p]
@@ -0,0 +1,123 @@
+from .VBO import VBO
+from .GLInfo import GLInfo
+from .VertexFormat import VertexFormat
+from .Increment import Increment
+from .DirtyRanges import DirtyRanges
+from .helper import nitems
+from .utils import capacity_of
+
+from OpenGL import GL
+import numpy as np
+
+
+class InterleavedVBO(VBO):
+
+    def __init__(self):
+        VBO.__init__(self)
+        self._packed = None
+        self._layout = None
+        self._offsets = {}
+        self._size = 0
+        self._dirty_ranges = DirtyRanges()
+        self.stride = 0
+        self.is_new_vbo = False
+
+    def offset_of(self, key: str) -> int:
+        return self._offsets[key]
+
+    def invalidate(self) -> None:
+        self._layout = None
+
+    @staticmethod
+    def _field_of(key, attr_list):
+        dtype = attr_list.dtype
+        if attr_list.compression is not None:
+            return (
+                key,
+                VertexFormat.np_dtype(attr_list.compression),
+                (VertexFormat.storage_items(attr_list.compression, dtype),),
+            )
+
+        if dtype in GLInfo.np_dtype_map:
+            return (key, GLInfo.np_dtype_map[dtype], (nitems(dtype),))
+
+        value_array = attr_list.ndarray
+        return (key, value_array.dtype, value_array.shape[1:])
+
+    def _apply(self, attr_list_map: dict, draw_type: GLInfo.draw_types = GL.GL_STATIC_DRAW) -> None:
+        len_self = 0
+        for attr_list in attr_list_map.values():
+            len_self = len(attr_list)
+            break
+
+        layout = tuple(
+            self._field_of(key, attr_list) for key, attr_list in attr_list_map.items()
+        )
+        should_rebuild = (layout != self._layout or len_self != self._size)
+        for attr_list in attr_list_map.values():
+            attr_list._check_in_items()
+            if attr_list._increment is None:
+                attr_list._increment = Increment(attr_list)
+                should_rebuild = True
+            elif attr_list._increment.is_changed:
+                attr_list._increment.patch()
+                should_rebuild = True
+
+        if should_rebuild:
+            self.__rebuild(attr_list_map, layout, len_self, draw_type)
+        else:
+            self.__update(attr_list_map)
+
+        for attr_list in attr_list_map.values():
+            attr_list._dirty_ranges.clear()
+
+    def __rebuild(self, attr_list_map: dict, layout: tuple, len_self: int, draw_type: GLInfo.draw_types) -> None:
+        packed_dtype = np.dtype(list(layout))
+        capacity = capacity_of(len_self)
+        if (
+            layout != self._layout
+            or self._packed is None
+            or len(self._packed) != capacity
+        ):
+            self._packed = np.zeros(capacity, dtype=packed_dtype)
+            self._offsets = {key: packed_dtype.fields[key][1] for key in packed_dtype.names}
+            self.stride = packed_dtype.itemsize
+            self.malloc(capacity * self.stride, draw_type)
+            self.is_new_vbo = True
+
+        for key, attr_list in attr_list_map.items():
+            field = self._packed[key]
+            field[:len_self] = attr_list._encode(attr_list.ndarray).reshape((len_self, *field.shape[1:]))
+
+        self._layout = layout
+        self._size = len_self
+        self._dirty_ranges.clear()
+        if len_self > 0:
+            self.bufferSubData(0, len_self * self.stride, self._packed[:len_self])
+
+    def __update(self, attr_list_map: dict) -> None:
+        for key, attr_list in attr_list_map.items():
+            if not attr_list._dirty_ranges:
+                continue
+
+            attr_list._dirty_ranges.clip(self._size)
+            field = self._packed[key]
+            value_array = attr_list.ndarray
+            for start, stop in attr_list._dirty_ranges:
+                field[start:stop] = attr_list._encode(value_array[start:stop]).reshape(
+                    (stop - start, *field.shape[1:])
+                )
+                self._dirty_ranges.add(start, stop)
+
+        for start, stop in self._dirty_ranges:
+            self.bufferSubData(
+                start * self.stride, (stop - start) * self.stride, self._packed[start:stop]
+            )
+
+        self._dirty_ranges.clear()
+
+    def delete(self) -> None:
+        VBO.delete(self)
+        self._packed = None
+        self._layout = None
+        self._size = 0
@@ -4,6 +4,7 @@ from glass import GLConfig
 class RenderHints:
 
     inherit = "inherit"
+    _generation = 0
     __all_attrs = {
         "__class__",
         "__delattr__",
@@ -83,6 +84,7 @@ class RenderHints:
 
             self._values[name] = value
 
+        RenderHints._generation += 1
         self.update_screens()
 
     def clear(self):
@@ -90,6 +92,7 @@ class RenderHints:
             return
 
         self._values.clear()
+        RenderHints._generation += 1
         self.update_screens()
 
     def update_screens(self):
@@ -4,13 +4,16 @@ import cgmath as cgm
 from typing import Union
 
 from .utils import capacity_of
-from .helper import nitems
+from .helper import nitems, element_type_of
 from .GlassConfig import GlassConfig
 from .GLInfo import GLInfo
+from .DirtyRanges import DirtyRanges
 
 
 class SameTypeList:
 
+    _detached_generation = 0
+
     class iterator:
         def __init__(self, _list):
             self.__list = _list
@@ -49,17 +52,104 @@ class SameTypeList:
             self.__current_index = 0
             return self
 
-    def __init__(self, _list: Union[list, np.ndarray] = None, dtype: type = None):
-        self.reset(_list, dtype)
+    class row_link:
+        def __init__(self, _list, index: int, value):
+            self.__list = _list
+            self.__index = index
+            self.__value = value
+
+        def __call__(self):
+            _list = self.__list
+            if not isinstance(_list._list, np.ndarray) or self.__index >= len(_list._list):
+                return
+
+            if not _list._list.flags.writeable:
+                _list._reserve(len(_list._list))
+
+            row = np.ctypeslib.as_array(self.__value._data)
+            _list._list[self.__index] = row.reshape(_list._list.shape[1:])
+            _list._list_ndarray = _list._list
+            _list._list_dirty = False
+            _list._should_retest = True
+            _list._update_version()
+            _list._mark_dirty(self.__index)
+
+    def __init__(
+        self,
+        _list: Union[list, np.ndarray, cgm.genArray] = None,
+        dtype: type = None,
+        numpy_storage: bool = False,
+    ):
+        self._version = 0
+        self._source = None
+        self._shared_buffer = None
+        self.reset(_list, dtype, numpy_storage)
+
+    def _update_version(self):
+        self._version += 1
+        if self._source is not None:
+            self._shared_source()
+
+    def _share_into(self, result):
+        self._change_to_ndarray()
+        if self._buffer is None:
+            return result
+
+        view = self._list.view()
+        view.flags.writeable = False
+        result.reset(view, self._dtype)
+        result._source = self
+        result._shared_buffer = view
+        return result
+
+    def _shared_source(self):
+        source = self._source
+        if source is None:
+            return None
+
+        if (
+            self._buffer is self._shared_buffer
+            and len(self._list) == len(self._shared_buffer)
+            and self._same_layout(source)
+        ):
+            return source
+
+        self._source = None
+        self._shared_buffer = None
+        self._detach()
+        SameTypeList._detached_generation += 1
+        return None
 
-    def reset(self, _list: Union[list, np.ndarray] = None, dtype: type = None):
+    @property
+    def _storage_id(self) -> int:
+        source = self._shared_source()
+        return id(self if source is None else source)
+
+    def _same_layout(self, source) -> bool:
+        return self._dtype == source._dtype
+
+    def _detach(self) -> None:
+        pass
+
+    def reset(
+        self,
+        _list: Union[list, np.ndarray, cgm.genArray] = None,
+        dtype: type = None,
+        numpy_storage: bool = False,
+    ):
         if _list is None:
             _list = []
+        elif isinstance(_list, cgm.genArray):
+            if dtype is None:
+                dtype = _list.element_type
+            _list = _list.ndarray.reshape(len(_list), -1)
 
         self._list = _list
+        self._buffer = _list if isinstance(_list, np.ndarray) else None
         self._list_ndarray = None
         self._list_dirty = True
         self._should_retest = True
+        self._update_version()
         self._data_list = []
 
         self._dtype = dtype
@@ -67,8 +157,28 @@ class SameTypeList:
             self._dtype = type(_list[0])
 
         self._increment = None
+        self._dirty_ranges = DirtyRanges()
         self._checked_out_items = {}
 
+        self._numpy_storage = numpy_storage or self._buffer is not None
+        if numpy_storage:
+            self._change_to_ndarray()
+
+    @property
+    def numpy_storage(self) -> bool:
+        return self._numpy_storage
+
+    @numpy_storage.setter
+    def numpy_storage(self, flag: bool):
+        self._numpy_storage = flag
+        if flag:
+            self._change_to_ndarray()
+        elif self._buffer is not None:
+            self._change_to_list()
+            self._list_dirty = True
+            self._should_retest = True
+            self._update_version()
+
     @property
     def ndarray(self) -> np.ndarray:
         if self._list_dirty:
@@ -97,15 +207,23 @@ class SameTypeList:
         return self._list_ndarray
 
     @ndarray.setter
-    def ndarray(self, array: np.ndarray):
+    def ndarray(self, array: Union[np.ndarray, cgm.genArray]):
+        if isinstance(array, cgm.genArray):
+            array = array.ndarray.reshape(len(array), -1)
+
         self._list_dirty = False
         self._should_retest = True
+        self._update_version()
         self._list_ndarray = array
         self._list = array
+        self._buffer = array
+        self._numpy_storage = True
 
         if self._increment is not None:
-            _list = list(map(lambda x: self._dtype(*x), self._list))
-            self._increment.reset(_list)
+            if self._increment.is_changed or len(array) != self._increment.rows:
+                self._increment = None
+            else:
+                self._mark_dirty(0, len(array))
 
     @classmethod
     def frombuffer(cls, buffer: Union[bytes, bytearray], dtype):
@@ -120,6 +238,59 @@ class SameTypeList:
         result = cls(np_array, dtype=dtype)
         return result
 
+    def set_range(self, start: int, array: Union[np.ndarray, cgm.genArray]):
+        self._check_in_items()
+
+        if self._dtype is None:
+            self._dtype = element_type_of(array) if not self else type(self._list[0])
+
+        if isinstance(array, cgm.genArray):
+            array = array.ndarray
+
+        self._change_to_ndarray()
+
+        array = np.asarray(array, dtype=self._list.dtype).reshape((-1, *self._list.shape[1:]))
+        len_self = len(self._list)
+        stop = start + len(array)
+        if start < 0 or start > len_self:
+            raise IndexError(start)
+
+        self._reserve(stop)
+        if stop > len_self:
+            self._list = self._buffer[:stop]
+            self._increment = None
+
+        self._list[start:stop] = array
+        self._mark_dirty(start, stop)
+        self._list_ndarray = self._list
+        self._list_dirty = False
+        self._should_retest = True
+        self._update_version()
+
+        return start, stop
+
+    def set_rows(self, indices: Union[list, np.ndarray], array: Union[np.ndarray, cgm.genArray]):
+        self._check_in_items()
+
+        if isinstance(array, cgm.genArray):
+            array = array.ndarray
+
+        self._change_to_ndarray()
+
+        indices = np.asarray(indices, dtype=np.int64)
+        array = np.asarray(array, dtype=self._list.dtype).reshape((-1, *self._list.shape[1:]))
+        if not self._list.flags.writeable:
+            self._reserve(len(self._list))
+
+        self._list[indices] = array
+        if self._increment is not None:
+            self._dirty_ranges.add_indices(indices)
+
+        self._list_ndarray = self._list
+        self._list_dirty = False
+        self._should_retest = True
+        self._update_version()
+
     def _check_type(self, value):
         if not self:
             return
@@ -132,90 +303,192 @@ class SameTypeList:
     def _change_to_list(self):
         if not isinstance(self._list, list):
             self._list = list(map(lambda x: self._dtype(*x), self._list))
+            self._buffer = None
+            self._numpy_storage = False
+
+    def _change_to_ndarray(self, value=None):
+        if self._buffer is not None:
+            return
+
+        if self._dtype is None:
+            if self:
+                self._dtype = type(self._list[0])
+            elif value is not None:
+                self._dtype = type(value)
+            else:
+                return
+
+        if self:
+            self._buffer = np.array(self.ndarray)
+        else:
+            n = nitems(self._dtype)
+            np_dtype = GLInfo.np_dtype_map.get(self._dtype, self._dtype)
+            self._buffer = np.empty((0, n) if n > 1 else (0,), dtype=np_dtype)
+
+        self._list = self._buffer
+        self._list_dirty = True
+        self._numpy_storage = True
+
+    def _reserve(self, length: int):
+        buffer = self._buffer
+        if len(buffer) >= length and buffer.flags.writeable:
+            return
+
+        len_self = len(self._list)
+        self._buffer = np.empty(
+            (max(capacity_of(length), len(buffer)), *buffer.shape[1:]), dtype=buffer.dtype
+        )
+        self._buffer[:len_self] = self._list
+        self._list = self._buffer[:len_self]
+
+    def _resize(self, length: int):
+        self._reserve(length)
+        self._list = self._buffer[:length]
+
+    def index(self, value):
+        if self._buffer is None:
+            return self._list.index(value)
+
+        matches = self._list == np.asarray(value, dtype=self._list.dtype)
+        if matches.ndim > 1:
+            matches = matches.all(axis=1)
+
+        indices = np.flatnonzero(matches)
+        if len(indices) == 0:
+            raise ValueError(f"{value} is not in list")
+
+        return int(indices[0])
 
     def append(self, value):
-        self._change_to_list()
         self._check_in_items()
 
         if GlassConfig.debug:
             self._check_type(value)
 
-        self._list.append(value)
+        if self._numpy_storage:
+            self._change_to_ndarray(value)
+
+        if self._buffer is None:
+            self._list.append(value)
+        else:
+            len_self = len(self._list)
+            self._resize(len_self + 1)
+            self._list[len_self] = value
 
         if self._increment is not None:
             self._increment.append(value)
 
         self._list_dirty = True
         self._should_retest = True
+        self._update_version()
 
     def extend(self, _list):
-        self._change_to_list()
         self._check_in_items()
 
         if GlassConfig.debug:
             for value in _list:
                 self._check_type(value)
 
-        self._list.extend(_list)
+        if self._numpy_storage and len(_list) > 0:
+            self._change_to_ndarray(_list[0])
+
+        if self._buffer is None:
+            self._list.extend(_list)
+        else:
+            len_self = len(self._list)
+            self._resize(len_self + len(_list))
+            self._list[len_self:] = np.asarray(_list, dtype=self._list.dtype).reshape(
+                (-1, *self._list.shape[1:])
+            )
 
         if self._increment is not None:
-            self._increment.append(_list)
+            self._increment.append(list(_list))
 
         self._list_dirty = True
         self._should_retest = True
+        self._update_version()
 
     def insert(self, index, value):
-        self._change_to_list()
         self._check_in_items()
+        self._fold_dirty_ranges()
 
         if GlassConfig.debug:
             self._check_type(value)
 
-        self._list.insert(index, value)
+        if self._numpy_storage:
+            self._change_to_ndarray(value)
+
+        len_self = len(self._list)
+        if index < 0:
+            index = max(index + len_self, 0)
+        index = min(index, len_self)
+
+        if self._buffer is None:
+            self._list.insert(index, value)
+        else:
+            self._resize(len_self + 1)
+            self._list[index + 1 :] = self._list[index:len_self]
+            self._list[index] = value
 
         if self._increment is not None:
             self._increment.insert(index, value)
 
         self._list_dirty = True
         self._should_retest = True
+        self._update_version()
 
     def remove(self, value):
-        self._change_to_list()
         self._check_in_items()
+        self._fold_dirty_ranges()
 
         index = self.index(value)
 
-        self._list.remove(value)
+        if self._buffer is None:
+            self._list.remove(value)
+        else:
+            self.__delete_rows(index)
 
         if self._increment is not None:
             self._increment.delete(index)
 
         self._list_dirty = True
         self._should_retest = True
+        self._update_version()
 
-    def pop(self, index: int):
-        self._change_to_list()
+    def pop(self, index: int = -1):
         self._check_in_items()
+        self._fold_dirty_ranges()
 
-        value = self._list.pop(index)
+        if self._buffer is None:
+            value = self._list.pop(index)
+        else:
+            index %= len(self._list)
+            value = self.const_get(index)
+            self.__delete_rows(index)
 
         if self._increment is not None:
             self._increment.delete(index)
 
         self._list_dirty = True
         self._should_retest = True
+        self._update_version()
 
         return value
 
     def clear(self):
         self._check_in_items()
-        self._list = []
+        self._dirty_ranges.clear()
+        if self._buffer is None:
+            self._list = []
+        else:
+            self._list = self._buffer[:0]
 
         if self._increment is not None:
             self._increment.clear()
 
         self._list_dirty = True
         self._should_retest = True
+        self._update_version()
 
     def update(self, _list):
         len_list = len(_list)
@@ -231,6 +504,7 @@ class SameTypeList:
 
         self._list_dirty = True
         self._should_retest = True
+        self._update_version()
 
     def __len__(self):
         if isinstance(self._list, np.ndarray):
@@ -250,6 +524,7 @@ class SameTypeList:
                 self.extend([value] * (index + 1 - len_list))
                 self._list_dirty = True
                 self._should_retest = True
+                self._update_version()
                 return True
 
             if self.const_get(index) == value:
@@ -266,12 +541,24 @@ class SameTypeList:
             else:
                 self._check_type(value)
 
+        len_list = len(self._list)
+        if self._buffer is not None:
+            self._reserve(len_list)
         self._list[index] = value
-        if self._increment is not None:
-            self._increment.update(index, value)
+        if len(self._list) != len_list:
+            self._increment = None
+        elif isinstance(index, slice):
+            start, stop, step = index.indices(len_list)
+            if step == 1:
+                self._mark_dirty(start, stop)
+            else:
+                self._mark_dirty_indices(range(start, stop, step))
+        else:
+            self._mark_dirty(index % len_list)
 
         self._list_dirty = True
         self._should_retest = True
+        self._update_version()
         return True
 
     def __getitem__(self, index: Union[int, slice]):
@@ -291,12 +578,17 @@ class SameTypeList:
 
         self._list_dirty = True
         self._should_retest = True
-        return self.const_get(index)
+        self._update_version()
+        value = self.const_get(index)
+        if isinstance(self._list, np.ndarray) and isinstance(value, cgm.genType):
+            value.on_changed = SameTypeList.row_link(self, index % len(self._list), value)
+
+        return value
 
     def const_get(self, index):
         result = self._list[index]
         if not isinstance(self._list, list):
-            result = self._dtype(*result)
+            result = self._dtype(*result) if np.ndim(result) > 0 else self._dtype(result)
         return result
 
     def const_items(self):
@@ -305,6 +597,41 @@ class SameTypeList:
     def __iter__(self):
         return SameTypeList.iterator(self)
 
+    def _mark_dirty(self, start: int, stop: int = None):
+        if self._increment is not None:
+            self._dirty_ranges.add(start, stop)
+
+    def _mark_dirty_indices(self, indices):
+        if self._increment is not None:
+            self._dirty_ranges.add_indices(list(indices))
+
+    def _fold_dirty_ranges(self):
+        if not self._dirty_ranges:
+            return
+
+        if self._increment is not None:
+            for start, stop in self._dirty_ranges:
+                for index in range(start, stop):
+                    self._increment.update(index, self.const_get(index))
+
+        self._dirty_ranges.clear()
+
+    def _upload_dirty_ranges(self, bo, stride: int):
+        if not self._dirty_ranges:
+            return
+
+        self._dirty_ranges.clip(len(self))
+        value_array = self.ndarray
+        for start, stop in self._dirty_ranges:
+            bo.bufferSubData(
+                start * stride, (stop - start) * stride, self._encode(value_array[start:stop])
+            )
+
+        self._dirty_ranges.clear()
+
+    def _encode(self, value_array: np.ndarray) -> np.ndarray:
+        return value_array
+
     def _check_in_items(self):
         if self._increment is None or not self._checked_out_items:
             return
@@ -312,37 +639,50 @@ class SameTypeList:
         for index, value in self._checked_out_items.items():
             new_value = self.const_get(index)
             if new_value != value:
-                self._increment.update(index, new_value)
+                self._mark_dirty(index % len(self._list))
 
         self._checked_out_items.clear()
 
     def __delitem__(self, index: Union[int, slice]):
-        self._change_to_list()
         self._check_in_items()
-        del self._list[index]
+        self._fold_dirty_ranges()
+
+        len_self = len(self._list)
+        if self._buffer is None:
+            del self._list[index]
+        else:
+            self.__delete_rows(index)
 
         if self._increment is not None:
             if isinstance(index, slice):
-                start, stop, step = self.__process_slice(index)
-                if (
-                    start >= len(self._list)
-                    or step == 0
-                    or start == stop
-                    or (step > 0 and stop < step)
-                    or (step < 0 and stop > step)
-                ):
-                    return
-
-                if step == 1:
-                    self._increment.delete(start, stop)
+                rows = range(*index.indices(len_self))
+                if rows.step == 1:
+                    if len(rows) > 0:
+                        self._increment.delete(rows.start, rows.stop)
                 else:
-                    for i in range(start, stop, step):
+                    for i in sorted(rows, reverse=True):
                         self._increment.delete(i)
             else:
-                self._increment.delete(index)
+                self._increment.delete(index % len_self)
 
         self._list_dirty = True
         self._should_retest = True
+        self._update_version()
+
+    def __delete_rows(self, index: Union[int, slice]):
+        len_self = len(self._list)
+        self._reserve(len_self)
+        if isinstance(index, int):
+            index %= len_self
+            self._list[index:-1] = self._list[index + 1 :]
+            self._list = self._buffer[: len_self - 1]
+            return
+
+        keep = np.ones(len_self, dtype=bool)
+        keep[index] = False
+        len_keep = int(np.count_nonzero(keep))
+        self._list[:len_keep] = self._list[keep]
+        self._list = self._buffer[:len_keep]
 
     def __process_slice(self, index):
         len_self = len(self._list)
@@ -390,3 +730,4 @@ class SameTypeList:
         self._dtype = dtype
         self._list_dirty = True
         self._should_retest = True
+        self._update_version()
@@ -43,6 +43,7 @@ class ShaderProgram(GPUProgram):
     __accum_draw_lines: dict = {}
     __accum_draw_meshes: dict = {}
     __accum_draw_patches: dict = {}
+    __accum_draw_instances: dict = {}
 
     __global_defines: dict = {}
     __global_include_paths: list = []
@@ -811,6 +812,14 @@ class ShaderProgram(GPUProgram):
 
         ShaderProgram.__accum_draw_patches[current_context] += 1
 
+    @staticmethod
+    def __increase_draw_instances(times: int = None):
+        current_context = GLConfig.buffered_current_context
+        if current_context not in ShaderProgram.__accum_draw_instances:
+            ShaderProgram.__accum_draw_instances[current_context] = 0
+
+        ShaderProgram.__accum_draw_instances[current_context] += (1 if times is None else times)
+
     @staticmethod
     def accum_draw_calls():
         current_context = GLConfig.buffered_current_context
@@ -851,6 +860,14 @@ class ShaderProgram(GPUProgram):
 
         return ShaderProgram.__accum_draw_patches[current_context]
 
+    @staticmethod
+    def accum_draw_instances():
+        current_context = GLConfig.buffered_current_context
+        if current_context not in ShaderProgram.__accum_draw_instances:
+            return 0
+
+        return ShaderProgram.__accum_draw_instances[current_context]
+
     def draw_patches(
         self,
         vertices: Vertices = None,
@@ -874,10 +891,10 @@ class ShaderProgram(GPUProgram):
         self.use()
         if indices is not None:
             if times is None:
-                GL.glDrawElements(GL.GL_PATCHES, total, GL.GL_UNSIGNED_INT, None)
+                GL.glDrawElements(GL.GL_PATCHES, total, indices.gl_type, None)
             else:
                 GL.glDrawElementsInstanced(
-                    GL.GL_PATCHES, total, GL.GL_UNSIGNED_INT, None, times
+                    GL.GL_PATCHES, total, indices.gl_type, None, times
                 )
         else:
             if total is None:
@@ -888,6 +905,7 @@ class ShaderProgram(GPUProgram):
                 GL.glDrawArraysInstanced(GL.GL_PATCHES, start_index, total, times)
 
         self.__increase_draw_patches()
+        self.__increase_draw_instances(times)
         self.__increase_draw_calls()
 
     def draw_triangles(
@@ -920,10 +938,10 @@ class ShaderProgram(GPUProgram):
         self.use()
         if indices is not None:
             if times is None:
-                GL.glDrawElements(primitive_type, total, GL.GL_UNSIGNED_INT, None)
+                GL.glDrawElements(primitive_type, total, indices.gl_type, None)
             else:
                 GL.glDrawElementsInstanced(
-                    primitive_type, total, GL.GL_UNSIGNED_INT, None, times
+                    primitive_type, total, indices.gl_type, None, times
                 )
         else:
             if times is None:
@@ -932,6 +950,43 @@ class ShaderProgram(GPUProgram):
                 GL.glDrawArraysInstanced(primitive_type, start_index, total, times)
 
         self.__increase_draw_meshes()
+        self.__increase_draw_instances(times)
+        self.__increase_draw_calls()
+
+    def multi_draw_triangles_indirect(
+        self,
+        vertices: Vertices,
+        indices: Indices,
+        instances: Instances,
+        indirect_buffer,
+        draw_count: int,
+        primitive_type: GLInfo.triangle_types = GL.GL_TRIANGLES,
+    ):
+
+        total, times = self.__preprocess_before_draw(
+            primitive_type,
+            vertices,
+            indices,
+            instances,
+            None,
+            0,
+            None,
+            None,
+            False,
+        )
+
+        if (total is not None and total <= 0) or draw_count <= 0:
+            return
+
+        self.use()
+        GL.glBindBuffer(GL.GL_DRAW_INDIRECT_BUFFER, indirect_buffer.id)
+        GL.glMultiDrawElementsIndirect(
+            primitive_type, indices.gl_type, None, draw_count, 0
+        )
+        GL.glBindBuffer(GL.GL_DRAW_INDIRECT_BUFFER, 0)
+
+        self.__increase_draw_meshes()
+        self.__increase_draw_instances(0)
         self.__increase_draw_calls()
 
     def draw_points(
@@ -968,6 +1023,7 @@ class ShaderProgram(GPUProgram):
             GL.glDrawArraysInstanced(GL.GL_POINTS, start_index, total, times)
 
         self.__increase_draw_points()
+        self.__increase_draw_instances(times)
         self.__increase_draw_calls()
 
     def draw_lines(
@@ -1000,10 +1056,10 @@ class ShaderProgram(GPUProgram):
         self.use()
         if indices is not None:
             if times is None:
-                GL.glDrawElements(primitive_type, total, GL.GL_UNSIGNED_INT, None)
+                GL.glDrawElements(primitive_type, total, indices.gl_type, None)
             else:
                 GL.glDrawElementsInstanced(
-                    primitive_type, total, GL.GL_UNSIGNED_INT, None, times
+                    primitive_type, total, indices.gl_type, None, times
                 )
         else:
             if times is None:
@@ -1012,6 +1068,7 @@ class ShaderProgram(GPUProgram):
                 GL.glDrawArraysInstanced(primitive_type, start_index, total, times)
 
         self.__increase_draw_lines()
+        self.__increase_draw_instances(times)
         self.__increase_draw_calls()
 
     @property
@@ -0,0 +1,129 @@
+from .VBO import VBO
+from .GLConfig import GLConfig
+
+from OpenGL import GL
+import numpy as np
+import ctypes
+
+
+class StreamVBO(VBO):
+
+    _map_flags = GL.GL_MAP_WRITE_BIT | GL.GL_MAP_PERSISTENT_BIT | GL.GL_MAP_COHERENT_BIT
+    _supported = None
+
+    def __init__(self, n_segments: int = 3):
+        VBO.__init__(self)
+        self._n_segments = n_segments
+        self._segment_nbytes = 0
+        self._segment_index = 0
+        self._fences = [None] * n_segments
+        self._mapped = None
+        self._draw_type = GL.GL_STREAM_DRAW
+
+    @staticmethod
+    def supported() -> bool:
+        if StreamVBO._supported is None:
+            try:
+                version = (int(GLConfig.major_version), int(GLConfig.minor_version))
+                StreamVBO._supported = (
+                    version >= (4, 4)
+                    or "GL_ARB_buffer_storage" in GLConfig.available_extensions
+                )
+            except:
+                StreamVBO._supported = False
+
+        return StreamVBO._supported
+
+    @property
+    def n_segments(self) -> int:
+        return self._n_segments
+
+    @property
+    def segment_nbytes(self) -> int:
+        return self._segment_nbytes
+
+    @property
+    def offset(self) -> int:
+        return self._segment_index * self._segment_nbytes
+
+    def malloc(self, segment_nbytes: int, draw_type=GL.GL_STREAM_DRAW) -> None:
+        self.delete()
+
+        total_nbytes = segment_nbytes * self._n_segments
+        self.bind()
+        GL.glBufferStorage(GL.GL_ARRAY_BUFFER, total_nbytes, None, self._map_flags)
+        address = GL.glMapBufferRange(GL.GL_ARRAY_BUFFER, 0, total_nbytes, self._map_flags)
+        if not address:
+            self.delete()
+            raise MemoryError("failed to map StreamVBO")
+
+        if not isinstance(address, int):
+            address = ctypes.cast(address, ctypes.c_void_p).value
+
+        self._mapped = np.ctypeslib.as_array(
+            (ctypes.c_ubyte * total_nbytes).from_address(address)
+        )
+        self._segment_nbytes = segment_nbytes
+        self._segment_index = 0
+        self._nbytes = total_nbytes
+
+    def segment(self, index: int = None) -> np.ndarray:
+        if index is None:
+            index = self._segment_index
+
+        start = index * self._segment_nbytes
+        return self._mapped[start : start + self._segment_nbytes]
+
+    def advance(self) -> np.ndarray:
+        self._fences[self._segment_index] = GL.glFenceSync(
+            GL.GL_SYNC_GPU_COMMANDS_COMPLETE, 0
+        )
+        self._segment_index = (self._segment_index + 1) % self._n_segments
+        self._wait(self._segment_index)
+        return self.segment()
+
+    def _wait(self, index: int) -> None:
+        fence = self._fences[index]
+        if fence is None:
+            return
+
+        while GL.glClientWaitSync(
+            fence, GL.GL_SYNC_FLUSH_COMMANDS_BIT, 1000000
+        ) not in (GL.GL_ALREADY_SIGNALED, GL.GL_CONDITION_SATISFIED):
+            pass
+
+        GL.glDeleteSync(fence)
+        self._fences[index] = None
+
+    def write(self, start: int, nbytes: int, value_array: np.ndarray) -> None:
+        segment = self.segment()
+        np.copyto(
+            segment[start : start + nbytes],
+            value_array.reshape(-1).view(np.uint8)[:nbytes],
+        )
+
+    def bufferSubData(self, start: int, nbytes: int, value_array) -> None:
+        if isinstance(value_array, np.ndarray) and value_array.flags.c_contiguous:
+            self.write(start, nbytes, value_array)
+        else:
+            self.write(start, nbytes, np.ascontiguousarray(value_array))
+
+    def delete(self) -> None:
+        for i in range(self._n_segments):
+            if self._fences[i] is not None:
+                try:
+                    GL.glDeleteSync(self._fences[i])
+                except:
+                    pass
+                self._fences[i] = None
+
+        if self._mapped is not None:
+            self._mapped = None
+            try:
+                self.bind()
+                GL.glUnmapBuffer(GL.GL_ARRAY_BUFFER)
+            except:
+                pass
+
+        self._segment_nbytes = 0
+        VBO.delete(self)
@@ -7,6 +7,7 @@ from .helper import nitems, sizeof
 from .GLObject import GLObject
 from .GLInfo import GLInfo
 from .GLConfig import GLConfig
+from .VertexFormat import VertexFormat
 
 
 class VAP:
@@ -43,14 +44,23 @@ class VAP:
         return wraps
 
     @contex_check
-    def interp(self, vbo, element_type, stride=0, offset=0):
+    def interp(self, vbo, element_type, stride=0, offset=0, vertex_format=None):
         self._vao.bind()
         vbo.bind()
         if stride == 0:
             stride = sizeof(element_type)
 
-        gl_type = GLInfo.dtype_inverse_map[element_type]
-        if gl_type in [GL.GL_DOUBLE, gsi64.GL_UNSIGNED_INT64_ARB]:
+        gl_type = GLInfo.dtype_inverse_map.get(element_type, None)
+        if vertex_format is not None:
+            GL.glVertexAttribPointer(
+                self._location,
+                VertexFormat.gl_size(vertex_format, element_type),
+                VertexFormat.gl_type(vertex_format),
+                VertexFormat.normalized(vertex_format),
+                stride,
+                ctypes.c_void_p(offset),
+            )
+        elif gl_type in [GL.GL_DOUBLE, gsi64.GL_UNSIGNED_INT64_ARB]:
             GL.glVertexAttribLPointer(
                 self._location,
                 nitems(element_type),
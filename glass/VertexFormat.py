@@ -0,0 +1,142 @@
+from .GLInfo import GLInfo
+from .helper import nitems
+
+from OpenGL import GL
+import numpy as np
+import cgmath as cgm
+
+
+class VertexFormat:
+
+    formats = {
+        "half": (GL.GL_HALF_FLOAT, GL.GL_FALSE, np.float16),
+        "unorm8": (GL.GL_UNSIGNED_BYTE, GL.GL_TRUE, np.uint8),
+        "unorm16": (GL.GL_UNSIGNED_SHORT, GL.GL_TRUE, np.uint16),
+        "snorm8": (GL.GL_BYTE, GL.GL_TRUE, np.int8),
+        "snorm16": (GL.GL_SHORT, GL.GL_TRUE, np.int16),
+        "snorm10": (GL.GL_INT_2_10_10_10_REV, GL.GL_TRUE, np.uint32),
+        "octahedral": (GL.GL_SHORT, GL.GL_TRUE, np.int16),
+    }
+
+    @staticmethod
+    def check(vertex_format: str, element_type) -> None:
+        if vertex_format not in VertexFormat.formats:
+            raise ValueError(
+                f"unknown vertex format '{vertex_format}', should be one of {list(VertexFormat.formats.keys())}"
+            )
+
+        if GLInfo.np_dtype_map.get(element_type, None) != np.float32:
+            raise TypeError(
+                f"vertex format '{vertex_format}' can only compress float attributes, {element_type} was given"
+            )
+
+        n = nitems(element_type)
+        if vertex_format == "snorm10" and n not in (3, 4):
+            raise TypeError("vertex format 'snorm10' need vec3 or vec4 attribute")
+
+        if vertex_format == "octahedral" and n != 3:
+            raise TypeError("vertex format 'octahedral' need vec3 attribute")
+
+    @staticmethod
+    def gl_type(vertex_format: str):
+        return VertexFormat.formats[vertex_format][0]
+
+    @staticmethod
+    def normalized(vertex_format: str):
+        return VertexFormat.formats[vertex_format][1]
+
+    @staticmethod
+    def np_dtype(vertex_format: str):
+        return VertexFormat.formats[vertex_format][2]
+
+    @staticmethod
+    def gl_size(vertex_format: str, element_type) -> int:
+        if vertex_format == "snorm10":
+            return 4
+
+        if vertex_format == "octahedral":
+            return 2
+
+        return nitems(element_type)
+
+    @staticmethod
+    def storage_items(vertex_format: str, element_type) -> int:
+        if vertex_format == "snorm10":
+            return 1
+
+        return VertexFormat.gl_size(vertex_format, element_type)
+
+    @staticmethod
+    def nbytes(vertex_format: str, element_type) -> int:
+        return VertexFormat.storage_items(vertex_format, element_type) * np.dtype(
+            VertexFormat.np_dtype(vertex_format)
+        ).itemsize
+
+    @staticmethod
+    def feed_type(vertex_format: str, element_type):
+        if vertex_format == "octahedral":
+            return cgm.vec2
+
+        return element_type
+
+    @staticmethod
+    def encode(vertex_format: str, value_array: np.ndarray) -> np.ndarray:
+        value_array = np.asarray(value_array, dtype=np.float32)
+        if value_array.ndim == 1:
+            value_array = value_array.reshape(-1, 1)
+
+        if vertex_format == "half":
+            return value_array.astype(np.float16)
+
+        if vertex_format == "unorm8":
+            return np.rint(np.clip(value_array, 0, 1) * 255).astype(np.uint8)
+
+        if vertex_format == "unorm16":
+            return np.rint(np.clip(value_array, 0, 1) * 65535).astype(np.uint16)
+
+        if vertex_format == "snorm8":
+            return np.rint(np.clip(value_array, -1, 1) * 127).astype(np.int8)
+
+        if vertex_format == "snorm16":
+            return np.rint(np.clip(value_array, -1, 1) * 32767).astype(np.int16)
+
+        if vertex_format == "snorm10":
+            return VertexFormat.__encode_snorm10(value_array)
+
+        if vertex_format == "octahedral":
+            return VertexFormat.__encode_octahedral(value_array)
+
+        raise ValueError(f"unknown vertex format '{vertex_format}'")
+
+    @staticmethod
+    def __encode_snorm10(value_array: np.ndarray) -> np.ndarray:
+        xyz = np.rint(np.clip(value_array[:, :3], -1, 1) * 511).astype(np.int32) & 0x3FF
+        result = xyz[:, 0] | (xyz[:, 1] << 10) | (xyz[:, 2] << 20)
+        if value_array.shape[1] > 3:
+            w = np.rint(np.clip(value_array[:, 3], -1, 1)).astype(np.int32) & 0x3
+            result |= w << 30
+
+        return result.astype(np.uint32).reshape(-1, 1)
+
+    @staticmethod
+    def __encode_octahedral(value_array: np.ndarray) -> np.ndarray:
+        l1_norm = np.abs(value_array).sum(axis=1, keepdims=True)
+        l1_norm[l1_norm == 0] = 1
+        n = value_array / l1_norm
+        xy = n[:, :2]
+        sign = np.where(xy >= 0, 1.0, -1.0)
+        folded = (1 - np.abs(xy[:, ::-1])) * sign
+        xy = np.where(n[:, 2:3] < 0, folded, xy)
+        return np.rint(np.clip(xy, -1, 1) * 32767).astype(np.int16)
+
+    @staticmethod
+    def decode_octahedral(value_array: np.ndarray) -> np.ndarray:
+        xy = np.asarray(value_array, dtype=np.float32).reshape(-1, 2)
+        if np.issubdtype(np.asarray(value_array).dtype, np.integer):
+            xy = np.maximum(xy / 32767, -1)
+
+        z = 1 - np.abs(xy).sum(axis=1)
+        t = np.maximum(-z, 0).reshape(-1, 1)
+        xy = xy - np.where(xy >= 0, t, -t)
+        result = np.concatenate((xy, z.reshape(-1, 1)), axis=1)
+        return result / np.linalg.norm(result, axis=1, keepdims=True)
@@ -8,8 +8,10 @@ from .GLConfig import GLConfig
 from .VAO import VAO
 from .utils import checktype
 from .AttrList import AttrList
+from .InterleavedVBO import InterleavedVBO
 from .GLInfo import GLInfo
 from .SameTypeList import SameTypeList
+from .helper import element_type_of
 
 
 class Vertex(dict):
@@ -103,7 +105,9 @@ class Vertex(dict):
 
         for parent_array, index_set in self._array_index_map.items():
             if name not in parent_array._attr_list_map:
-                parent_array._attr_list_map[name] = AttrList(dtype=type(value))
+                parent_array._attr_list_map[name] = AttrList(
+                    draw_type=parent_array._draw_type, dtype=type(value)
+                )
 
             for index in index_set:
                 parent_array._attr_list_map[name][index] = value
@@ -112,7 +116,9 @@ class Vertex(dict):
         for parent_array, index_set in self._array_index_map.items():
             if name not in parent_array._attr_list_map:
                 value = dict.__getitem__(self, name)
-                parent_array._attr_list_map[name] = AttrList(dtype=type(value))
+                parent_array._attr_list_map[name] = AttrList(
+                    draw_type=parent_array._draw_type, dtype=type(value)
+                )
                 for index in index_set:
                     parent_array._attr_list_map[name][index] = value
 
@@ -136,12 +142,14 @@ class Vertices:
         self,
         _list: list = None,
         draw_type: GLInfo.draw_types = GL.GL_STATIC_DRAW,
+        interleaved: bool = False,
         **kwargs,
     ):
         self._attr_list_map = {}
         self._vao_map = {}
         self._index_vertex_map = {}
         self._draw_type = draw_type
+        self._interleaved_vbo = InterleavedVBO() if interleaved else None
         self._tested_front_transparent = False
         self._tested_back_transparent = False
         self._front_has_transparent = False
@@ -155,6 +163,67 @@ class Vertices:
         else:
             self._attr_list_map = kwargs
 
+    @classmethod
+    def from_arrays(
+        cls,
+        draw_type: GLInfo.draw_types = GL.GL_STATIC_DRAW,
+        interleaved: bool = False,
+        **arrays
+    ):
+        len_arrays = None
+        attr_list_map = {}
+        for key, array in arrays.items():
+            if not isinstance(array, cgm.genArray):
+                array = np.asarray(array)
+
+            if len_arrays is None:
+                len_arrays = len(array)
+            elif len(array) != len_arrays:
+                raise ValueError(
+                    f"attribute '{key}' has {len(array)} items, {len_arrays} expected"
+                )
+
+            attr_list_map[key] = AttrList(draw_type=draw_type, dtype=element_type_of(array))
+            attr_list_map[key].set_range(0, array)
+
+        result = cls(draw_type=draw_type, interleaved=interleaved)
+        result._attr_list_map = attr_list_map
+        return result
+
+    def set_attribute(
+        self, attr_name: str, array: Union[np.ndarray, cgm.genArray], start: int = 0
+    ):
+        if not isinstance(array, cgm.genArray):
+            array = np.asarray(array)
+
+        len_self = len(self)
+        stop = start + len(array)
+        if attr_name not in self._attr_list_map:
+            if start != 0 or (self._attr_list_map and stop != len_self):
+                raise ValueError(
+                    f"new attribute '{attr_name}' should cover all {len_self} vertices"
+                )
+
+            self._attr_list_map[attr_name] = AttrList(
+                draw_type=self._draw_type, dtype=element_type_of(array)
+            )
+        elif stop > len_self and len(self._attr_list_map) > 1:
+            raise IndexError(
+                f"attribute '{attr_name}' range [{start}, {stop}) is out of {len_self} vertices"
+            )
+
+        self._attr_list_map[attr_name].set_range(start, array)
+
+    def compress(self, **vertex_formats):
+        for attr_name, vertex_format in vertex_formats.items():
+            self._attr_list_map[attr_name].compression = vertex_format
+
+        if self._interleaved_vbo is not None:
+            self._interleaved_vbo.invalidate()
+
+    def stream_view(self, attr_name: str, start: int = 0, stop: int = None):
+        return self._attr_list_map[attr_name].stream_view(start, stop)
+
     def hasattr(self, attr_name: str):
         return attr_name in self._attr_list_map
 
@@ -177,6 +246,31 @@ class Vertices:
     @checktype
     def draw_type(self, value: GLInfo.draw_types):
         self._draw_type = value
+        for attr_list in self._attr_list_map.values():
+            attr_list.draw_type = value
+
+        if self._interleaved_vbo is not None:
+            self._interleaved_vbo.invalidate()
+
+    @property
+    def interleaved(self) -> bool:
+        return self._interleaved_vbo is not None
+
+    @interleaved.setter
+    def interleaved(self, flag: bool):
+        if flag == self.interleaved:
+            return
+
+        if flag:
+            self._interleaved_vbo = InterleavedVBO()
+        else:
+            self._interleaved_vbo.delete()
+            self._interleaved_vbo = None
+
+        for attr_list in self._attr_list_map.values():
+            if attr_list._shared_source() is None:
+                attr_list._vbo.delete()
+            attr_list._increment = None
 
     def _first_apply(self, program, instances) -> bool:
         current_context = GLConfig.buffered_current_context
@@ -188,16 +282,27 @@ class Vertices:
         self._vao_map[key] = vao
         return self._apply_increment(instances)
 
-    def _update_VAOs(self, key, attr_list, divisor=None):
+    def _update_VAOs(self, key, attr_list, divisor=None, interleaved_vbo=None):
+        if interleaved_vbo is None:
+            vbo = attr_list._vbo
+            stride = attr_list.stride
+            offset = attr_list.offset
+            is_new_vbo = attr_list.is_new_vbo
+        else:
+            vbo = interleaved_vbo
+            stride = interleaved_vbo.stride
+            offset = interleaved_vbo.offset_of(key)
+            is_new_vbo = interleaved_vbo.is_new_vbo
+
         for (context, program, insts), vao in self._vao_map.items():
             if key not in program._attributes_info:
                 continue
 
             location = program._attributes_info[key].location
-            if location in vao and not attr_list.is_new_vbo:
+            if location in vao and not is_new_vbo:
                 continue
 
-            feed_type = attr_list.dtype
+            feed_type = attr_list.feed_type
             need_type = program._attributes_info[key].python_type
             if feed_type != need_type:
                 if (
@@ -205,28 +310,53 @@ class Vertices:
                     and need_type in GLInfo.primary_types
                 ):
                     attr_list.dtype = need_type
-                    attr_list._apply()
                     feed_type = need_type
+                    if interleaved_vbo is None:
+                        attr_list._apply()
+                    else:
+                        interleaved_vbo.invalidate()
+                        continue
                 elif feed_type == int and need_type == cgm.uvec2:
                     attr_list.dtype = np.uint64
-                    attr_list._apply()
                     feed_type = cgm.uvec2
+                    if interleaved_vbo is None:
+                        attr_list._apply()
+                    else:
+                        interleaved_vbo.invalidate()
+                        continue
                 elif feed_type in (np.uint64, dtype_uint64) and need_type == cgm.uvec2:
                     feed_type = cgm.uvec2
+                elif attr_list.compression == "octahedral" and need_type == cgm.vec3:
+                    pass
                 else:
                     error_message = f"vertex attribute '{key}' need type {need_type.__name__}, {feed_type.__name__} value were given"
                     raise TypeError(error_message)
 
-            vao[location].interp(attr_list._vbo, feed_type, attr_list.stride, 0)
+            vao[location].interp(vbo, feed_type, stride, offset, attr_list.compression)
             if divisor is not None:
                 vao[location].divisor = divisor
 
+        if interleaved_vbo is None:
             attr_list.is_new_vbo = False
 
+    def __apply_interleaved(self) -> None:
+        interleaved_vbo = self._interleaved_vbo
+        for _ in range(2):
+            interleaved_vbo._apply(self._attr_list_map, self._draw_type)
+            for key, attr_list in self._attr_list_map.items():
+                self._update_VAOs(key, attr_list, interleaved_vbo=interleaved_vbo)
+
+            interleaved_vbo.is_new_vbo = False
+            if interleaved_vbo._layout is not None:
+                break
+
     def _apply_increment(self, instances) -> bool:
-        for key, attr_list in self._attr_list_map.items():
-            attr_list._apply()
-            self._update_VAOs(key, attr_list)
+        if self._interleaved_vbo is not None:
+            self.__apply_interleaved()
+        else:
+            for key, attr_list in self._attr_list_map.items():
+                attr_list._apply()
+                self._update_VAOs(key, attr_list)
 
         if instances is None:
             return True
@@ -281,11 +411,19 @@ class Vertices:
 
         return False
 
+    @property
+    def _version(self) -> tuple:
+        return tuple(
+            (id(attr_list), attr_list._version) for attr_list in self._attr_list_map.values()
+        )
+
     def append(self, vertex):
         len_self = len(self)
         for key in set.union(set(vertex.keys()), set(self._attr_list_map.keys())):
             if key not in self._attr_list_map:
-                self._attr_list_map[key] = AttrList(dtype=type(vertex[key]))
+                self._attr_list_map[key] = AttrList(
+                    draw_type=self._draw_type, dtype=type(vertex[key])
+                )
             if key not in vertex:
                 vertex[key] = self._attr_list_map[key].dtype()
 
@@ -348,7 +486,9 @@ class Vertices:
     def __setitem__(self, index: Union[int, slice], value: Vertex):
         for key in set.union(set(value.keys()), set(self._attr_list_map.keys())):
             if key not in self._attr_list_map:
-                self._attr_list_map[key] = AttrList(dtype=type(value[key]))
+                self._attr_list_map[key] = AttrList(
+                    draw_type=self._draw_type, dtype=type(value[key])
+                )
             if key not in value:
                 if len(self._attr_list_map[key]) == 0:
                     value[key] = self._attr_list_map[key].dtype()
@@ -378,13 +518,13 @@ class Vertices:
             del self._index_vertex_map[index]
 
         should_update_index = []
-        for sub_index, vertex in self._index_vertex_map:
+        for sub_index, vertex in self._index_vertex_map.items():
             if sub_index > index:
                 should_update_index.append(sub_index)
                 vertex._array_index_map[self].remove(sub_index)
                 vertex._array_index_map[self].add(sub_index - 1)
 
-        for sub_index in should_update_index:
+        for sub_index in sorted(should_update_index):
             vertex = self._index_vertex_map[sub_index]
             del self._index_vertex_map[sub_index]
             self._index_vertex_map[sub_index - 1] = vertex
@@ -453,7 +593,9 @@ class Vertices:
 
             vertex_attr = vertex[key]
             if key not in self._attr_list_map:
-                self._attr_list_map[key] = AttrList(dtype=type(vertex_attr))
+                self._attr_list_map[key] = AttrList(
+                    draw_type=self._draw_type, dtype=type(vertex_attr)
+                )
                 delta_len = len(self) - len(self._attr_list_map[key])
                 self._attr_list_map[key].extend([vertex_attr] * delta_len)
             else:
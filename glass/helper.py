@@ -83,6 +83,40 @@ def nitems(element_type):
         return 1
 
 
+def element_type_of(array):
+    if isinstance(array, cgm.genArray):
+        return array.element_type
+
+    prefix_map = {
+        np.dtype(np.float32): "",
+        np.dtype(np.float64): "",
+        np.dtype(np.int32): "i",
+        np.dtype(np.int64): "i",
+        np.dtype(np.uint32): "u",
+        np.dtype(np.bool_): "b",
+        np.dtype(np.int8): "b",
+    }
+
+    if array.ndim == 1 or (array.ndim == 2 and array.shape[1] == 1):
+        if array.dtype in (np.float32, np.float64):
+            return float
+        elif array.dtype in (np.int32, np.int64):
+            return int
+        else:
+            return array.dtype.type
+
+    if array.dtype not in prefix_map:
+        raise TypeError(f"unsupported vertex attribute array dtype {array.dtype}")
+
+    prefix = prefix_map[array.dtype]
+    if array.ndim == 2 and array.shape[1] in (2, 3, 4):
+        return getattr(cgm, f"{prefix}vec{array.shape[1]}")
+    elif array.ndim == 3 and array.shape[1] in (2, 3, 4) and array.shape[2] in (2, 3, 4):
+        return getattr(cgm, f"{prefix}mat{array.shape[1]}x{array.shape[2]}")
+
+    raise ValueError(f"can not infer vertex attribute type from array of shape {array.shape}")
+
+
 def to_bytes(value):
     if isinstance(value, bool):
         return int(value).to_bytes(4, byteorder="little")
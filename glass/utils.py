@@ -469,49 +469,12 @@ def capacity_of(length):
 
 @checktype
 def quat_to_mat4(q: cgm.quat):
-    w = q.w
-    x = q.x
-    y = q.y
-    z = q.z
-
-    return cgm.mat4(
-        1 - 2 * (y**2 + z**2),
-        2 * (x * y + w * z),
-        2 * (x * z - w * y),
-        0,
-        2 * (x * y - w * z),
-        1 - 2 * (x**2 + z**2),
-        2 * (y * z + w * x),
-        0,
-        2 * (x * z + w * y),
-        2 * (y * z - w * x),
-        1 - 2 * (x**2 + y**2),
-        0,
-        0,
-        0,
-        0,
-        1,
-    )
+    return cgm.mat4_cast(q)
 
 
 @checktype
 def quat_to_mat3(q: cgm.quat):
-    w = q.w
-    x = q.x
-    y = q.y
-    z = q.z
-
-    return cgm.mat3(
-        1 - 2 * (y**2 + z**2),
-        2 * (x * y + w * z),
-        2 * (x * z - w * y),
-        2 * (x * y - w * z),
-        1 - 2 * (x**2 + z**2),
-        2 * (y * z + w * x),
-        2 * (x * z + w * y),
-        2 * (y * z - w * x),
-        1 - 2 * (x**2 + y**2),
-    )
+    return cgm.mat3_cast(q)
 
 
 def scale_to_mat4(s: cgm.vec3):
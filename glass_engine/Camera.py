@@ -195,6 +195,9 @@ class Camera(SceneNode):
         self.__CSM_levels: int = 5
         self.__aspect_ratio: float = 1
         self.__lens: Camera.Lens = Camera.Lens(self)
+        self.__view_coord: cgm.vec3 = cgm.vec3()
+        self.__NDC_coord: cgm.vec4 = cgm.vec4()
+        self.__inv_orientation: cgm.quat = cgm.quat()
 
         self._set_screen(gui_system)
 
@@ -536,15 +539,25 @@ class Camera(SceneNode):
     ) -> VideoRecorder:
         return self.screen.capture_video(save_path, viewport, fps)
 
-    def project(self, world_coord: cgm.vec3) -> cgm.vec4:
-        return self.view_to_NDC(self.world_to_view(world_coord))
+    def project(self, world_coord: cgm.vec3, out: cgm.vec4 = None) -> cgm.vec4:
+        return self.view_to_NDC(self.world_to_view(world_coord, self.__view_coord), out)
 
-    def project3(self, world_coord: cgm.vec3) -> cgm.vec3:
-        NDC = self.project(world_coord)
-        return NDC.xyz / NDC.w
+    def project3(self, world_coord: cgm.vec3, out: cgm.vec3 = None) -> cgm.vec3:
+        NDC = self.project(world_coord, self.__NDC_coord)
+        if out is None:
+            out = cgm.vec3()
 
-    def world_to_view(self, world_coord: cgm.vec3) -> cgm.vec3:
-        return cgm.inverse(self.abs_orientation) * (world_coord - self.abs_position)
+        out._data[:] = NDC._data[:3]
+        out /= NDC.w
+        return out
+
+    def world_to_view(self, world_coord: cgm.vec3, out: cgm.vec3 = None) -> cgm.vec3:
+        if out is None:
+            return cgm.inverse(self.abs_orientation) * (world_coord - self.abs_position)
+
+        cgm.sub(world_coord, self.abs_position, out=out)
+        inv_orientation = cgm.inverse(self.abs_orientation, out=self.__inv_orientation)
+        return cgm.mul(inv_orientation, out, out=out)
 
     def view_to_world(self, view_coord: cgm.vec3) -> cgm.vec3:
         return self.abs_orientation * view_coord + self.abs_position
@@ -555,21 +568,25 @@ class Camera(SceneNode):
     def view_dir_to_world(self, view_dir: cgm.vec3) -> cgm.vec3:
         return self.abs_orientation * view_dir
 
-    def view_to_NDC(self, view_coord: cgm.vec3) -> cgm.vec4:
-        NDC_coord = cgm.vec4()
+    def view_to_NDC(self, view_coord: cgm.vec3, out: cgm.vec4 = None) -> cgm.vec4:
+        NDC_coord = cgm.vec4() if out is None else out
+        x, y, z = view_coord
         if self.projection_mode == Camera.ProjectionMode.Perspective:
-            NDC_coord.x = view_coord.x / (self.aspect * self.tan_half_fov)
-            NDC_coord.y = view_coord.z / self.tan_half_fov
-            NDC_coord.z = (
-                2 * self.far * (view_coord.y - self.near) / self.clip - view_coord.y
+            NDC_coord._data[:] = (
+                x / (self.aspect * self.tan_half_fov),
+                z / self.tan_half_fov,
+                2 * self.far * (y - self.near) / self.clip - y,
+                y,
             )
-            NDC_coord.w = view_coord.y
         else:
-            NDC_coord.x = 2 * view_coord.x / self.width
-            NDC_coord.y = 2 * view_coord.z / self.height
-            NDC_coord.z = 2 * (view_coord.y - self.near) / self.clip - 1
-            NDC_coord.w = 1
+            NDC_coord._data[:] = (
+                2 * x / self.width,
+                2 * z / self.height,
+                2 * (y - self.near) / self.clip - 1,
+                1,
+            )
 
+        NDC_coord._update_data()
         return NDC_coord
 
     def screen_to_view_dir(self, screen_pos: cgm.vec2) -> cgm.vec3:
@@ -584,3 +601,16 @@ class Camera(SceneNode):
 
     def screen_to_world_dir(self, screen_pos: cgm.vec2) -> cgm.vec3:
         return self.view_dir_to_world(self.screen_to_view_dir(screen_pos))
+
+    def screen_to_world_ray(self, screen_pos: cgm.vec2) -> tuple:
+        if self.projection_mode == Camera.ProjectionMode.Perspective:
+            return self.abs_position, self.screen_to_world_dir(screen_pos)
+
+        xNDC = 2 * screen_pos.x / self.screen.width() - 1
+        yNDC = 1 - 2 * screen_pos.y / self.screen.height()
+        origin = self.view_to_world(cgm.vec3(0.5 * xNDC * self.width, 0, 0.5 * yNDC * self.height))
+        return origin, self.view_dir_to_world(cgm.vec3(0, 1, 0))
+
+    def pick(self, screen_pos: cgm.vec2):
+        origin, direction = self.screen_to_world_ray(screen_pos)
+        return self.screen.renderer.pick(origin, direction, self.far)
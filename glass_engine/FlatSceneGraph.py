@@ -0,0 +1,277 @@
+from .SceneNode import SceneNode
+
+import cgmath as cgm
+from cgmath.genQuatArray import genQuatArray
+import numpy as np
+import ctypes
+
+
+class FlatSceneGraph:
+
+    def __init__(self, root: SceneNode):
+        self._root = root
+        self._structure_dirty = True
+        self._values_dirty = False
+
+        self._nodes = []
+        self._node_index = {}
+        self._shared_nodes = []
+        self._pivot_nodes = []
+        self._positions = np.zeros((0, 3), dtype=np.float32)
+        self._orientations = np.zeros((0, 4), dtype=np.float32)
+        self._scales = np.ones((0, 3), dtype=np.float32)
+
+        self._entry_nodes = np.zeros(0, dtype=np.int64)
+        self._entry_parents = np.zeros(0, dtype=np.int64)
+        self._entry_paths = []
+        self._levels = []
+        self._mesh_entries = {}
+        self._mesh_rows = {}
+        self._row_meshes = []
+        self._entry_meshes = np.zeros(0, dtype=np.int64)
+        self._moved_entries = None
+        self._other_entries = []
+
+        self._local_mats = np.zeros((0, 4, 4), dtype=np.float32)
+        self._world_mats = np.zeros((0, 4, 4), dtype=np.float32)
+
+    @property
+    def nodes(self) -> list:
+        return self._nodes
+
+    @property
+    def positions(self) -> np.ndarray:
+        return self._positions
+
+    @property
+    def orientations(self) -> np.ndarray:
+        return self._orientations
+
+    @property
+    def scales(self) -> np.ndarray:
+        return self._scales
+
+    @property
+    def entry_paths(self) -> list:
+        return self._entry_paths
+
+    @property
+    def world_mats(self) -> np.ndarray:
+        return self._world_mats
+
+    @property
+    def mesh_entries(self) -> dict:
+        return self._mesh_entries
+
+    @property
+    def other_entries(self) -> list:
+        return self._other_entries
+
+    @property
+    def structure_dirty(self) -> bool:
+        return self._structure_dirty
+
+    @property
+    def dirty(self) -> bool:
+        return self._structure_dirty or self._values_dirty
+
+    def invalidate(self) -> None:
+        self._structure_dirty = True
+
+    def mark_dirty(self) -> None:
+        self._values_dirty = True
+        self._root.update_screens()
+
+    def index_of(self, node: SceneNode) -> int:
+        return self._node_index[node]
+
+    def rebuild(self) -> None:
+        from .Mesh import Mesh
+
+        nodes = []
+        node_index = {}
+        entry_nodes = []
+        entry_parents = []
+        entry_paths = []
+        levels = []
+        mesh_entries = {}
+        other_entries = []
+
+        level = [(self._root, -1, "/" + self._root.name)]
+        while level:
+            start = len(entry_nodes)
+            next_level = []
+            for node, parent, path in level:
+                if node not in node_index:
+                    node_index[node] = len(nodes)
+                    nodes.append(node)
+
+                entry = len(entry_nodes)
+                entry_nodes.append(node_index[node])
+                entry_parents.append(parent)
+                entry_paths.append(path)
+
+                if isinstance(node, Mesh):
+                    if node not in mesh_entries:
+                        mesh_entries[node] = []
+                    mesh_entries[node].append(entry)
+                elif node.__class__ is not SceneNode:
+                    other_entries.append((entry, node))
+
+                for child in node._children:
+                    next_level.append((child, entry, path + "/" + child.name))
+
+            levels.append((start, len(entry_nodes)))
+            level = next_level
+
+        n_nodes = len(nodes)
+        positions = np.empty((n_nodes, 3), dtype=np.float32)
+        orientations = np.empty((n_nodes, 4), dtype=np.float32)
+        scales = np.empty((n_nodes, 3), dtype=np.float32)
+        shared_nodes = []
+        pivot_nodes = []
+        for i, node in enumerate(nodes):
+            positions[i] = np.frombuffer(node._position._data, dtype=np.float32)
+            orientations[i] = np.frombuffer(node._orientation._data, dtype=np.float32)
+            scales[i] = np.frombuffer(node._scale._data, dtype=np.float32)
+            if len(node._scenes) > 1:
+                shared_nodes.append((i, node))
+            else:
+                node._position._data = (ctypes.c_float * 3).from_buffer(positions[i])
+                node._orientation._data = (ctypes.c_float * 4).from_buffer(orientations[i])
+                node._scale._data = (ctypes.c_float * 3).from_buffer(scales[i])
+
+            if node._pivot._is_set:
+                pivot_nodes.append((i, node))
+
+        self._nodes = nodes
+        self._node_index = node_index
+        self._shared_nodes = shared_nodes
+        self._pivot_nodes = pivot_nodes
+        self._positions = positions
+        self._orientations = orientations
+        self._scales = scales
+        self._entry_nodes = np.array(entry_nodes, dtype=np.int64)
+        self._entry_parents = np.array(entry_parents, dtype=np.int64)
+        self._entry_paths = entry_paths
+        self._levels = levels
+        self._mesh_entries = {
+            mesh: np.array(entries, dtype=np.int64) for mesh, entries in mesh_entries.items()
+        }
+        self._mesh_rows = {}
+        self._row_meshes = []
+        self._entry_meshes = np.full(len(entry_nodes), -1, dtype=np.int64)
+        self._moved_entries = None
+        self._other_entries = other_entries
+        self._local_mats = np.zeros((n_nodes, 4, 4), dtype=np.float32)
+        self._local_mats[:, 3, 3] = 1
+        self._world_mats = np.empty((len(entry_nodes), 4, 4), dtype=np.float32)
+        self._structure_dirty = False
+
+    def update(self) -> None:
+        previous_mats = None
+        if self._structure_dirty:
+            self.rebuild()
+        elif self._moved_entries is not None:
+            previous_mats = self._world_mats.copy()
+
+        for i, node in self._shared_nodes:
+            self._positions[i] = np.frombuffer(node._position._data, dtype=np.float32)
+            self._orientations[i] = np.frombuffer(node._orientation._data, dtype=np.float32)
+            self._scales[i] = np.frombuffer(node._scale._data, dtype=np.float32)
+
+        self.__update_local_mats()
+
+        local_mats = self._local_mats
+        world_mats = self._world_mats
+        if len(local_mats) != len(world_mats):
+            local_mats = local_mats[self._entry_nodes]
+
+        for start, stop in self._levels:
+            parents = self._entry_parents[start:stop]
+            if parents[0] < 0:
+                world_mats[start:stop] = local_mats[start:stop]
+            else:
+                np.matmul(world_mats[parents], local_mats[start:stop], out=world_mats[start:stop])
+
+        if previous_mats is not None:
+            moved = (previous_mats != world_mats).reshape(len(world_mats), -1).any(axis=1)
+            self._moved_entries = np.union1d(self._moved_entries, np.flatnonzero(moved))
+
+        self._values_dirty = False
+
+    def __update_local_mats(self) -> None:
+        w, x, y, z = self._orientations.T
+        sx, sy, sz = self._scales.T
+        mats = self._local_mats
+
+        xx, yy, zz = x * x, y * y, z * z
+        xy, xz, yz = x * y, x * z, y * z
+        wx, wy, wz = w * x, w * y, w * z
+
+        mats[:, 0, 0] = (1 - 2 * (yy + zz)) * sx
+        mats[:, 1, 0] = 2 * (xy + wz) * sx
+        mats[:, 2, 0] = 2 * (xz - wy) * sx
+        mats[:, 0, 1] = 2 * (xy - wz) * sy
+        mats[:, 1, 1] = (1 - 2 * (xx + zz)) * sy
+        mats[:, 2, 1] = 2 * (yz + wx) * sy
+        mats[:, 0, 2] = 2 * (xz + wy) * sz
+        mats[:, 1, 2] = 2 * (yz - wx) * sz
+        mats[:, 2, 2] = (1 - 2 * (xx + yy)) * sz
+        mats[:, :3, 3] = self._positions
+
+        for i, node in self._pivot_nodes:
+            mats[i] = np.asarray(node.transform_mat, dtype=np.float32).reshape(4, 4).T
+
+    def world_mat(self, entry: int) -> cgm.mat4:
+        return cgm.mat4(*self._world_mats[entry].T.ravel().tolist())
+
+    def world_quat(self, entry: int) -> cgm.quat:
+        chain = []
+        while entry >= 0:
+            chain.append(self._entry_nodes[entry])
+            entry = self._entry_parents[entry]
+
+        quats = self._orientations[chain[::-1]]
+        result = quats[0]
+        for quat in quats[1:]:
+            result = genQuatArray._hamilton(result, quat)
+
+        return cgm.quat(*result.tolist())
+
+    def transform_rows(self, entries: np.ndarray) -> np.ndarray:
+        return self._world_mats[entries, :3, :]
+
+    def bind_instances(self, all_meshes: dict) -> None:
+        entry_paths = self._entry_paths
+        self._mesh_rows = {}
+        self._row_meshes = []
+        self._entry_meshes[:] = -1
+        self._moved_entries = None
+        for mesh, entries in self._mesh_entries.items():
+            if mesh not in all_meshes:
+                continue
+
+            path_index_map = all_meshes[mesh]._path_index_map
+            rows = np.array([path_index_map[entry_paths[entry]] for entry in entries], dtype=np.int64)
+            order = np.argsort(rows)
+            self._mesh_rows[mesh] = entries[order]
+            self._entry_meshes[entries] = len(self._row_meshes)
+            self._row_meshes.append(mesh)
+
+    def write_instances(self, all_meshes: dict) -> bool:
+        if self._moved_entries is None:
+            meshes = self._row_meshes
+        else:
+            mesh_indices = np.unique(self._entry_meshes[self._moved_entries])
+            meshes = [self._row_meshes[i] for i in mesh_indices.tolist() if i >= 0]
+
+        self._moved_entries = np.zeros(0, dtype=np.int64)
+        for mesh in meshes:
+            instances = all_meshes[mesh]
+            rows = self.transform_rows(self._mesh_rows[mesh])
+            instances.set_attribute("affine_transform_row0", rows[:, 0])
+            instances.set_attribute("affine_transform_row1", rows[:, 1])
+            instances.set_attribute("affine_transform_row2", rows[:, 2])
+
+        return len(meshes) > 0
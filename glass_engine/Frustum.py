@@ -0,0 +1,69 @@
+import cgmath as cgm
+import numpy as np
+import math
+
+
+class Frustum:
+
+    def __init__(self, planes: np.ndarray):
+        self._planes = np.asarray(planes, dtype=np.float32).reshape(-1, 4)
+
+    @property
+    def planes(self) -> np.ndarray:
+        return self._planes
+
+    @staticmethod
+    def perspective(tan_half_fov_x: float, tan_half_fov_z: float, near: float, far: float):
+        norm_x = math.sqrt(1 + tan_half_fov_x * tan_half_fov_x)
+        norm_z = math.sqrt(1 + tan_half_fov_z * tan_half_fov_z)
+        return Frustum(
+            [
+                [0, 1, 0, -near],
+                [0, -1, 0, far],
+                [1 / norm_x, tan_half_fov_x / norm_x, 0, 0],
+                [-1 / norm_x, tan_half_fov_x / norm_x, 0, 0],
+                [0, tan_half_fov_z / norm_z, 1 / norm_z, 0],
+                [0, tan_half_fov_z / norm_z, -1 / norm_z, 0],
+            ]
+        )
+
+    @staticmethod
+    def orthographic(width: float, height: float, near: float, far: float):
+        return Frustum(
+            [
+                [0, 1, 0, -near],
+                [0, -1, 0, far],
+                [1, 0, 0, width / 2],
+                [-1, 0, 0, width / 2],
+                [0, 0, 1, height / 2],
+                [0, 0, -1, height / 2],
+            ]
+        )
+
+    @staticmethod
+    def from_camera(camera):
+        if camera.projection_mode == camera.ProjectionMode.Perspective:
+            frustum = Frustum.perspective(
+                camera.aspect * camera.tan_half_fov, camera.tan_half_fov, camera.near, camera.far
+            )
+        else:
+            frustum = Frustum.orthographic(camera.width, camera.height, camera.near, camera.far)
+
+        return frustum.transformed(camera.abs_orientation, camera.abs_position)
+
+    def transformed(self, orientation: cgm.quat, position: cgm.vec3):
+        rotation = np.asarray(cgm.mat3_cast(orientation), dtype=np.float32).reshape(3, 3).T
+        planes = np.empty_like(self._planes)
+        planes[:, :3] = self._planes[:, :3] @ rotation.T
+        planes[:, 3] = self._planes[:, 3] - planes[:, :3] @ np.asarray(position, dtype=np.float32)
+        return Frustum(planes)
+
+    def test_spheres(self, centers: np.ndarray, radii: np.ndarray) -> np.ndarray:
+        distances = centers @ self._planes[:, :3].T + self._planes[:, 3]
+        return np.all(distances >= -radii[:, np.newaxis], axis=1)
+
+    def test_swept_spheres(self, centers: np.ndarray, radii: np.ndarray, direction: cgm.vec3) -> np.ndarray:
+        distances = centers @ self._planes[:, :3].T + self._planes[:, 3]
+        moving_away = self._planes[:, :3] @ np.asarray(direction, dtype=np.float32) <= 0
+        outside = (distances < -radii[:, np.newaxis]) & moving_away
+        return ~np.any(outside, axis=1)
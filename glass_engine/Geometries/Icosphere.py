@@ -94,9 +94,12 @@ class Icosphere(Mesh):
                 vertex1 = vertices[index[1]]
                 vertex2 = vertices[index[2]]
 
-                new_pos0 = cgm.normalize(vertex1.position + vertex2.position)
-                new_pos1 = cgm.normalize(vertex0.position + vertex2.position)
-                new_pos2 = cgm.normalize(vertex0.position + vertex1.position)
+                new_pos0 = vertex1.position + vertex2.position
+                new_pos1 = vertex0.position + vertex2.position
+                new_pos2 = vertex0.position + vertex1.position
+                cgm.normalize(new_pos0, out=new_pos0)
+                cgm.normalize(new_pos1, out=new_pos1)
+                cgm.normalize(new_pos2, out=new_pos2)
 
                 new_vertex0 = Icosphere.__create_vertex(new_pos0, radius=radius)
                 new_vertex1 = Icosphere.__create_vertex(new_pos1, radius=radius)
@@ -197,10 +200,10 @@ class Icosphere(Mesh):
         t = phi / math.pi + 0.5
 
         tex_coord = cgm.vec3(s, t, 0)
-        tangent = 2 * math.pi * cos_phi * cgm.vec3(-sin_theta, cos_theta, 0)
-        bitangent = math.pi * cgm.vec3(
-            -sin_phi * cos_theta, -sin_phi * sin_theta, cos_phi
-        )
+        tangent = cgm.vec3(-sin_theta, cos_theta, 0)
+        tangent *= 2 * math.pi * cos_phi
+        bitangent = cgm.vec3(-sin_phi * cos_theta, -sin_phi * sin_theta, cos_phi)
+        bitangent *= math.pi
         return tex_coord, tangent, bitangent
 
     @staticmethod
@@ -68,18 +68,16 @@ class Sphere(Mesh):
 
                 vertex = Vertex()
 
-                vertex.tangent = (
-                    2 * math.pi * radius * cos_phi * cgm.vec3(-sin_theta, cos_theta, 0)
-                )
-                vertex.bitangent = (
-                    math.pi
-                    * radius
-                    * cgm.vec3(-sin_phi * cos_theta, -sin_phi * sin_theta, cos_phi)
-                )
-                vertex.normal = cgm.vec3(
-                    cos_phi * cos_theta, cos_phi * sin_theta, sin_phi
-                )
-                vertex.position = radius * vertex.normal
+                tangent = cgm.vec3(-sin_theta, cos_theta, 0)
+                tangent *= 2 * math.pi * radius * cos_phi
+                bitangent = cgm.vec3(-sin_phi * cos_theta, -sin_phi * sin_theta, cos_phi)
+                bitangent *= math.pi * radius
+                normal = cgm.vec3(cos_phi * cos_theta, cos_phi * sin_theta, sin_phi)
+
+                vertex.tangent = tangent
+                vertex.bitangent = bitangent
+                vertex.normal = normal
+                vertex.position = radius * normal
                 vertex.tex_coord = cgm.vec3(s, t, 0)
 
                 vertices[i_vertex] = vertex
@@ -75,19 +75,18 @@ class SphericalCap(Mesh):
                 sin_phi = math.sin(phi)
 
                 vertex_top = Vertex()
-                vertex_top.tangent = (
-                    2 * math.pi * radius * cos_phi * cgm.vec3(-sin_theta, cos_theta, 0)
-                )
-                vertex_top.bitangent = (
-                    math.pi
-                    * radius
-                    * cgm.vec3(-sin_phi * cos_theta, -sin_phi * sin_theta, cos_phi)
-                )
-                vertex_top.normal = cgm.vec3(
-                    cos_phi * cos_theta, cos_phi * sin_theta, sin_phi
-                )
-                vertex_top.position = radius * vertex_top.normal
-                vertex_top.position.z -= h_delta
+                tangent = cgm.vec3(-sin_theta, cos_theta, 0)
+                tangent *= 2 * math.pi * radius * cos_phi
+                bitangent = cgm.vec3(-sin_phi * cos_theta, -sin_phi * sin_theta, cos_phi)
+                bitangent *= math.pi * radius
+                normal = cgm.vec3(cos_phi * cos_theta, cos_phi * sin_theta, sin_phi)
+                position = radius * normal
+                position.z -= h_delta
+
+                vertex_top.tangent = tangent
+                vertex_top.bitangent = bitangent
+                vertex_top.normal = normal
+                vertex_top.position = position
                 vertex_top.tex_coord = cgm.vec3(s, t, 0)
 
                 vertices[i_vertex] = vertex_top
@@ -68,7 +68,7 @@ class Torus(Mesh):
             cos_theta = math.cos(theta)
             sin_theta = math.sin(theta)
 
-            tube_center = R * cgm.vec3(cos_theta, sin_theta, 0)
+            tube_center = cgm.vec3(R * cos_theta, R * sin_theta, 0)
             s = R / r * theta / (2 * math.pi)
             if not self.normalize_st:
                 s = self.s_per_unit * 2 * math.pi * R * theta / (2 * math.pi)
@@ -83,10 +83,11 @@ class Torus(Mesh):
                     t = self.t_per_unit * tube_perimeter * phi / (2 * math.pi)
 
                 vertex = Vertex()
-                vertex.normal = cgm.vec3(
-                    cos_phi * cos_theta, cos_phi * sin_theta, sin_phi
-                )
-                vertex.position = tube_center + r * vertex.normal
+                normal = cgm.vec3(cos_phi * cos_theta, cos_phi * sin_theta, sin_phi)
+                position = r * normal
+                position += tube_center
+                vertex.normal = normal
+                vertex.position = position
                 vertex.tex_coord = cgm.vec3(s, t, 0)
 
                 if vertical:
@@ -65,11 +65,12 @@ class TorusFace(Mesh):
             cos_theta = math.cos(theta)
             sin_theta = math.sin(theta)
 
-            edge_inner = inner_radius * cgm.vec3(cos_theta, sin_theta, 0)
-            edge_outer = outer_radius * cgm.vec3(cos_theta, sin_theta, 0)
             if vertical:
-                edge_inner = inner_radius * cgm.vec3(cos_theta, 0, sin_theta)
-                edge_outer = outer_radius * cgm.vec3(cos_theta, 0, sin_theta)
+                edge_inner = cgm.vec3(inner_radius * cos_theta, 0, inner_radius * sin_theta)
+                edge_outer = cgm.vec3(outer_radius * cos_theta, 0, outer_radius * sin_theta)
+            else:
+                edge_inner = cgm.vec3(inner_radius * cos_theta, inner_radius * sin_theta, 0)
+                edge_outer = cgm.vec3(outer_radius * cos_theta, outer_radius * sin_theta, 0)
 
             vertex_inner = Vertex()
             vertex_inner.position = edge_inner
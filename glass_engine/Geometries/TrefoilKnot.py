@@ -65,6 +65,8 @@ class TrefoilKnot(Mesh):
 
         L = 0
         last_normalized_center = None
+        center_delta = cgm.vec3()
+        beta_part = cgm.vec3()
         for i in range(n_lon_divide):
             theta = start_lon + span_lon * i / (n_lon_divide - 1)
             sin_theta = math.sin(theta)
@@ -80,7 +82,7 @@ class TrefoilKnot(Mesh):
             normalized_center = cgm.vec3(x0, y0, z0)
 
             if i > 0:
-                L += cgm.length(normalized_center - last_normalized_center)
+                L += cgm.length(cgm.sub(normalized_center, last_normalized_center, out=center_delta))
 
             last_normalized_center = normalized_center
 
@@ -96,16 +98,17 @@ class TrefoilKnot(Mesh):
             ddy = -cos_theta + 8 * cos_2theta
             ddz = 9 * sin_3theta
 
-            alpha = cgm.normalize(cgm.vec3(dx, dy, dz))
-            gamma = cgm.normalize(
-                cgm.cross(cgm.vec3(dx, dy, dz), cgm.vec3(ddx, ddy, ddz))
-            )
+            alpha = cgm.vec3(dx, dy, dz)
+            gamma = cgm.cross(alpha, cgm.vec3(ddx, ddy, ddz))
+            cgm.normalize(alpha, out=alpha)
+            cgm.normalize(gamma, out=gamma)
             beta = cgm.cross(gamma, alpha)
 
             for j in range(n_lat_divide):
                 phi = start_lat + span_lat * j / (n_lat_divide - 1)
 
-                normal = math.cos(phi) * gamma + math.sin(phi) * beta
+                normal = math.cos(phi) * gamma
+                normal += cgm.mul(beta, math.sin(phi), out=beta_part)
                 x = x0 + r * normal.x
                 y = y0 + r * normal.y
                 z = z0 + r * normal.z
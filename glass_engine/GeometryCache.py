@@ -0,0 +1,140 @@
+from collections import OrderedDict
+from enum import Enum
+import numpy as np
+import cgmath as cgm
+
+
+class GeometryCache:
+
+    enabled: bool = True
+    max_unused: int = 64
+
+    _entries: dict = {}
+    _unused: OrderedDict = OrderedDict()
+    _param_names_map: dict = {}
+
+    class Entry:
+
+        def __init__(self, attr_list_map: dict, indices, state: dict):
+            self.attr_list_map = attr_list_map
+            self.indices = indices
+            self.state = state
+            self.ref_count = 1
+
+    @staticmethod
+    def param_names(cls) -> tuple:
+        if cls not in GeometryCache._param_names_map:
+            names = []
+            for name in dir(cls):
+                attr = getattr(cls, name, None)
+                if isinstance(attr, property) and getattr(attr.fset, "is_param_setter", False):
+                    names.append(name)
+
+            GeometryCache._param_names_map[cls] = tuple(names)
+
+        return GeometryCache._param_names_map[cls]
+
+    @staticmethod
+    def _freeze(value):
+        if value is None or isinstance(value, (bool, int, float, str, Enum)):
+            return value
+
+        if isinstance(value, (list, tuple)):
+            return tuple(GeometryCache._freeze(item) for item in value)
+
+        if isinstance(value, cgm.genArray):
+            value = value.ndarray
+
+        if isinstance(value, cgm.genType):
+            return (type(value).__name__, np.asarray(value).tobytes())
+
+        if isinstance(value, np.generic):
+            return value.item()
+
+        if isinstance(value, np.ndarray):
+            return (value.dtype.str, value.shape, value.tobytes())
+
+        if callable(value):
+            return value
+
+        raise TypeError(f"cannot use {type(value)} as geometry cache key")
+
+    @staticmethod
+    def private_prefixes(cls) -> tuple:
+        prefixes = []
+        for base in cls.__mro__:
+            if base.__name__ == "Mesh":
+                break
+
+            prefixes.append(f"_{base.__name__}__")
+
+        return tuple(prefixes)
+
+    @staticmethod
+    def key_of(mesh, *extra):
+        cls = type(mesh)
+        try:
+            params = tuple(
+                (name, GeometryCache._freeze(getattr(mesh, name)))
+                for name in GeometryCache.param_names(cls)
+            )
+            prefixes = GeometryCache.private_prefixes(cls)
+            fields = tuple(
+                (name, GeometryCache._freeze(value))
+                for name, value in sorted(vars(mesh).items())
+                if name.startswith(prefixes)
+            )
+            key = (cls, params, fields, GeometryCache._freeze(extra))
+            hash(key)
+        except:
+            return None
+
+        return key
+
+    @staticmethod
+    def acquire(key):
+        entry = GeometryCache._entries.get(key, None)
+        if entry is None:
+            return None
+
+        entry.ref_count += 1
+        GeometryCache._unused.pop(key, None)
+        return entry
+
+    @staticmethod
+    def add(key, attr_list_map: dict, indices, state: dict) -> None:
+        GeometryCache._unused.pop(key, None)
+        GeometryCache._entries[key] = GeometryCache.Entry(attr_list_map, indices, state)
+
+    @staticmethod
+    def ref_count(key) -> int:
+        entry = GeometryCache._entries.get(key, None)
+        if entry is None:
+            return 0
+
+        return entry.ref_count
+
+    @staticmethod
+    def release(key) -> None:
+        entry = GeometryCache._entries.get(key, None)
+        if entry is None:
+            return
+
+        entry.ref_count -= 1
+        if entry.ref_count > 0:
+            return
+
+        GeometryCache._unused[key] = entry
+        while len(GeometryCache._unused) > GeometryCache.max_unused:
+            old_key, _ = GeometryCache._unused.popitem(last=False)
+            del GeometryCache._entries[old_key]
+
+    @staticmethod
+    def remove(key) -> None:
+        GeometryCache._entries.pop(key, None)
+        GeometryCache._unused.pop(key, None)
+
+    @staticmethod
+    def clear() -> None:
+        GeometryCache._entries.clear()
+        GeometryCache._unused.clear()
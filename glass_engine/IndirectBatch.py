@@ -0,0 +1,275 @@
+from glass import (
+    ComputeProgram,
+    GLConfig,
+    Vertices,
+    Indices,
+    Instances,
+    AttrList,
+    VBO,
+    SSBO,
+)
+
+from OpenGL import GL
+import cgmath as cgm
+import numpy as np
+import os
+
+
+class IndirectBatch:
+
+    _programs = {}
+    _binding_points = []
+
+    def __init__(self):
+        self._members = []
+        self._structure = None
+        self._sources = None
+        self._vertices = None
+        self._indices = None
+        self._source = None
+        self._target = None
+        self._commands = None
+        self._bounds = None
+        self._n_instances = 0
+
+        self._bounds_vbo = VBO()
+        self._draw_ids_vbo = VBO()
+        self._commands_vbo = VBO()
+        self._slots_vbo = VBO()
+
+    @staticmethod
+    def supported() -> bool:
+        return (GLConfig.major_version, GLConfig.minor_version) >= (4, 3)
+
+    @staticmethod
+    def bucket_key(mesh, instances):
+        if (
+            mesh.primitive_type != GL.GL_TRIANGLES
+            or not mesh.visible
+            or mesh.is_sphere
+            or mesh.material.need_env_map
+            or mesh._back_material.need_env_map
+            or (
+                mesh.build_state != mesh.BuildState.Built
+                and mesh.__class__.__name__ != "Mesh"
+            )
+            or len(mesh._indices) == 0
+            or len(instances) == 0
+        ):
+            return None
+
+        key = (
+            id(mesh._material),
+            id(mesh._back_material),
+            tuple(sorted(mesh.render_hints._values.items())),
+            tuple(
+                (name, attr_list.dtype, attr_list.compression)
+                for name, attr_list in sorted(mesh._vertices._attr_list_map.items())
+            ),
+            tuple(sorted(instances._attr_list_map.keys())),
+            instances.divisor,
+        )
+        try:
+            hash(key)
+        except TypeError:
+            return None
+
+        return key
+
+    @staticmethod
+    def program(name: str) -> ComputeProgram:
+        if name in IndirectBatch._programs:
+            return IndirectBatch._programs[name]
+
+        self_folder = os.path.dirname(os.path.abspath(__file__))
+        program = ComputeProgram()
+        program.compile(self_folder + f"/glsl/Pipelines/gpu_culling/{name}.comp")
+        IndirectBatch._programs[name] = program
+        return program
+
+    @staticmethod
+    def _bind_buffers(program: ComputeProgram, buffers: dict) -> None:
+        while len(IndirectBatch._binding_points) < len(buffers):
+            IndirectBatch._binding_points.append(SSBO._get_binding_point())
+
+        program.use()
+        for binding_point, (block_name, bo) in zip(IndirectBatch._binding_points, buffers.items()):
+            block_index = program._shader_storage_blocks.info[block_name].index
+            GL.glShaderStorageBlockBinding(program.id, block_index, binding_point)
+            GL.glBindBufferBase(GL.GL_SHADER_STORAGE_BUFFER, binding_point, bo.id)
+
+    @property
+    def members(self) -> list:
+        return self._members
+
+    def update(self, members: list, instance_bounds) -> None:
+        structure = tuple(
+            (
+                id(mesh._vertices),
+                len(mesh._vertices),
+                tuple(id(attr_list) for attr_list in mesh._vertices._attr_list_map.values()),
+                id(mesh._indices),
+                len(mesh._indices),
+                id(instances),
+                len(instances),
+            )
+            for mesh, instances in members
+        )
+        sources = tuple(
+            (instances._version, mesh._geometry_version) for mesh, instances in members
+        )
+        self._members = members
+        if structure != self._structure:
+            self._structure = structure
+            self.__rebuild()
+        elif sources == self._sources:
+            return
+
+        self._sources = sources
+        self.__update_instances(instance_bounds)
+
+    def __rebuild(self) -> None:
+        meshes = [mesh for mesh, _ in self._members]
+        self._vertices = Vertices(draw_type=GL.GL_STATIC_DRAW)
+        for name, first in meshes[0]._vertices._attr_list_map.items():
+            array = np.concatenate([mesh._vertices._attr_list_map[name].ndarray for mesh in meshes])
+            self._vertices._attr_list_map[name] = AttrList(
+                array, draw_type=GL.GL_STATIC_DRAW, dtype=first.dtype, compression=first.compression
+            )
+
+        self._indices = Indices(
+            np.concatenate([mesh._indices.ndarray for mesh in meshes]).astype(np.uint32)
+        )
+
+        n_elements = np.array([3 * len(mesh._indices) for mesh in meshes], dtype=np.uint32)
+        n_vertices = np.array([len(mesh._vertices) for mesh in meshes], dtype=np.uint32)
+        n_instances = np.array([len(instances) for _, instances in self._members], dtype=np.uint32)
+        self._commands = np.zeros((len(meshes), 5), dtype=np.uint32)
+        self._commands[:, 0] = n_elements
+        self._commands[1:, 2] = np.cumsum(n_elements)[:-1]
+        self._commands[1:, 3] = np.cumsum(n_vertices)[:-1]
+        self._commands[1:, 4] = np.cumsum(n_instances)[:-1]
+
+        self._n_instances = int(n_instances.sum())
+        self._draw_ids_vbo.bufferData(
+            np.repeat(np.arange(len(meshes), dtype=np.uint32), n_instances), GL.GL_STATIC_DRAW
+        )
+        self._slots_vbo.malloc(4 * self._n_instances, GL.GL_DYNAMIC_COPY)
+        self._commands_vbo.malloc(self._commands.nbytes, GL.GL_DYNAMIC_DRAW)
+        self._source = None
+        self._target = None
+        self._bounds = None
+
+    def __update_instances(self, instance_bounds) -> None:
+        first_instances = self._members[0][1]
+        if self._source is None:
+            self._source = Instances(draw_type=GL.GL_DYNAMIC_DRAW)
+            self._target = Instances(draw_type=GL.GL_DYNAMIC_DRAW)
+
+        for name, attr_list in first_instances._attr_list_map.items():
+            array = np.concatenate(
+                [instances._attr_list_map[name].ndarray for _, instances in self._members]
+            )
+            if name not in self._source._attr_list_map:
+                self._source._attr_list_map[name] = AttrList(
+                    array, draw_type=GL.GL_DYNAMIC_DRAW, dtype=attr_list.dtype
+                )
+                self._target._attr_list_map[name] = AttrList(
+                    np.zeros_like(array), draw_type=GL.GL_DYNAMIC_DRAW, dtype=attr_list.dtype
+                )
+            elif not np.array_equal(self._source._attr_list_map[name].ndarray, array):
+                self._source._attr_list_map[name].ndarray = array
+
+        bounds = np.empty((self._n_instances, 4), dtype=np.float32)
+        start = 0
+        for mesh, instances in self._members:
+            stop = start + len(instances)
+            spheres = instance_bounds.spheres(mesh, instances)
+            if spheres is None:
+                bounds[start:stop, :3] = 0
+                bounds[start:stop, 3] = np.finfo(np.float32).max
+            else:
+                bounds[start:stop, :3] = spheres[0]
+                bounds[start:stop, 3] = spheres[1]
+
+            if "visible" in instances._attr_list_map:
+                hidden = instances._attr_list_map["visible"].ndarray.reshape(-1) == 0
+                bounds[start:stop, 3][hidden] = -1
+
+            start = stop
+
+        if self._bounds is None or not np.array_equal(self._bounds, bounds):
+            self._bounds = bounds
+            self._bounds_vbo.bufferData(bounds, GL.GL_DYNAMIC_DRAW)
+
+    def __cull(self, frustum) -> bool:
+        for name, source_list in self._source._attr_list_map.items():
+            target_list = self._target._attr_list_map[name]
+            if source_list.dtype != target_list.dtype:
+                source_list.dtype = target_list.dtype
+
+            source_list._apply()
+            if source_list.stride % 4 != 0 or source_list.stride != target_list.stride:
+                return False
+
+        if frustum is None:
+            planes = [cgm.vec4(0) for _ in range(6)]
+        else:
+            planes = [cgm.vec4(*plane) for plane in frustum.planes]
+
+        self._commands[:, 1] = 0
+        self._commands_vbo.bufferSubData(0, self._commands.nbytes, self._commands)
+
+        cull_program = IndirectBatch.program("cull_instances")
+        cull_program["frustum_planes"] = planes
+        cull_program["n_instances"] = self._n_instances
+        IndirectBatch._bind_buffers(
+            cull_program,
+            {
+                "InstanceBounds": self._bounds_vbo,
+                "InstanceDrawIDs": self._draw_ids_vbo,
+                "DrawCommands": self._commands_vbo,
+                "InstanceSlots": self._slots_vbo,
+            },
+        )
+        n_groups = (self._n_instances + 63) // 64
+        cull_program.compute(n_groups, barrier=GL.GL_SHADER_STORAGE_BARRIER_BIT)
+
+        scatter_program = IndirectBatch.program("scatter_instances")
+        for name, source_list in self._source._attr_list_map.items():
+            target_list = self._target._attr_list_map[name]
+            row_words = source_list.stride // 4
+            scatter_program["n_instances"] = self._n_instances
+            scatter_program["row_words"] = row_words
+            IndirectBatch._bind_buffers(
+                scatter_program,
+                {
+                    "InstanceSlots": self._slots_vbo,
+                    "SourceRows": source_list._vbo,
+                    "TargetRows": target_list._vbo,
+                },
+            )
+            n_groups = (self._n_instances * row_words + 63) // 64
+            scatter_program.start_computing(n_groups)
+
+        scatter_program.join(GL.GL_COMMAND_BARRIER_BIT | GL.GL_VERTEX_ATTRIB_ARRAY_BARRIER_BIT)
+        return True
+
+    def draw(self, program, frustum=None) -> bool:
+        if not self._members:
+            return True
+
+        self._vertices._apply(program, self._target)
+        if not self.__cull(frustum):
+            return False
+
+        with self._members[0][0].render_hints:
+            program.multi_draw_triangles_indirect(
+                self._vertices,
+                self._indices,
+                self._target,
+                self._commands_vbo,
+                len(self._members),
+            )
+
+        return True
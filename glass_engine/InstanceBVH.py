@@ -0,0 +1,268 @@
+import numpy as np
+
+
+class InstanceBVH:
+
+    def __init__(self, leaf_size: int = 8, rebuild_ratio: float = 2.0, linear_ratio: float = 0.5):
+        self._leaf_size = leaf_size
+        self._rebuild_ratio = rebuild_ratio
+        self._linear_ratio = linear_ratio
+        self._structure = None
+        self._centers = np.zeros((0, 3), dtype=np.float32)
+        self._radii = np.zeros(0, dtype=np.float32)
+        self._order = np.zeros(0, dtype=np.int64)
+        self._ranks = np.zeros(0, dtype=np.int64)
+        self._sorted_centers = self._centers
+        self._sorted_radii = self._radii
+        self._mins = []
+        self._maxs = []
+        self._build_area = 0.0
+        self._rebuilds = 0
+        self._refits = 0
+        self._stale = False
+
+    def __len__(self):
+        return len(self._radii)
+
+    @property
+    def leaf_size(self) -> int:
+        return self._leaf_size
+
+    @property
+    def depth(self) -> int:
+        return len(self._mins)
+
+    @property
+    def rebuilds(self) -> int:
+        return self._rebuilds
+
+    @property
+    def refits(self) -> int:
+        return self._refits
+
+    @property
+    def stale(self) -> bool:
+        return self._stale
+
+    @staticmethod
+    def _spread_bits(values: np.ndarray) -> np.ndarray:
+        values = values.astype(np.uint32) & 0x3FF
+        values = (values | (values << 16)) & 0x030000FF
+        values = (values | (values << 8)) & 0x0300F00F
+        values = (values | (values << 4)) & 0x030C30C3
+        values = (values | (values << 2)) & 0x09249249
+        return values
+
+    @staticmethod
+    def morton_codes(centers: np.ndarray) -> np.ndarray:
+        lower = centers.min(axis=0)
+        extent = np.maximum(centers.max(axis=0) - lower, 1e-12)
+        grid = ((centers - lower) / extent * 1023).astype(np.uint32)
+        return (
+            (InstanceBVH._spread_bits(grid[:, 0]) << 2)
+            | (InstanceBVH._spread_bits(grid[:, 1]) << 1)
+            | InstanceBVH._spread_bits(grid[:, 2])
+        )
+
+    @staticmethod
+    def _surface_area(mins: np.ndarray, maxs: np.ndarray) -> float:
+        size = maxs - mins
+        return float(
+            np.sum(size[:, 0] * size[:, 1] + size[:, 1] * size[:, 2] + size[:, 2] * size[:, 0])
+        )
+
+    def update(self, centers: np.ndarray, radii: np.ndarray, structure=None) -> None:
+        centers = np.asarray(centers, dtype=np.float32).reshape(-1, 3)
+        radii = np.asarray(radii, dtype=np.float32).reshape(-1)
+        if structure != self._structure or len(radii) != len(self._radii):
+            self._structure = structure
+            self._centers = centers.copy()
+            self._radii = radii.copy()
+            self.rebuild()
+            return
+
+        moved = centers != self._centers
+        changed = np.flatnonzero(moved[:, 0] | moved[:, 1] | moved[:, 2] | (radii != self._radii))
+        if len(changed) == 0 and not self._stale:
+            return
+
+        self._centers[changed] = centers[changed]
+        self._radii[changed] = radii[changed]
+        ranks = self._ranks[changed]
+        leaves = np.unique(ranks // self._leaf_size)
+        if len(leaves) > self._linear_ratio * len(self._mins[-1]):
+            self._stale = True
+            return
+
+        if self._stale:
+            self.__ensure_fitted()
+            return
+
+        self._sorted_centers[ranks] = centers[changed]
+        self._sorted_radii[ranks] = radii[changed]
+        self._refits += 1
+        self.__refit_leaves(leaves)
+        self.__check_rebuild()
+
+    def __check_rebuild(self) -> None:
+        if (
+            len(self._mins) > 0
+            and InstanceBVH._surface_area(self._mins[-1], self._maxs[-1])
+            > self._rebuild_ratio * self._build_area
+        ):
+            self.rebuild()
+
+    def __ensure_fitted(self) -> None:
+        if self._stale:
+            self.refit()
+            self.__check_rebuild()
+
+    def rebuild(self) -> None:
+        self._rebuilds += 1
+        if len(self._radii) == 0:
+            self._order = np.zeros(0, dtype=np.int64)
+        else:
+            self._order = np.argsort(InstanceBVH.morton_codes(self._centers), kind="stable")
+
+        self._ranks = np.empty_like(self._order)
+        self._ranks[self._order] = np.arange(len(self._order))
+        self.__fit()
+        if len(self._mins) > 0:
+            self._build_area = InstanceBVH._surface_area(self._mins[-1], self._maxs[-1])
+
+    def refit(self) -> None:
+        self._refits += 1
+        self.__fit()
+
+    def __refit_leaves(self, leaves: np.ndarray) -> None:
+        n = len(self._radii)
+        items = np.minimum(
+            leaves[:, np.newaxis] * self._leaf_size + np.arange(self._leaf_size), n - 1
+        )
+        radii = self._sorted_radii[items][..., np.newaxis]
+        centers = self._sorted_centers[items]
+        self._mins[-1][leaves] = (centers - radii).min(axis=1)
+        self._maxs[-1][leaves] = (centers + radii).max(axis=1)
+
+        nodes = leaves
+        for depth in range(len(self._mins) - 1, 0, -1):
+            child_mins = self._mins[depth]
+            child_maxs = self._maxs[depth]
+            nodes = np.unique(nodes // 2)
+            left = 2 * nodes
+            right = np.minimum(left + 1, len(child_mins) - 1)
+            self._mins[depth - 1][nodes] = np.minimum(child_mins[left], child_mins[right])
+            self._maxs[depth - 1][nodes] = np.maximum(child_maxs[left], child_maxs[right])
+
+    def __fit(self) -> None:
+        self._stale = False
+        n = len(self._radii)
+        self._sorted_centers = self._centers[self._order]
+        self._sorted_radii = self._radii[self._order]
+        self._mins = []
+        self._maxs = []
+        if n == 0:
+            return
+
+        n_leaves = (n + self._leaf_size - 1) // self._leaf_size
+        padding = n_leaves * self._leaf_size - n
+        radii = self._sorted_radii[:, np.newaxis]
+        mins = self._sorted_centers - radii
+        maxs = self._sorted_centers + radii
+        if padding > 0:
+            mins = np.concatenate([mins, np.repeat(mins[-1:], padding, axis=0)])
+            maxs = np.concatenate([maxs, np.repeat(maxs[-1:], padding, axis=0)])
+
+        mins = mins.reshape(n_leaves, self._leaf_size, 3).min(axis=1)
+        maxs = maxs.reshape(n_leaves, self._leaf_size, 3).max(axis=1)
+        self._mins.append(mins)
+        self._maxs.append(maxs)
+        while len(mins) > 1:
+            if len(mins) % 2 == 1:
+                mins = np.concatenate([mins, mins[-1:]])
+                maxs = np.concatenate([maxs, maxs[-1:]])
+
+            mins = np.minimum(mins[0::2], mins[1::2])
+            maxs = np.maximum(maxs[0::2], maxs[1::2])
+            self._mins.append(mins)
+            self._maxs.append(maxs)
+
+        self._mins.reverse()
+        self._maxs.reverse()
+
+    def __leaf_items(self, leaves: np.ndarray) -> np.ndarray:
+        items = (leaves[:, np.newaxis] * self._leaf_size + np.arange(self._leaf_size)).reshape(-1)
+        return items[items < len(self._radii)]
+
+    @staticmethod
+    def __children(nodes: np.ndarray, n_children: int) -> np.ndarray:
+        children = np.concatenate([2 * nodes, 2 * nodes + 1])
+        return children[children < n_children]
+
+    def query(self, test) -> np.ndarray:
+        if self._stale:
+            return np.array(test(self._centers, self._radii), dtype=np.bool_)
+
+        mask = np.zeros(len(self._radii), dtype=np.bool_)
+        if len(self._mins) == 0:
+            return mask
+
+        nodes = np.zeros(1, dtype=np.int64)
+        for depth, (mins, maxs) in enumerate(zip(self._mins, self._maxs)):
+            if depth > 0:
+                nodes = InstanceBVH.__children(nodes, len(mins))
+
+            node_mins = mins[nodes]
+            node_maxs = maxs[nodes]
+            centers = 0.5 * (node_mins + node_maxs)
+            radii = 0.5 * np.linalg.norm(node_maxs - node_mins, axis=1)
+            nodes = nodes[test(centers, radii)]
+            if len(nodes) == 0:
+                return mask
+
+        items = self.__leaf_items(nodes)
+        items = items[test(self._sorted_centers[items], self._sorted_radii[items])]
+        mask[self._order[items]] = True
+        return mask
+
+    def ray_cast(self, origin, direction, max_distance: float = np.inf):
+        origin = np.asarray(origin, dtype=np.float64).reshape(3)
+        direction = np.asarray(direction, dtype=np.float64).reshape(3)
+        direction = direction / np.linalg.norm(direction)
+        empty = (np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.float64))
+        self.__ensure_fitted()
+        if len(self._mins) == 0:
+            return empty
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            inv_direction = 1 / direction
+
+        nodes = np.zeros(1, dtype=np.int64)
+        for depth, (mins, maxs) in enumerate(zip(self._mins, self._maxs)):
+            if depth > 0:
+                nodes = InstanceBVH.__children(nodes, len(mins))
+
+            with np.errstate(invalid="ignore"):
+                t0 = (mins[nodes] - origin) * inv_direction
+                t1 = (maxs[nodes] - origin) * inv_direction
+
+            t0 = np.where(np.isnan(t0), -np.inf, t0)
+            t1 = np.where(np.isnan(t1), np.inf, t1)
+            t_near = np.minimum(t0, t1).max(axis=1)
+            t_far = np.maximum(t0, t1).min(axis=1)
+            nodes = nodes[(t_near <= t_far) & (t_far >= 0) & (t_near <= max_distance)]
+            if len(nodes) == 0:
+                return empty
+
+        items = self.__leaf_items(nodes)
+        offsets = self._sorted_centers[items] - origin
+        axial = offsets @ direction
+        squared_distances = np.einsum("ij,ij->i", offsets, offsets) - axial * axial
+        radii = self._sorted_radii[items].astype(np.float64)
+        half_chords = np.sqrt(np.maximum(radii * radii - squared_distances, 0))
+        distances = np.maximum(axial - half_chords, 0)
+        hit = (squared_distances <= radii * radii) & (axial + half_chords >= 0) & (distances <= max_distance)
+        items = items[hit]
+        distances = distances[hit]
+        sorted_indices = np.argsort(distances, kind="stable")
+        return self._order[items[sorted_indices]], distances[sorted_indices]
@@ -0,0 +1,108 @@
+import numpy as np
+
+
+class InstanceBounds:
+
+    class Entry:
+
+        def __init__(self):
+            self.geometry_version = None
+            self.version = None
+            self.local_bounds = None
+            self.rows = None
+            self.centers = None
+            self.radii = None
+
+    def __init__(self):
+        self._entries = {}
+        self._used = set()
+
+    @staticmethod
+    def local_bounds(mesh):
+        bounds = (mesh.x_min, mesh.x_max, mesh.y_min, mesh.y_max, mesh.z_min, mesh.z_max)
+        if not any(bounds):
+            return None
+
+        return tuple(float(value) for value in bounds)
+
+    @staticmethod
+    def transform_rows(instances):
+        attr_list_map = instances._attr_list_map
+        try:
+            return np.stack(
+                [
+                    attr_list_map["affine_transform_row0"].ndarray,
+                    attr_list_map["affine_transform_row1"].ndarray,
+                    attr_list_map["affine_transform_row2"].ndarray,
+                ],
+                axis=1,
+            ).astype(np.float32, copy=False)
+        except (KeyError, ValueError):
+            return None
+
+    @staticmethod
+    def spheres_of(local_bounds: tuple, rows: np.ndarray):
+        x_min, x_max, y_min, y_max, z_min, z_max = local_bounds
+        local_center = np.array(
+            [0.5 * (x_min + x_max), 0.5 * (y_min + y_max), 0.5 * (z_min + z_max)], dtype=np.float32
+        )
+        local_radius = 0.5 * np.linalg.norm([x_max - x_min, y_max - y_min, z_max - z_min])
+
+        linear = rows[:, :, :3]
+        centers = linear @ local_center + rows[:, :, 3]
+        gram = np.abs(linear.transpose(0, 2, 1) @ linear)
+        max_scales = np.sqrt(gram.sum(axis=2).max(axis=1))
+        return centers, (local_radius * max_scales).astype(np.float32)
+
+    def spheres(self, mesh, instances):
+        entry = self._entries.get(instances, None)
+        geometry_version = (id(mesh), mesh._geometry_version)
+        version = instances._version
+        if entry is not None and entry.geometry_version == geometry_version:
+            if entry.version == version:
+                self._used.add(instances)
+                return entry.centers, entry.radii
+
+            local_bounds = entry.local_bounds
+        else:
+            local_bounds = InstanceBounds.local_bounds(mesh)
+
+        if local_bounds is None:
+            return None
+
+        rows = InstanceBounds.transform_rows(instances)
+        if rows is None or rows.shape[1:] != (3, 4):
+            return None
+
+        self._used.add(instances)
+        if (
+            entry is None
+            or entry.local_bounds != local_bounds
+            or len(entry.rows) != len(rows)
+        ):
+            entry = InstanceBounds.Entry()
+            entry.geometry_version = geometry_version
+            entry.version = version
+            entry.local_bounds = local_bounds
+            entry.rows = rows.copy()
+            entry.centers, entry.radii = InstanceBounds.spheres_of(local_bounds, rows)
+            self._entries[instances] = entry
+            return entry.centers, entry.radii
+
+        entry.geometry_version = geometry_version
+        entry.version = version
+        changed = np.nonzero(np.any(rows != entry.rows, axis=(1, 2)))[0]
+        if len(changed) > 0:
+            entry.rows[changed] = rows[changed]
+            entry.centers[changed], entry.radii[changed] = InstanceBounds.spheres_of(
+                local_bounds, rows[changed]
+            )
+
+        return entry.centers, entry.radii
+
+    def collect_garbage(self) -> None:
+        for instances in list(self._entries.keys()):
+            if instances not in self._used:
+                del self._entries[instances]
+
+        self._used.clear()
@@ -67,25 +67,26 @@ class ModelViewManipulator(Manipulator):
         azimuth = self.__azimuth / 180 * math.pi
         elevation = self.__elevation / 180 * math.pi
 
-        self.camera.position.x = (
-            self.__distance * math.cos(elevation) * math.sin(azimuth)
-        )
-        self.camera.position.y = (
-            -self.__distance * math.cos(elevation) * math.cos(azimuth)
-        )
-        self.camera.position.z = self.__distance * math.sin(elevation)
-
-        if cgm.length(self.__offset) > 1e-6:
-            right = cgm.vec3(math.cos(azimuth), math.sin(azimuth), 0)
-            forward = cgm.vec3(
-                -math.sin(elevation) * math.sin(azimuth),
-                math.sin(elevation) * math.cos(azimuth),
-                math.cos(elevation),
+        with self.camera.batch_update():
+            self.camera.position.x = (
+                self.__distance * math.cos(elevation) * math.sin(azimuth)
             )
-            self.camera.position += self.__offset.x * right + self.__offset.y * forward
+            self.camera.position.y = (
+                -self.__distance * math.cos(elevation) * math.cos(azimuth)
+            )
+            self.camera.position.z = self.__distance * math.sin(elevation)
+
+            if cgm.length(self.__offset) > 1e-6:
+                right = cgm.vec3(math.cos(azimuth), math.sin(azimuth), 0)
+                forward = cgm.vec3(
+                    -math.sin(elevation) * math.sin(azimuth),
+                    math.sin(elevation) * math.cos(azimuth),
+                    math.cos(elevation),
+                )
+                self.camera.position += self.__offset.x * right + self.__offset.y * forward
 
-        self.camera.pitch = -self.__elevation
-        self.camera.yaw = self.__azimuth
+            self.camera.pitch = -self.__elevation
+            self.camera.yaw = self.__azimuth
 
     def startup(self):
         self.__update_camera()
@@ -249,5 +250,5 @@ class ModelViewManipulator(Manipulator):
         if Manipulator.Key.Key_F in keys:
             screen = self.camera.screen
             screen.update()
-            print("fps:", screen.fps, "draw calls:", screen.draw_calls)
+            print("fps:", screen.fps, "draw calls:", screen.draw_calls, "instances:", screen.draw_instances, "culled:", screen.culled_instances)
 
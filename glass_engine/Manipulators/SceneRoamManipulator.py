@@ -180,4 +180,4 @@ class SceneRoamManipulator(Manipulator):
             self.camera.position += self.camera.orientation * cgm.vec3(0, 0, -d)
         if Manipulator.Key.Key_F in keys:
             screen = self.camera.screen
-            print("fps:", screen.fps, "draw calls:", screen.draw_calls)
+            print("fps:", screen.fps, "draw calls:", screen.draw_calls, "instances:", screen.draw_instances, "culled:", screen.culled_instances)
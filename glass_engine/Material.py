@@ -194,6 +194,7 @@ class Material(metaclass=MetaInstancesRecorder):
             return_value = safe_func(*args, **kwargs)
 
             self._update_all_env_maps()
+            self._update_all_classifications()
             if func.__name__ == "generate_shadows":
                 self._update_all_depth_maps()
 
@@ -943,6 +944,10 @@ class Material(metaclass=MetaInstancesRecorder):
             for scene in mesh.scenes:
                 scene._should_update_depth_maps = True
 
+    def _update_all_classifications(self):
+        for mesh in self._parent_meshes:
+            mesh._update_classification()
+
     def _update_all_env_maps(self):
         for mesh in self._parent_meshes:
             for scene in mesh.scenes:
@@ -1,11 +1,13 @@
 from __future__ import annotations
 from .SceneNode import SceneNode
 from .Material import Material
-from .algorithm import generate_auto_TBN, generate_smooth_TBN
+from .GeometryCache import GeometryCache
+from .algorithm import generate_auto_TBN, generate_smooth_TBN, optimize_mesh_buffers
 
 from glass import ShaderProgram, Instances, Vertices, Indices, GLInfo, RenderHints
 from glass.utils import checktype
 from glass.AttrList import AttrList
+from glass.MetaInstancesRecorder import MetaInstancesRecorder
 
 import cgmath as cgm
 from functools import wraps
@@ -30,6 +32,21 @@ class Mesh(SceneNode):
         Building = 1
         Built = 2
 
+    __v01 = cgm.vec3()
+    __v02 = cgm.vec3()
+    __temp = cgm.vec3()
+    __geometry_key = None
+    _classify_generation = 0
+    _geometry_generation = 0
+    __unshared_state = (
+        "_vertices",
+        "_indices",
+        "_builder",
+        "_build_state",
+        "_geometry_version",
+        "_Mesh__geometry_key",
+    )
+
     @checktype
     def __init__(
         self,
@@ -53,6 +70,8 @@ class Mesh(SceneNode):
         self._y_max = 0
         self._z_min = 0
         self._z_max = 0
+        self._bounds_user_set = False
+        self._geometry_version = 0
         self._builder = None
         self._build_state = Mesh.BuildState.NotBuilt
         self._normalize_st = normalize_st
@@ -78,17 +97,26 @@ class Mesh(SceneNode):
 
         self._should_add_color = True
         self._should_callback = True
+        self._uniform_colors = None
 
         self._material = Material()
         self._material._parent_meshes.add(self)
         self._back_material = self._material
         self._back_material_user_set = False
         self._render_hints = RenderHints(self)
+        self._classify_version = 0
 
         self.__block = block
         self.__surf_type = surf_type
         self.__primitive = primitive_type
         self.__self_calculated_normal = False
+        self.__optimize_buffers = False
+        self.__optimize_overdraw = False
+        self.__optimization_report = None
+
+    @MetaInstancesRecorder.delete
+    def __del__(self):
+        self.__release_geometry()
 
     def __hash__(self):
         return id(self)
@@ -117,12 +145,26 @@ class Mesh(SceneNode):
             return_value = safe_func(*args, **kwargs)
 
             self._build_state = Mesh.BuildState.NotBuilt
+            self.__reset_bounding_box()
+            self._update_classification()
             self.update_screens()
 
             return return_value
 
+        wrapper.is_param_setter = True
         return wrapper
 
+    def _update_classification(self):
+        self._classify_version += 1
+        Mesh._classify_generation += 1
+
+    def _update_geometry_version(self):
+        self._geometry_version += 1
+        Mesh._geometry_generation += 1
+
+    def _visible_changed(self):
+        self._update_classification()
+
     @property
     def self_calculated_normal(self):
         return self.__self_calculated_normal
@@ -205,8 +247,21 @@ class Mesh(SceneNode):
         else:
             self._vertices._attr_list_map["back_color"].ndarray = back_color_array
 
+        self.__update_uniform_colors()
         self.update_screens()
 
+    def __update_uniform_colors(self):
+        color_list = self._vertices._attr_list_map.get("color", None)
+        back_color_list = self._vertices._attr_list_map.get("back_color", None)
+        if not color_list or not back_color_list:
+            self._uniform_colors = None
+            return
+
+        self._uniform_colors = (
+            tuple(color_list.ndarray.reshape(len(color_list), -1)[0].tolist()),
+            tuple(back_color_list.ndarray.reshape(len(back_color_list), -1)[0].tolist()),
+        )
+
     def _color_change_callback(self):
         if not self._should_callback:
             return
@@ -235,6 +290,7 @@ class Mesh(SceneNode):
             else:
                 self._vertices._attr_list_map["back_color"].ndarray = color_array
 
+        self.__update_uniform_colors()
         self._should_callback = True
 
     @property
@@ -297,6 +353,7 @@ class Mesh(SceneNode):
             else:
                 self._vertices._attr_list_map["back_color"].ndarray = color_array
 
+        self.__update_uniform_colors()
         self.update_screens()
 
     @property
@@ -376,6 +433,7 @@ class Mesh(SceneNode):
         else:
             self._vertices._attr_list_map["back_color"].ndarray = color_array
 
+        self.__update_uniform_colors()
         self._should_callback = True
         self.update_screens()
 
@@ -432,6 +490,8 @@ class Mesh(SceneNode):
             )
         else:
             self._vertices._attr_list_map["back_color"].ndarray = color_array
+
+        self.__update_uniform_colors()
         self.update_screens()
 
     @property
@@ -454,6 +514,7 @@ class Mesh(SceneNode):
             self._back_material = material
 
         self._back_material_user_set = True
+        self._update_classification()
         self.update_screens()
 
     @property
@@ -469,6 +530,28 @@ class Mesh(SceneNode):
     def surf_type(self, surf_type: SurfType):
         self.__surf_type = surf_type
 
+    @property
+    def optimize_buffers(self)->bool:
+        return self.__optimize_buffers
+
+    @optimize_buffers.setter
+    @param_setter
+    def optimize_buffers(self, flag:bool):
+        self.__optimize_buffers = flag
+
+    @property
+    def optimize_overdraw(self)->bool:
+        return self.__optimize_overdraw
+
+    @optimize_overdraw.setter
+    @param_setter
+    def optimize_overdraw(self, flag:bool):
+        self.__optimize_overdraw = flag
+
+    @property
+    def optimization_report(self)->dict:
+        return self.__optimization_report
+
     @property
     def block(self):
         return self.__block
@@ -496,62 +579,89 @@ class Mesh(SceneNode):
 
     @property
     def x_min(self):
+        self.__build()
         return self._x_min
 
     @x_min.setter
     @checktype
     def x_min(self, x_min: float):
         self._x_min = x_min
+        self._bounds_user_set = True
+        self._update_geometry_version()
 
     @property
     def x_max(self):
+        self.__build()
         return self._x_max
 
     @x_max.setter
     @checktype
     def x_max(self, x_max: float):
         self._x_max = x_max
+        self._bounds_user_set = True
+        self._update_geometry_version()
 
     @property
     def y_min(self):
+        self.__build()
         return self._y_min
 
     @y_min.setter
     @checktype
     def y_min(self, y_min: float):
         self._y_min = y_min
+        self._bounds_user_set = True
+        self._update_geometry_version()
 
     @property
     def y_max(self):
+        self.__build()
         return self._y_max
 
     @y_max.setter
     @checktype
     def y_max(self, y_max: float):
         self._y_max = y_max
+        self._bounds_user_set = True
+        self._update_geometry_version()
 
     @property
     def z_min(self):
+        self.__build()
         return self._z_min
 
     @z_min.setter
     @checktype
     def z_min(self, z_min: float):
         self._z_min = z_min
+        self._bounds_user_set = True
+        self._update_geometry_version()
 
     @property
     def z_max(self):
+        self.__build()
         return self._z_max
 
     @z_max.setter
     @checktype
     def z_max(self, z_max: float):
         self._z_max = z_max
+        self._bounds_user_set = True
+        self._update_geometry_version()
 
     def __build(self):
         if self.__class__.__name__ == "Mesh" or self._build_state != Mesh.BuildState.NotBuilt:
             return
 
+        self.__own_geometry()
+        geometry_key = None
+        if self.__block and GeometryCache.enabled:
+            geometry_key = GeometryCache.key_of(self, self.__primitive)
+            if geometry_key is not None and self.__share_geometry(geometry_key):
+                self._build_state = Mesh.BuildState.Built
+                return
+
+        old_state = dict(self.__dict__)
         self._build_state = Mesh.BuildState.Building
         if self.__block:
             if inspect.isgeneratorfunction(self.build):
@@ -569,6 +679,8 @@ class Mesh(SceneNode):
                 self._builder = None
 
             self._build_state = Mesh.BuildState.Built
+            if geometry_key is not None:
+                self.__add_geometry(geometry_key, old_state)
 
         else:  # not block
             if inspect.isgeneratorfunction(self.build):
@@ -585,6 +697,72 @@ class Mesh(SceneNode):
                 self._builder = None
                 self._build_state = Mesh.BuildState.Built
 
+    def __share_geometry(self, geometry_key) -> bool:
+        entry = GeometryCache.acquire(geometry_key)
+        if entry is None:
+            return False
+
+        self.__dict__.update(entry.state)
+        vertices = Vertices(draw_type=self._vertices.draw_type)
+        for key, attr_list in entry.attr_list_map.items():
+            vertices._attr_list_map[key] = attr_list._share()
+        self._vertices = vertices
+        self._indices = entry.indices._share()
+        self.__geometry_key = geometry_key
+
+        self.__set_color()
+        self.__calculate_bounding_box()
+        return True
+
+    def __add_geometry(self, geometry_key, old_state: dict) -> None:
+        state = {}
+        for key, value in self.__dict__.items():
+            if key in Mesh.__unshared_state:
+                continue
+
+            if key not in old_state or old_state[key] is not value:
+                state[key] = value
+
+        attr_list_map = dict(self._vertices._attr_list_map)
+        if self._should_add_color:
+            attr_list_map.pop("color", None)
+            attr_list_map.pop("back_color", None)
+
+        GeometryCache.add(geometry_key, attr_list_map, self._indices, state)
+        for key, attr_list in attr_list_map.items():
+            self._vertices._attr_list_map[key] = attr_list._share()
+        self._indices = self._indices._share()
+        self.__geometry_key = geometry_key
+
+    def __own_geometry(self) -> None:
+        if self.__geometry_key is None:
+            return
+
+        self.__release_geometry()
+        old_vertices = self._vertices
+        old_indices = self._indices
+        self._vertices = Vertices(draw_type=old_vertices.draw_type)
+        self._indices = Indices(draw_type=old_indices.draw_type, index_type=old_indices.index_type)
+
+    def __release_geometry(self) -> None:
+        if self.__geometry_key is not None:
+            GeometryCache.release(self.__geometry_key)
+            self.__geometry_key = None
+
+    @property
+    def shares_geometry(self) -> bool:
+        if self.__geometry_key is None or GeometryCache.ref_count(self.__geometry_key) <= 1:
+            return False
+
+        for key, attr_list in self._vertices._attr_list_map.items():
+            if key in ("color", "back_color") and self._should_add_color:
+                continue
+
+            if attr_list._shared_source() is None:
+                return False
+
+        return self._indices._shared_source() is not None
+
     @property
     def is_building(self):
         return (self._builder is not None)
@@ -610,6 +788,7 @@ class Mesh(SceneNode):
     @property
     def vertices(self):
         self.__build()
+        self._uniform_colors = None
         return self._vertices
 
     @vertices.setter
@@ -618,12 +797,15 @@ class Mesh(SceneNode):
         if self._vertices is vertices:
             return
 
+        self.__release_geometry()
+        self._uniform_colors = None
         if isinstance(vertices, Vertices):
             self._vertices = vertices
         else:
             self._vertices = Vertices(vertices)
 
         self._build_state = Mesh.BuildState.Built
+        self.__calculate_bounding_box()
         self.update_screens()
 
     @property
@@ -637,12 +819,14 @@ class Mesh(SceneNode):
         if self._indices is indices:
             return
 
+        self.__release_geometry()
         if isinstance(indices, Indices):
             self._indices = indices
         else:
             self._indices = Indices(indices)
 
         self._build_state = Mesh.BuildState.Built
+        self._update_geometry_version()
         self.update_screens()
 
     @property
@@ -666,31 +850,52 @@ class Mesh(SceneNode):
         if not self._back_color_user_set:
             self._back_material = material
 
+        self._update_classification()
         self.update_screens()
 
     def __post_build(self):
         self.__set_color()
         self.__calculate_bounding_box()
         self.__generate_TBN()
+        self.__optimize_buffers_if_needed()
+
+    def __optimize_buffers_if_needed(self):
+        if (
+            not self.__optimize_buffers
+            or self.__primitive != GL.GL_TRIANGLES
+            or not self._vertices
+            or not self._indices
+        ):
+            return
+
+        self.__optimization_report = optimize_mesh_buffers(
+            self._vertices, self._indices, overdraw=self.__optimize_overdraw
+        )
+
+    def __reset_bounding_box(self):
+        self._update_geometry_version()
+        if self._bounds_user_set:
+            return
+
+        self._x_min = 0
+        self._x_max = 0
+        self._y_min = 0
+        self._y_max = 0
+        self._z_min = 0
+        self._z_max = 0
 
     def __calculate_bounding_box(self):
-        if not self._vertices or "position" not in self._vertices:
+        self._update_geometry_version()
+        if self._bounds_user_set or not self._vertices or "position" not in self._vertices:
             return
 
-        if (
-            self._x_min == 0
-            and self._x_max == 0
-            and self._y_min == 0
-            and self._y_max == 0
-            and self._z_min == 0
-            and self._z_max == 0
-        ):
-            self._x_min = self._vertices["position"].ndarray[:, 0].min()
-            self._x_max = self._vertices["position"].ndarray[:, 0].max()
-            self._y_min = self._vertices["position"].ndarray[:, 1].min()
-            self._y_max = self._vertices["position"].ndarray[:, 1].max()
-            self._z_min = self._vertices["position"].ndarray[:, 2].min()
-            self._z_max = self._vertices["position"].ndarray[:, 2].max()
+        positions = self._vertices["position"].ndarray
+        self._x_min = positions[:, 0].min()
+        self._x_max = positions[:, 0].max()
+        self._y_min = positions[:, 1].min()
+        self._y_max = positions[:, 1].max()
+        self._z_min = positions[:, 2].min()
+        self._z_max = positions[:, 2].max()
 
     @property
     def primitive_type(self):
@@ -700,26 +905,35 @@ class Mesh(SceneNode):
     @checktype
     def primitive_type(self, primitive_type: GLInfo.primitive_types):
         self.__primitive = primitive_type
+        self._update_classification()
         self.update_screens()
 
     def generate_temp_TBN(self, vertex0, vertex1, vertex2):
-        v01 = vertex1.position - vertex0.position
-        v02 = vertex2.position - vertex0.position
+        position0 = vertex0.position
+        v01 = cgm.sub(vertex1.position, position0, out=Mesh.__v01)
+        v02 = cgm.sub(vertex2.position, position0, out=Mesh.__v02)
 
-        st01 = vertex1.tex_coord - vertex0.tex_coord
-        st02 = vertex2.tex_coord - vertex0.tex_coord
+        tex_coord0 = vertex0.tex_coord
+        tex_coord1 = vertex1.tex_coord
+        tex_coord2 = vertex2.tex_coord
+        s01 = tex_coord1.s - tex_coord0.s
+        t01 = tex_coord1.t - tex_coord0.t
+        s02 = tex_coord2.s - tex_coord0.s
+        t02 = tex_coord2.t - tex_coord0.t
 
-        det = st01.s * st02.t - st02.s * st01.t
+        det = s01 * t02 - s02 * t01
 
         normal = cgm.cross(v01, v02)
         len_normal = cgm.length(normal)
         if len_normal > 1e-6:
-            normal = normal / len_normal
+            normal /= len_normal
         else:
             normal = cgm.vec3(0)
 
-        tangent = st02.t * v01 - st01.t * v02
-        bitangent = st01.s * v02 - st02.s * v01
+        tangent = t02 * v01
+        tangent -= cgm.mul(v02, t01, out=Mesh.__temp)
+        bitangent = s01 * v02
+        bitangent -= cgm.mul(v01, s02, out=Mesh.__temp)
         if abs(det) > 1e-6:
             tangent /= det
             bitangent /= det
@@ -773,11 +987,24 @@ class Mesh(SceneNode):
         elif self.__surf_type == Mesh.SurfType.Smooth:
             generate_smooth_TBN(self._vertices, self._indices, not self.self_calculated_normal)
 
+    @property
+    def _octahedral_TBN(self) -> int:
+        result = 0
+        for i, name in enumerate(["tangent", "bitangent", "normal"]):
+            attr_list = self._vertices._attr_list_map.get(name, None)
+            if attr_list is not None and attr_list.compression == "octahedral":
+                result |= 1 << i
+
+        return result
+
     def draw(self, program: ShaderProgram, instances: Instances = None):
         if not self.visible:
             return
 
         self.__build()
+        if "octahedral_TBN" in program:
+            program["octahedral_TBN"] = self._octahedral_TBN
+
         with self.render_hints:
             if self.__primitive in GLInfo.triangle_types:
                 program.draw_triangles(
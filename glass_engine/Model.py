@@ -356,18 +356,19 @@ class Model(SceneNode):
         if node is None:
             node = SceneNode(name=assimp_node.name)
 
-        node.orientation.w = assimp_node.orientation.w
-        node.orientation.x = assimp_node.orientation.x
-        node.orientation.y = assimp_node.orientation.y
-        node.orientation.z = assimp_node.orientation.z
-
-        node.position.x = assimp_node.position.x
-        node.position.y = assimp_node.position.y
-        node.position.z = assimp_node.position.z
-
-        node.scale.x = assimp_node.scale.x
-        node.scale.y = assimp_node.scale.y
-        node.scale.z = assimp_node.scale.z
+        with node.batch_update():
+            node.orientation.w = assimp_node.orientation.w
+            node.orientation.x = assimp_node.orientation.x
+            node.orientation.y = assimp_node.orientation.y
+            node.orientation.z = assimp_node.orientation.z
+
+            node.position.x = assimp_node.position.x
+            node.position.y = assimp_node.position.y
+            node.position.z = assimp_node.position.z
+
+            node.scale.x = assimp_node.scale.x
+            node.scale.y = assimp_node.scale.y
+            node.scale.z = assimp_node.scale.z
 
         for mesh_index in assimp_node.meshes:
             node.add_child(self.__meshes[mesh_index])
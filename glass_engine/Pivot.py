@@ -28,7 +28,10 @@ class Pivot:
         if not self._should_callback:
             return
         
-        self._is_set = True
+        if not self._is_set:
+            self._is_set = True
+            self._parent_scene_node._invalidate_flat_graphs()
+
         self._parent_scene_node.update_screens()
 
     @property
@@ -84,7 +87,7 @@ class Pivot:
             * 180
         )
 
-        self.update_screens()
+        cgm.defer_notifications._notify(self.update_screens)
 
     def _update_orientation(self):
         yaw = self._yaw_pitch_roll[0] / 180 * math.pi
@@ -99,7 +102,7 @@ class Pivot:
         self.orientation = quat1 * quat2 * quat3
         self._should_update_yaw_pitch_roll = True
 
-        self.update_screens()
+        cgm.defer_notifications._notify(self.update_screens)
 
     @property
     def yaw(self):
@@ -2,6 +2,11 @@ from .Renderer import Renderer
 from ..PostProcessEffects import FXAAEffect
 from ..Frame import Frame
 from ..GlassEngineConfig import GlassEngineConfig
+from ..Frustum import Frustum
+from ..InstanceBounds import InstanceBounds
+from ..InstanceBVH import InstanceBVH
+from ..IndirectBatch import IndirectBatch
+from ..Mesh import Mesh
 
 from glass import (
     ShaderProgram,
@@ -12,10 +17,15 @@ from glass import (
     samplerCube,
     sampler2DArray,
     GLInfo,
+    Instances,
 )
+from glass.AttrList import AttrList
+from glass.SameTypeList import SameTypeList
+from glass.RenderHints import RenderHints
 
 from OpenGL import GL
 import cgmath as cgm
+import numpy as np
 import os
 
 
@@ -40,6 +50,33 @@ class CommonRenderer(Renderer):
         self._meshes_cast_shadows = []
         self._lines_cast_shadows = []
         self._points_cast_shadows = []
+        self._opaque_candidates = ([], [], [])
+        self._transparent_candidates = ([], [], [])
+        self._mesh_classes = {}
+        self._classified_items = None
+        self._classified_generation = -1
+
+        self._auto_instancing = True
+        self._merged_instances = {}
+        self._merged_groups = {}
+        self._merged_sources = {}
+        self._mesh_items_state = None
+        self._mesh_items = []
+
+        self._frustum_culling = True
+        self._instance_bounds = InstanceBounds()
+        self._bvh = InstanceBVH()
+        self._bvh_slices = {}
+        self._bvh_starts = np.zeros(0, dtype=np.int64)
+        self._bvh_tuples = []
+        self._culled_instances_map = {}
+        self._used_culled_keys = set()
+        self._culled_instances = 0
+        self._shadow_culled_instances = 0
+
+        self._gpu_driven = False
+        self._indirect_batches = {}
+        self._indirect_meshes = {}
 
     @property
     def programs(self):
@@ -264,57 +301,472 @@ class CommonRenderer(Renderer):
 
         return program
 
-    def classify_meshes(self):
-        self._all_meshes.clear()
-        self._all_lines.clear()
-        self._all_points.clear()
-        self._opaque_meshes.clear()
-        self._opaque_lines.clear()
-        self._opaque_points.clear()
-        self._transparent_meshes.clear()
-        self._transparent_lines.clear()
-        self._transparent_points.clear()
-        self._meshes_cast_shadows.clear()
-        self._lines_cast_shadows.clear()
-        self._points_cast_shadows.clear()
+    @property
+    def auto_instancing(self) -> bool:
+        return self._auto_instancing
+
+    @auto_instancing.setter
+    def auto_instancing(self, flag: bool):
+        self._auto_instancing = flag
+        if not flag:
+            self._merged_instances.clear()
+            self._merged_groups.clear()
+            self._merged_sources.clear()
+
+    @staticmethod
+    def _instancing_key(mesh, instances):
+        if (
+            mesh.build_state != mesh.BuildState.Built
+            and mesh.__class__.__name__ != "Mesh"
+        ) or not mesh.visible:
+            return None
+
+        uniform_colors = mesh._uniform_colors
+        attr_lists = tuple(
+            (name, attr_list._storage_id)
+            for name, attr_list in mesh._vertices._attr_list_map.items()
+            if uniform_colors is None or name not in ("color", "back_color")
+        )
+        key = (
+            mesh.primitive_type,
+            mesh._indices._storage_id,
+            attr_lists,
+            uniform_colors,
+            id(mesh._material),
+            id(mesh._back_material),
+            tuple(sorted(mesh.render_hints._values.items())),
+            tuple(instances._attr_list_map.keys()),
+        )
+        try:
+            hash(key)
+        except TypeError:
+            return None
+
+        return key
+
+    def __merge_instances(self, key, group):
+        merged = self._merged_instances.get(key, None)
+        sources = tuple((id(instances), instances._version) for _, instances in group)
+        if merged is not None and self._merged_sources.get(key, None) == sources:
+            return merged
+
+        self._merged_sources[key] = sources
+        len_merged = sum(len(instances) for _, instances in group)
+        if merged is None or len(merged) != len_merged:
+            merged = Instances(draw_type=GL.GL_DYNAMIC_DRAW)
+            self._merged_instances[key] = merged
+
+        for name, attr_list in group[0][1]._attr_list_map.items():
+            array = np.concatenate(
+                [instances._attr_list_map[name].ndarray for _, instances in group]
+            )
+            if name not in merged._attr_list_map:
+                merged._attr_list_map[name] = AttrList(
+                    array, draw_type=GL.GL_DYNAMIC_DRAW, dtype=attr_list.dtype
+                )
+            elif not np.array_equal(merged._attr_list_map[name].ndarray, array):
+                merged._attr_list_map[name].ndarray = array
+
+        return merged
+
+    def _auto_instance(self, mesh_items):
+        self._merged_groups.clear()
+        groups = {}
+        result = []
+        for mesh, instances in mesh_items:
+            key = CommonRenderer._instancing_key(mesh, instances)
+            if key is None:
+                result.append((mesh, instances))
+                continue
 
-        for mesh_tuple in self.scene.all_meshes.items():
-            mesh = mesh_tuple[0]
-            if mesh.primitive_type in GLInfo.triangle_types:
-                self._all_meshes.append(mesh_tuple)
+            if key not in groups:
+                groups[key] = (len(result), [])
+                result.append(None)
 
-                if mesh.material.cast_shadows or mesh.back_material.cast_shadows:
-                    self._meshes_cast_shadows.append(mesh_tuple)
+            groups[key][1].append((mesh, instances))
 
-                if mesh.material.has_transparent or mesh.back_material.has_transparent:
-                    self._transparent_meshes.append(mesh_tuple)
+        for key, (index, group) in groups.items():
+            if len(group) == 1:
+                result[index] = group[0]
+            else:
+                merged = self.__merge_instances(key, group)
+                self._merged_groups[merged] = group
+                result[index] = (group[0][0], merged)
 
-                if mesh.material.has_opaque or mesh.back_material.has_opaque:
-                    self._opaque_meshes.append(mesh_tuple)
+        for key in list(self._merged_instances.keys()):
+            if key not in groups or len(groups[key][1]) == 1:
+                del self._merged_instances[key]
+                self._merged_sources.pop(key, None)
 
-            elif mesh.primitive_type in GLInfo.line_types:
-                self._all_lines.append(mesh_tuple)
+        return result
 
-                if mesh.material.cast_shadows or mesh.back_material.cast_shadows:
-                    self._lines_cast_shadows.append(mesh_tuple)
+    @property
+    def frustum_culling(self) -> bool:
+        return self._frustum_culling
 
-                if mesh.material.has_transparent or mesh.back_material.has_transparent:
-                    self._transparent_lines.append(mesh_tuple)
+    @frustum_culling.setter
+    def frustum_culling(self, flag: bool):
+        self._frustum_culling = flag
+        if not flag:
+            self._culled_instances_map.clear()
 
-                if mesh.material.has_opaque or mesh.back_material.has_opaque:
-                    self._opaque_lines.append(mesh_tuple)
+    @property
+    def bvh(self) -> InstanceBVH:
+        return self._bvh
 
-            elif mesh.primitive_type == GL.GL_POINTS:
-                self._all_points.append(mesh_tuple)
+    @property
+    def gpu_driven(self) -> bool:
+        return self._gpu_driven
 
-                if mesh.material.cast_shadows or mesh.back_material.cast_shadows:
-                    self._points_cast_shadows.append(mesh_tuple)
+    @gpu_driven.setter
+    def gpu_driven(self, flag: bool):
+        self._gpu_driven = flag
+        if not flag:
+            self._indirect_batches.clear()
+            self._indirect_meshes.clear()
 
-                if mesh.material.has_transparent or mesh.back_material.has_transparent:
-                    self._transparent_points.append(mesh_tuple)
+    @property
+    def culled_instances(self) -> int:
+        return self._culled_instances
 
-                if mesh.material.has_opaque or mesh.back_material.has_opaque:
-                    self._opaque_points.append(mesh_tuple)
+    @property
+    def shadow_culled_instances(self) -> int:
+        return self._shadow_culled_instances
+
+    def __update_bvh(self, mesh_items):
+        self._instance_bounds.collect_garbage()
+        self._bvh_slices.clear()
+        self._bvh_tuples = []
+        starts = []
+        centers_list = []
+        radii_list = []
+        structure = []
+        start = 0
+        for mesh_tuple in mesh_items:
+            spheres = self._instance_bounds.spheres(*mesh_tuple)
+            if spheres is None:
+                continue
+
+            stop = start + len(spheres[1])
+            self._bvh_slices[mesh_tuple] = (start, stop)
+            self._bvh_tuples.append(mesh_tuple)
+            starts.append(start)
+            centers_list.append(spheres[0])
+            radii_list.append(spheres[1])
+            structure.append((id(mesh_tuple[1]), stop - start))
+            start = stop
+
+        self._bvh_starts = np.array(starts, dtype=np.int64)
+        if centers_list:
+            self._bvh.update(np.concatenate(centers_list), np.concatenate(radii_list), tuple(structure))
+        else:
+            self._bvh.update(np.zeros((0, 3), dtype=np.float32), np.zeros(0, dtype=np.float32), ())
+
+    def __cull(self, mesh_tuple, key, bvh_mask):
+        mesh, instances = mesh_tuple
+        bvh_slice = self._bvh_slices.get(mesh_tuple, None)
+        if bvh_slice is None or mesh.material.need_env_map or mesh._back_material.need_env_map:
+            return mesh_tuple, 0
+
+        mask = bvh_mask[bvh_slice[0]:bvh_slice[1]].copy()
+        if "visible" in instances._attr_list_map:
+            mask &= instances._attr_list_map["visible"].ndarray.reshape(-1) != 0
+
+        n_culled = len(mask) - int(np.count_nonzero(mask))
+        if n_culled == 0:
+            return mesh_tuple, 0
+
+        if n_culled == len(mask):
+            return None, n_culled
+
+        key = (instances, key)
+        self._used_culled_keys.add(key)
+        culled = self._culled_instances_map.get(key, None)
+        if culled is None:
+            culled = Instances(draw_type=GL.GL_DYNAMIC_DRAW)
+            self._culled_instances_map[key] = culled
+
+        for name, attr_list in instances._attr_list_map.items():
+            array = attr_list.ndarray[mask]
+            if name not in culled._attr_list_map:
+                culled._attr_list_map[name] = AttrList(
+                    array, draw_type=GL.GL_DYNAMIC_DRAW, dtype=attr_list.dtype
+                )
+            elif not np.array_equal(culled._attr_list_map[name].ndarray, array):
+                culled._attr_list_map[name].ndarray = array
+
+        return (mesh, culled), n_culled
+
+    def _light_mask(self, test):
+        if not self._frustum_culling:
+            return None
+
+        return self._bvh.query(test)
+
+    def _light_culled(self, mesh_tuples, light, light_mask):
+        if light_mask is None:
+            return mesh_tuples
+
+        result = []
+        for mesh_tuple in mesh_tuples:
+            culled_tuple, n_culled = self.__cull(mesh_tuple, light, light_mask)
+            self._shadow_culled_instances += n_culled
+            if culled_tuple is not None:
+                result.append(culled_tuple)
+
+        return result
+
+    def pick(self, origin: cgm.vec3, direction: cgm.vec3, max_distance: float = np.inf):
+        indices, distances = self._bvh.ray_cast(origin, direction, max_distance)
+        for index, distance in zip(indices, distances):
+            tuple_index = int(np.searchsorted(self._bvh_starts, index, side="right")) - 1
+            mesh, instances = self._bvh_tuples[tuple_index]
+            row = int(index - self._bvh_starts[tuple_index])
+            if not mesh.visible or (
+                "visible" in instances._attr_list_map
+                and instances._attr_list_map["visible"].ndarray.reshape(-1)[row] == 0
+            ):
+                continue
+
+            group = self._merged_groups.get(instances, None)
+            if group is not None:
+                for mesh, instances in group:
+                    if row < len(instances):
+                        break
+
+                    row -= len(instances)
+
+            path = None
+            for instance_path, instance_index in instances._path_index_map.items():
+                if instance_index == row:
+                    path = instance_path
+                    break
+
+            return mesh, path, float(distance)
+
+        return None
+
+    @staticmethod
+    def _point_light_test(point_light):
+        position = np.asarray(point_light.abs_position, dtype=np.float32)
+        coverage = point_light.coverage
+
+        def test(centers, radii):
+            return np.linalg.norm(centers - position, axis=1) - radii <= coverage
+
+        return test
+
+    @staticmethod
+    def _spot_light_test(spot_light):
+        position = np.asarray(spot_light.abs_position, dtype=np.float32)
+        direction = np.asarray(cgm.normalize(spot_light.direction), dtype=np.float32)
+        coverage = spot_light.coverage
+        half_angle = spot_light.half_span_angle_rad + spot_light.half_softness_rad
+
+        def test(centers, radii):
+            offsets = centers - position
+            distances = np.linalg.norm(offsets, axis=1)
+            mask = distances - radii <= coverage
+            if half_angle < np.pi / 2:
+                axial = offsets @ direction
+                lateral = np.sqrt(np.maximum(distances * distances - axial * axial, 0))
+                mask &= lateral * np.cos(half_angle) - axial * np.sin(half_angle) <= radii
+
+            return mask
+
+        return test
+
+    def _dir_light_test(self, dir_light):
+        frustum = Frustum.from_camera(self.camera)
+        direction = dir_light.direction
+
+        def test(centers, radii):
+            return frustum.test_swept_spheres(centers, radii, direction)
+
+        return test
+
+    def __classify(self, mesh, mesh_classes):
+        entry = mesh_classes.get(mesh, None)
+        if entry is None or entry[0] != mesh._classify_version:
+            material = mesh.material
+            back_material = mesh._back_material
+            primitive_type = mesh.primitive_type
+            kind = None
+            if primitive_type in GLInfo.triangle_types:
+                kind = 0
+            elif primitive_type in GLInfo.line_types:
+                kind = 1
+            elif primitive_type == GL.GL_POINTS:
+                kind = 2
+
+            entry = (
+                mesh._classify_version,
+                kind,
+                material.cast_shadows or back_material.cast_shadows,
+                material.has_transparent or back_material.has_transparent,
+                material.has_opaque or back_material.has_opaque,
+            )
+
+        self._mesh_classes[mesh] = entry
+        return entry
+
+    def __update_classification(self, mesh_items):
+        if (
+            self._classified_generation == Mesh._classify_generation
+            and self._classified_items == mesh_items
+        ):
+            return
+
+        self._classified_generation = Mesh._classify_generation
+        self._classified_items = mesh_items
+
+        mesh_classes = self._mesh_classes
+        self._mesh_classes = {}
+        all_lists = ([], [], [])
+        cast_shadows_lists = ([], [], [])
+        opaque_lists = ([], [], [])
+        transparent_lists = ([], [], [])
+        for mesh_tuple in mesh_items:
+            _, kind, cast_shadows, has_transparent, has_opaque = self.__classify(mesh_tuple[0], mesh_classes)
+            if kind is None:
+                continue
+
+            all_lists[kind].append(mesh_tuple)
+            if cast_shadows:
+                cast_shadows_lists[kind].append(mesh_tuple)
+
+            if has_transparent:
+                transparent_lists[kind].append(mesh_tuple)
+
+            if has_opaque:
+                opaque_lists[kind].append(mesh_tuple)
+
+        self._all_meshes, self._all_lines, self._all_points = all_lists
+        (
+            self._meshes_cast_shadows,
+            self._lines_cast_shadows,
+            self._points_cast_shadows,
+        ) = cast_shadows_lists
+        self._opaque_candidates = opaque_lists
+        self._transparent_candidates = transparent_lists
+
+    def __camera_culled(self, mesh_tuples, camera_mask, camera_tuples):
+        if camera_mask is None:
+            return mesh_tuples
+
+        result = []
+        for mesh_tuple in mesh_tuples:
+            if mesh_tuple not in camera_tuples:
+                camera_tuple, n_culled = self.__cull(mesh_tuple, "camera", camera_mask)
+                self._culled_instances += n_culled
+                camera_tuples[mesh_tuple] = camera_tuple
+
+            camera_tuple = camera_tuples[mesh_tuple]
+            if camera_tuple is not None:
+                result.append(camera_tuple)
+
+        return result
+
+    def __mesh_items_state(self):
+        scene = self.scene
+        return (
+            id(scene),
+            scene._generation,
+            self._auto_instancing,
+            Mesh._classify_generation,
+            Mesh._geometry_generation,
+            SameTypeList._detached_generation,
+            RenderHints._generation,
+        )
+
+    def classify_meshes(self):
+        for key in list(self._culled_instances_map.keys()):
+            if key not in self._used_culled_keys:
+                del self._culled_instances_map[key]
+
+        self._used_culled_keys.clear()
+        self._culled_instances = 0
+        self._shadow_culled_instances = 0
+
+        all_meshes = self.scene.all_meshes
+        if self.__mesh_items_state() != self._mesh_items_state:
+            mesh_items = list(all_meshes.items())
+            if self._auto_instancing:
+                mesh_items = self._auto_instance(mesh_items)
+
+            self.__update_bvh(mesh_items)
+            self._mesh_items = mesh_items
+            self._mesh_items_state = self.__mesh_items_state()
+
+        mesh_items = self._mesh_items
+        self.__update_classification(mesh_items)
+
+        camera_mask = None
+        if self._frustum_culling and not GlassEngineConfig["USE_DYNAMIC_ENV_MAPPING"]:
+            camera_mask = self._bvh.query(Frustum.from_camera(self.camera).test_spheres)
+
+        gpu_driven = (
+            self._gpu_driven
+            and IndirectBatch.supported()
+            and not GlassEngineConfig["USE_DYNAMIC_ENV_MAPPING"]
+        )
+        self._indirect_meshes.clear()
+        if camera_mask is None and not gpu_driven:
+            self._opaque_meshes, self._opaque_lines, self._opaque_points = self._opaque_candidates
+            (
+                self._transparent_meshes,
+                self._transparent_lines,
+                self._transparent_points,
+            ) = self._transparent_candidates
+        else:
+            opaque_meshes = self._opaque_candidates[0]
+            if gpu_driven:
+                opaque_meshes = []
+                for mesh_tuple in self._opaque_candidates[0]:
+                    indirect_key = IndirectBatch.bucket_key(*mesh_tuple)
+                    if indirect_key is None:
+                        opaque_meshes.append(mesh_tuple)
+                        continue
+
+                    if indirect_key not in self._indirect_meshes:
+                        self._indirect_meshes[indirect_key] = []
+
+                    self._indirect_meshes[indirect_key].append(mesh_tuple)
+
+            camera_tuples = {}
+            self._opaque_meshes = self.__camera_culled(opaque_meshes, camera_mask, camera_tuples)
+            self._opaque_lines = self.__camera_culled(self._opaque_candidates[1], camera_mask, camera_tuples)
+            self._opaque_points = self.__camera_culled(self._opaque_candidates[2], camera_mask, camera_tuples)
+            self._transparent_meshes = self.__camera_culled(self._transparent_candidates[0], camera_mask, camera_tuples)
+            self._transparent_lines = self.__camera_culled(self._transparent_candidates[1], camera_mask, camera_tuples)
+            self._transparent_points = self.__camera_culled(self._transparent_candidates[2], camera_mask, camera_tuples)
+
+        for key in list(self._indirect_batches.keys()):
+            if key not in self._indirect_meshes:
+                del self._indirect_batches[key]
+
+        for key, members in self._indirect_meshes.items():
+            if key not in self._indirect_batches:
+                self._indirect_batches[key] = IndirectBatch()
+
+            self._indirect_batches[key].update(members, self._instance_bounds)
+
+    def draw_indirect_batches(self, program):
+        frustum = None
+        if self._frustum_culling:
+            frustum = Frustum.from_camera(self.camera)
+
+        for batch in self._indirect_batches.values():
+            mesh = batch.members[0][0]
+            program["material"] = mesh.material
+            program["back_material"] = mesh._back_material
+            program["is_sphere"] = False
+            program["mesh_center"] = mesh.center
+            program["octahedral_TBN"] = mesh._octahedral_TBN
+            if not batch.draw(program, frustum):
+                for mesh, instances in batch.members:
+                    program["mesh_center"] = mesh.center
+                    mesh.draw(program, instances)
 
     def update_spot_lights_depth(self):
         if "GL_ARB_bindless_texture" not in GLConfig.available_extensions:
@@ -331,6 +783,11 @@ class CommonRenderer(Renderer):
             if not spot_light.generate_shadows or not spot_light.need_update_depth_map:
                 continue
 
+            light_mask = self._light_mask(self._spot_light_test(spot_light))
+            meshes_cast_shadows = self._light_culled(self._meshes_cast_shadows, spot_light, light_mask)
+            lines_cast_shadows = self._light_culled(self._lines_cast_shadows, spot_light, light_mask)
+            points_cast_shadows = self._light_culled(self._points_cast_shadows, spot_light, light_mask)
+
             if spot_light.depth_fbo is None:
                 spot_light.depth_fbo = FBO(1024, 1024)
                 spot_light.depth_fbo.attach(GL.GL_DEPTH_ATTACHMENT, samplerCube)
@@ -343,18 +800,18 @@ class CommonRenderer(Renderer):
                 GLConfig.polygon_mode = GL.GL_FILL
                 
                 with spot_light.depth_fbo:
-                    if self._meshes_cast_shadows:
+                    if meshes_cast_shadows:
                         self.spot_light_depth_program["spot_light"] = spot_light
-                        for mesh, instances in self._meshes_cast_shadows:
+                        for mesh, instances in meshes_cast_shadows:
                             self.spot_light_depth_program["material"] = mesh.material
                             self.spot_light_depth_program["back_material"] = (
                                 mesh._back_material
                             )
                             mesh.draw(self.spot_light_depth_program, instances)
 
-                    if self._lines_cast_shadows:
+                    if lines_cast_shadows:
                         self.spot_light_depth_lines_program["spot_light"] = spot_light
-                        for mesh, instances in self._lines_cast_shadows:
+                        for mesh, instances in lines_cast_shadows:
                             self.spot_light_depth_lines_program["material"] = (
                                 mesh.material
                             )
@@ -363,9 +820,9 @@ class CommonRenderer(Renderer):
                             )
                             mesh.draw(self.spot_light_depth_lines_program, instances)
 
-                    if self._points_cast_shadows:
+                    if points_cast_shadows:
                         self.spot_light_depth_points_program["spot_light"] = spot_light
-                        for mesh, instances in self._points_cast_shadows:
+                        for mesh, instances in points_cast_shadows:
                             self.spot_light_depth_points_program["material"] = (
                                 mesh.material
                             )
@@ -399,6 +856,11 @@ class CommonRenderer(Renderer):
             ):
                 continue
 
+            light_mask = self._light_mask(self._point_light_test(point_light))
+            meshes_cast_shadows = self._light_culled(self._meshes_cast_shadows, point_light, light_mask)
+            lines_cast_shadows = self._light_culled(self._lines_cast_shadows, point_light, light_mask)
+            points_cast_shadows = self._light_culled(self._points_cast_shadows, point_light, light_mask)
+
             if point_light.depth_fbo is None:
                 point_light.depth_fbo = FBO(1024, 1024)
                 point_light.depth_fbo.attach(GL.GL_DEPTH_ATTACHMENT, samplerCube)
@@ -411,20 +873,20 @@ class CommonRenderer(Renderer):
                 GLConfig.polygon_mode = GL.GL_FILL
 
                 with point_light.depth_fbo:
-                    if self._meshes_cast_shadows:
+                    if meshes_cast_shadows:
                         self.point_light_depth_program["point_light"] = point_light
-                        for mesh, instances in self._meshes_cast_shadows:
+                        for mesh, instances in meshes_cast_shadows:
                             self.point_light_depth_program["material"] = mesh.material
                             self.point_light_depth_program["back_material"] = (
                                 mesh._back_material
                             )
                             mesh.draw(self.point_light_depth_program, instances)
 
-                    if self._lines_cast_shadows:
+                    if lines_cast_shadows:
                         self.point_light_depth_lines_program["point_light"] = (
                             point_light
                         )
-                        for mesh, instances in self._lines_cast_shadows:
+                        for mesh, instances in lines_cast_shadows:
                             self.point_light_depth_lines_program["material"] = (
                                 mesh.material
                             )
@@ -433,11 +895,11 @@ class CommonRenderer(Renderer):
                             )
                             mesh.draw(self.point_light_depth_lines_program, instances)
 
-                    if self._points_cast_shadows:
+                    if points_cast_shadows:
                         self.point_light_depth_points_program["point_light"] = (
                             point_light
                         )
-                        for mesh, instances in self._points_cast_shadows:
+                        for mesh, instances in points_cast_shadows:
                             self.point_light_depth_points_program["material"] = (
                                 mesh.material
                             )
@@ -467,28 +929,29 @@ class CommonRenderer(Renderer):
             if not mesh.material.cast_shadows:
                 continue
 
-            original_center = mesh.center
-            original_corner = cgm.vec3()
-            original_corner.x = original_center.x + (mesh.x_max - mesh.x_min) / 2
-            original_corner.y = original_center.y + (mesh.y_max - mesh.y_min) / 2
-            original_corner.z = original_center.z + (mesh.z_max - mesh.z_min) / 2
-            for instance in instances:
-                center = instance.apply(original_center)
-                corner = instance.apply(original_corner)
-                radius = cgm.length(corner - center)
-
-                for dir_light in self.scene.dir_lights:
-                    if not dir_light.generate_shadows:
-                        continue
+            spheres = self._instance_bounds.spheres(mesh, instances)
+            if spheres is None or len(spheres[0]) == 0:
+                continue
+
+            centers, radii = spheres
+            for dir_light in self.scene.dir_lights:
+                if not dir_light.generate_shadows:
+                    continue
 
-                    current_offset = radius + cgm.dot(center, -dir_light.direction)
-                    if current_offset > dir_light.max_back_offset:
-                        dir_light.max_back_offset = current_offset
+                direction = np.asarray(dir_light.direction, dtype=np.float32)
+                current_offset = float(np.max(radii - centers @ direction))
+                if current_offset > dir_light.max_back_offset:
+                    dir_light.max_back_offset = current_offset
 
         for dir_light in self.scene.dir_lights:
             if not dir_light.generate_shadows:
                 continue
 
+            light_mask = self._light_mask(self._dir_light_test(dir_light))
+            meshes_cast_shadows = self._light_culled(self._meshes_cast_shadows, dir_light, light_mask)
+            lines_cast_shadows = self._light_culled(self._lines_cast_shadows, dir_light, light_mask)
+            points_cast_shadows = self._light_culled(self._points_cast_shadows, dir_light, light_mask)
+
             if dir_light.depth_fbo is None:
                 dir_light.depth_fbo = FBO(1024, 1024, layers=self.camera.CSM_levels)
                 dir_light.depth_fbo.attach(GL.GL_DEPTH_ATTACHMENT, sampler2DArray)
@@ -504,18 +967,18 @@ class CommonRenderer(Renderer):
                 GLConfig.polygon_mode = GL.GL_FILL
 
                 with dir_light.depth_fbo:
-                    if self._meshes_cast_shadows:
+                    if meshes_cast_shadows:
                         self.dir_light_depth_program["dir_light"] = dir_light
-                        for mesh, instances in self._meshes_cast_shadows:
+                        for mesh, instances in meshes_cast_shadows:
                             self.dir_light_depth_program["material"] = mesh.material
                             self.dir_light_depth_program["back_material"] = (
                                 mesh._back_material
                             )
                             mesh.draw(self.dir_light_depth_program, instances)
 
-                    if self._lines_cast_shadows:
+                    if lines_cast_shadows:
                         self.dir_light_depth_lines_program["dir_light"] = dir_light
-                        for mesh, instances in self._lines_cast_shadows:
+                        for mesh, instances in lines_cast_shadows:
                             self.dir_light_depth_lines_program["material"] = (
                                 mesh.material
                             )
@@ -524,9 +987,9 @@ class CommonRenderer(Renderer):
                             )
                             mesh.draw(self.dir_light_depth_lines_program, instances)
 
-                    if self._points_cast_shadows:
+                    if points_cast_shadows:
                         self.dir_light_depth_points_program["dir_light"] = dir_light
-                        for mesh, instances in self._points_cast_shadows:
+                        for mesh, instances in points_cast_shadows:
                             self.dir_light_depth_points_program["material"] = (
                                 mesh.material
                             )
@@ -846,6 +1309,21 @@ class CommonRenderer(Renderer):
         self.gen_env_map_points_program["mesh_center"] = mesh.center
         mesh.draw(self.gen_env_map_points_program, instances)
 
+    @staticmethod
+    def _env_map_sources(mesh_tuples, is_opaque: bool):
+        if is_opaque:
+            return [
+                mesh_tuple
+                for mesh_tuple in mesh_tuples
+                if mesh_tuple[0].material.has_opaque or mesh_tuple[0]._back_material.has_opaque
+            ]
+
+        return [
+            mesh_tuple
+            for mesh_tuple in mesh_tuples
+            if mesh_tuple[0].material.has_transparent or mesh_tuple[0]._back_material.has_transparent
+        ]
+
     def gen_env_map(self, mesh, instances):
         if "GL_ARB_bindless_texture" not in GLConfig.available_extensions:
             return
@@ -853,6 +1331,13 @@ class CommonRenderer(Renderer):
         max_bake_times = max(
             mesh.material.env_max_bake_times, mesh._back_material.env_max_bake_times
         )
+        opaque_meshes = CommonRenderer._env_map_sources(self._all_meshes, True)
+        opaque_lines = CommonRenderer._env_map_sources(self._all_lines, True)
+        opaque_points = CommonRenderer._env_map_sources(self._all_points, True)
+        transparent_meshes = CommonRenderer._env_map_sources(self._all_meshes, False)
+        transparent_lines = CommonRenderer._env_map_sources(self._all_lines, False)
+        transparent_points = CommonRenderer._env_map_sources(self._all_points, False)
+
         mesh_center = mesh.center
         for instance in instances:
             if instance.visible == 0:
@@ -874,29 +1359,25 @@ class CommonRenderer(Renderer):
                 with env_map_fbo:
                     GLConfig.clear_buffers()
 
-                    if self._opaque_meshes:
+                    if opaque_meshes:
                         self.prepare_gen_env_map_draw_mesh(view_center, True)
-                        for other_mesh, other_instances in self._opaque_meshes:
+                        for other_mesh, other_instances in opaque_meshes:
                             self.gen_env_map_draw_mesh(other_mesh, other_instances)
 
-                    if self._opaque_lines:
+                    if opaque_lines:
                         self.prepare_gen_env_map_draw_lines(view_center, True)
-                        for other_mesh, other_instances in self._opaque_lines:
+                        for other_mesh, other_instances in opaque_lines:
                             self.gen_env_map_draw_lines(other_mesh, other_instances)
 
-                    if self._opaque_points:
+                    if opaque_points:
                         self.prepare_gen_env_map_draw_points(view_center, True)
-                        for other_mesh, other_instances in self._opaque_points:
+                        for other_mesh, other_instances in opaque_points:
                             self.gen_env_map_draw_points(other_mesh, other_instances)
 
             opaque_color_map = env_map_fbo.color_attachment(0)
             accum_map = None
             reveal_map = None
-            if (
-                self._transparent_meshes
-                or self._transparent_points
-                or self._transparent_lines
-            ):
+            if transparent_meshes or transparent_lines or transparent_points:
                 with GLConfig.LocalEnv():
                     GLConfig.depth_test = True
                     GLConfig.depth_write = False
@@ -914,19 +1395,19 @@ class CommonRenderer(Renderer):
                         GLConfig.clear_buffer(1, cgm.vec4(0))
                         GLConfig.clear_buffer(2, cgm.vec4(0))
 
-                        if self._transparent_meshes:
+                        if transparent_meshes:
                             self.prepare_gen_env_map_draw_mesh(view_center, False)
-                            for other_mesh, other_instances in self._transparent_meshes:
+                            for other_mesh, other_instances in transparent_meshes:
                                 self.gen_env_map_draw_mesh(other_mesh, other_instances)
 
-                        if self._transparent_lines:
+                        if transparent_lines:
                             self.prepare_gen_env_map_draw_lines(view_center, False)
-                            for other_mesh, other_instances in self._transparent_lines:
+                            for other_mesh, other_instances in transparent_lines:
                                 self.gen_env_map_draw_lines(other_mesh, other_instances)
 
-                        if self._transparent_points:
+                        if transparent_points:
                             self.prepare_gen_env_map_draw_points(view_center, False)
-                            for other_mesh, other_instances in self._transparent_points:
+                            for other_mesh, other_instances in transparent_points:
                                 self.gen_env_map_draw_points(
                                     other_mesh, other_instances
                                 )
@@ -213,6 +213,7 @@ class DeferredRenderer(CommonRenderer):
     def draw_opaque(self):
         if (
             not self._opaque_meshes
+            and not self._indirect_meshes
             and not self._opaque_lines
             and not self._opaque_points
         ):
@@ -228,6 +229,9 @@ class DeferredRenderer(CommonRenderer):
                     for mesh, instances in self._opaque_meshes:
                         self.draw_to_gbuffer(mesh, instances)
 
+                if self._indirect_meshes:
+                    self.draw_indirect_batches(self.draw_to_gbuffer_program)
+
                 if self._opaque_lines:
                     for mesh, instances in self._opaque_lines:
                         self.draw_lines_to_gbuffer(mesh, instances)
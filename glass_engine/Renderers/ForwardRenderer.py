@@ -16,11 +16,13 @@ class ForwardRenderer(CommonRenderer):
     def _draw_opaque(self):
         GLConfig.clear_buffers()
 
-        if self._opaque_meshes:
+        if self._opaque_meshes or self._indirect_meshes:
             self.prepare_forward_draw_mesh(True)
             for mesh, instances in self._opaque_meshes:
                 self.forward_draw_mesh(mesh, instances)
 
+            self.draw_indirect_batches(self.forward_program)
+
         if self._opaque_lines:
             self.prepare_forward_draw_lines(True)
             for mesh, instances in self._opaque_lines:
@@ -42,6 +44,7 @@ class ForwardRenderer(CommonRenderer):
     def draw_opaque(self):
         if (
             not self._opaque_meshes
+            and not self._indirect_meshes
             and not self._opaque_lines
             and not self._opaque_points
             and not self.scene.skybox.is_completed
@@ -25,6 +25,17 @@ class Renderer(ABC):
     def screen(self):
         return self._camera.screen
 
+    @property
+    def culled_instances(self) -> int:
+        return 0
+
+    @property
+    def shadow_culled_instances(self) -> int:
+        return 0
+
+    def pick(self, origin, direction, max_distance: float = float("inf")):
+        return None
+
     def startup(self):
         pass
 
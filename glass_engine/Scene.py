@@ -5,14 +5,15 @@ from .Lights.PointLight import PointLights, PointLight, FlatPointLight
 from .Lights.DirLight import DirLights, DirLight, FlatDirLight
 from .Lights.SpotLight import SpotLights, SpotLight, FlatSpotLight
 from .AffineTransform import AffineTransform
+from .FlatSceneGraph import FlatSceneGraph
 
 from .Fog import Fog
 from .Background import Background
 
-from glass.utils import quat_to_mat4, scale_to_mat4, translate_to_mat4
 from glass import Instances
 
 import cgmath as cgm
+import numpy as np
 import time
 
 
@@ -21,10 +22,14 @@ class Scene:
     def __init__(self):
         self._root = SceneNode("root")
         self._root._scenes.add(self)
+        self._flat_graph = FlatSceneGraph(self._root)
+        self._vectorized_transforms = False
 
         self._all_meshes = {}
         self._backup_meshes = {}
+        self._pending_transforms = {}
         self._last_generated_meshes = set()
+        self._generation = 0
 
         self._fog = Fog()
         self._background = Background()
@@ -33,6 +38,7 @@ class Scene:
         self._spot_lights = SpotLights()
 
         self.__anything_changed = False
+        self.__meshes_changed = False
         self._should_update_env_maps = False
         self._should_update_depth_maps = False
 
@@ -46,6 +52,23 @@ class Scene:
     def root(self):
         return self._root
 
+    @property
+    def flat_graph(self) -> FlatSceneGraph:
+        return self._flat_graph
+
+    @property
+    def vectorized_transforms(self) -> bool:
+        return self._vectorized_transforms
+
+    @vectorized_transforms.setter
+    def vectorized_transforms(self, flag: bool) -> None:
+        if flag == self._vectorized_transforms:
+            return
+
+        self._vectorized_transforms = flag
+        self._flat_graph.invalidate()
+        self._root._set_dirty()
+
     @property
     def background(self) -> Background:
         return self._background
@@ -117,6 +140,103 @@ class Scene:
                 self.__clear_dirty(child)
             del scene_node._children_transform_dirty[self]
 
+    def __update_node(
+        self,
+        scene_node: SceneNode,
+        new_quat: cgm.quat,
+        new_mat: cgm.mat4,
+        new_path: str,
+    ):
+        if isinstance(scene_node, Mesh):
+            mesh = scene_node
+            instances = self._all_meshes.get(mesh, None)
+            if isinstance(instances, Instances) and new_path in instances._path_index_map:
+                if mesh not in self._pending_transforms:
+                    self._pending_transforms[mesh] = ([], [])
+
+                slots, mats = self._pending_transforms[mesh]
+                slots.append(instances._path_index_map[new_path])
+                mats.append(new_mat)
+                self.__anything_changed = True
+                self.__meshes_changed = True
+                return
+
+            if mesh not in self._all_meshes:
+                self._all_meshes[mesh] = {}
+
+            if new_path not in self._all_meshes[mesh]:
+                self._all_meshes[mesh][new_path] = AffineTransform()
+
+            self._all_meshes[mesh][new_path]["affine_transform_row0"] = cgm.vec4(
+                new_mat[0][0], new_mat[1][0], new_mat[2][0], new_mat[3][0]
+            )
+            self._all_meshes[mesh][new_path]["affine_transform_row1"] = cgm.vec4(
+                new_mat[0][1], new_mat[1][1], new_mat[2][1], new_mat[3][1]
+            )
+            self._all_meshes[mesh][new_path]["affine_transform_row2"] = cgm.vec4(
+                new_mat[0][2], new_mat[1][2], new_mat[2][2], new_mat[3][2]
+            )
+            self.__anything_changed = True
+            self.__meshes_changed = True
+        elif isinstance(scene_node, SpotLight):
+            spot_light = None
+            if new_path not in self._spot_lights:
+                spot_light = FlatSpotLight(scene_node)
+                self._spot_lights[new_path] = spot_light
+            else:
+                spot_light = self._spot_lights[new_path]
+                spot_light.update(scene_node)
+
+            spot_light.abs_position = new_mat[3].xyz
+            spot_light.direction = new_quat * cgm.vec3(0, 1, 0)
+            self._spot_lights.dirty = True
+
+            self.__anything_changed = True
+            self._spot_lights_changed = True
+        elif isinstance(scene_node, PointLight):
+            point_light = None
+            if new_path not in self._point_lights:
+                point_light = FlatPointLight(scene_node)
+                self._point_lights[new_path] = point_light
+            else:
+                point_light = self._point_lights[new_path]
+                point_light.update(scene_node)
+
+            point_light.abs_position = new_mat[3].xyz
+            self._point_lights.dirty = True
+
+            self.__anything_changed = True
+            self._point_lights_changed = True
+        elif isinstance(scene_node, DirLight):
+            dir_light = None
+            if new_path not in self._dir_lights:
+                dir_light = FlatDirLight(scene_node)
+                self._dir_lights[new_path] = dir_light
+            else:
+                dir_light = self._dir_lights[new_path]
+                dir_light.update(scene_node)
+
+            dir_light.direction = new_quat * cgm.vec3(0, 1, 0)
+            dir_light.abs_orientation = new_quat
+            self._dir_lights.dirty = True
+
+            self.__anything_changed = True
+            self._dir_lights_changed = True
+        elif isinstance(scene_node, Camera):
+            camera = scene_node
+            camera.abs_position = new_mat[3].xyz
+            camera.abs_orientation = new_quat
+
+    def __write_pending_transforms(self):
+        for mesh, (slots, mats) in self._pending_transforms.items():
+            attr_list_map = self._all_meshes[mesh]._attr_list_map
+            mats = np.frombuffer(b"".join([bytes(mat._data) for mat in mats]), dtype=np.float32).reshape(-1, 4, 4)
+            attr_list_map["affine_transform_row0"].set_rows(slots, mats[:, :, 0])
+            attr_list_map["affine_transform_row1"].set_rows(slots, mats[:, :, 1])
+            attr_list_map["affine_transform_row2"].set_rows(slots, mats[:, :, 2])
+
+        self._pending_transforms.clear()
+
     def __trav(
         self,
         scene_node: SceneNode,
@@ -132,101 +252,68 @@ class Scene:
             return
 
         new_quat = current_quat * scene_node.orientation
-        new_mat = (
-            current_mat
-            * translate_to_mat4(scene_node.position)
-            * quat_to_mat4(scene_node.orientation)
-            * scale_to_mat4(scene_node.scale)
-        )
-        if scene_node.pivot._is_set:
-            new_mat = (
-                new_mat
-                * scale_to_mat4(1 / scene_node.pivot.scale)
-                * quat_to_mat4(cgm.conjugate(scene_node.pivot.orientation))
-                * translate_to_mat4(-scene_node.pivot.position)
-            )
+        new_mat = current_mat * scene_node.transform_mat
         new_path = current_path + "/" + scene_node.name
 
         if self in scene_node._transform_dirty:
-            if isinstance(scene_node, Mesh):
-                mesh = scene_node
-                if mesh not in self._all_meshes:
-                    self._all_meshes[mesh] = {}
-
-                if new_path not in self._all_meshes[mesh]:
-                    self._all_meshes[mesh][new_path] = AffineTransform()
-
-                self._all_meshes[mesh][new_path]["affine_transform_row0"] = cgm.vec4(
-                    new_mat[0][0], new_mat[1][0], new_mat[2][0], new_mat[3][0]
-                )
-                self._all_meshes[mesh][new_path]["affine_transform_row1"] = cgm.vec4(
-                    new_mat[0][1], new_mat[1][1], new_mat[2][1], new_mat[3][1]
-                )
-                self._all_meshes[mesh][new_path]["affine_transform_row2"] = cgm.vec4(
-                    new_mat[0][2], new_mat[1][2], new_mat[2][2], new_mat[3][2]
-                )
-                self.__anything_changed = True
-            elif isinstance(scene_node, SpotLight):
-                spot_light = None
-                if new_path not in self._spot_lights:
-                    spot_light = FlatSpotLight(scene_node)
-                    self._spot_lights[new_path] = spot_light
-                else:
-                    spot_light = self._spot_lights[new_path]
-                    spot_light.update(scene_node)
+            self.__update_node(scene_node, new_quat, new_mat, new_path)
 
-                spot_light.abs_position = new_mat[3].xyz
-                spot_light.direction = new_quat * cgm.vec3(0, 1, 0)
-                self._spot_lights.dirty = True
+        if self in scene_node._children_transform_dirty:
+            for child in scene_node._children_transform_dirty[self]:
+                self.__trav(child, new_quat, new_mat, new_path)
 
-                self.__anything_changed = True
-                self._spot_lights_changed = True
-            elif isinstance(scene_node, PointLight):
-                point_light = None
-                if new_path not in self._point_lights:
-                    point_light = FlatPointLight(scene_node)
-                    self._point_lights[new_path] = point_light
-                else:
-                    point_light = self._point_lights[new_path]
-                    point_light.update(scene_node)
+    def __flat_trav(self):
+        flat_graph = self._flat_graph
+        structure_changed = flat_graph.structure_dirty
+        flat_graph.update()
+        entry_paths = flat_graph.entry_paths
 
-                point_light.abs_position = new_mat[3].xyz
-                self._point_lights.dirty = True
+        if structure_changed:
+            mesh_entries = flat_graph.mesh_entries
+            for mesh in list(self._all_meshes.keys()):
+                if mesh not in mesh_entries:
+                    del self._all_meshes[mesh]
 
-                self.__anything_changed = True
-                self._point_lights_changed = True
-            elif isinstance(scene_node, DirLight):
-                dir_light = None
-                if new_path not in self._dir_lights:
-                    dir_light = FlatDirLight(scene_node)
-                    self._dir_lights[new_path] = dir_light
-                else:
-                    dir_light = self._dir_lights[new_path]
-                    dir_light.update(scene_node)
+            for mesh, entries in mesh_entries.items():
+                if mesh not in self._all_meshes:
+                    self._all_meshes[mesh] = self._backup_meshes.get(mesh, {})
 
-                dir_light.direction = new_quat * cgm.vec3(0, 1, 0)
-                dir_light.abs_orientation = new_quat
-                self._dir_lights.dirty = True
+                instances = self._all_meshes[mesh]
+                paths = set(entry_paths[entry] for entry in entries)
+                for path in [path for path in instances.keys() if path not in paths]:
+                    del instances[path]
 
-                self.__anything_changed = True
-                self._dir_lights_changed = True
-            elif isinstance(scene_node, Camera):
-                camera = scene_node
-                camera.abs_position = new_mat[3].xyz
-                camera.abs_orientation = new_quat
-                
-        if self in scene_node._children_transform_dirty:
-            for child in scene_node._children_transform_dirty[self]:
-                self.__trav(child, new_quat, new_mat, new_path)
+                for path in paths:
+                    if path not in instances:
+                        instances[path] = AffineTransform()
+
+            self.__meshes_changed = True
+
+        for entry, scene_node in flat_graph.other_entries:
+            self.__update_node(
+                scene_node,
+                flat_graph.world_quat(entry),
+                flat_graph.world_mat(entry),
+                entry_paths[entry],
+            )
+
+        self.__anything_changed = True
+        return structure_changed
 
     def __collect_render_infos(self):
         if (
             self not in self._root._transform_dirty
             and self not in self._root._children_transform_dirty
+            and not (self._vectorized_transforms and self._flat_graph.dirty)
         ):
             return
 
-        self.__trav(self._root, cgm.quat(), cgm.mat4(), "")
+        structure_changed = False
+        if self._vectorized_transforms:
+            structure_changed = self.__flat_trav()
+        else:
+            self.__trav(self._root, cgm.quat(), cgm.mat4(), "")
+
         if self.__anything_changed:
             self.__update_env_maps()
             self.__update_depth_maps()
@@ -252,6 +339,18 @@ class Scene:
                 self._backup_meshes[mesh].update(self._all_meshes[mesh])
                 self._all_meshes[mesh] = self._backup_meshes[mesh]
 
+        self.__write_pending_transforms()
+        if self._vectorized_transforms:
+            if structure_changed:
+                self._flat_graph.bind_instances(self._all_meshes)
+
+            if self._flat_graph.write_instances(self._all_meshes):
+                self.__meshes_changed = True
+
+        if self.__meshes_changed:
+            self._generation += 1
+            self.__meshes_changed = False
+
     @property
     def dir_lights(self):
         self.__collect_render_infos()
@@ -321,7 +420,7 @@ class Scene:
             for mesh, instances in instance_map.items():
                 should_remove_keys = []
                 for key in instances.keys():
-                    if key == path_str or key.starts_with(path_str + "/"):
+                    if key == path_str or key.startswith(path_str + "/"):
                         should_remove_keys.append(key)
 
                 if len(should_remove_keys) == len(instances):
@@ -336,7 +435,7 @@ class Scene:
             lights = instance_map
             should_remove_keys = []
             for key in lights.keys():
-                if key == path_str or key.starts_with(path_str + "/"):
+                if key == path_str or key.startswith(path_str + "/"):
                     should_remove_keys.append(key)
 
             for key in should_remove_keys:
@@ -344,6 +443,7 @@ class Scene:
                 del lights[key]
 
     def _remove_paths_prefix(self, paths_str: set):
+        self._flat_graph.invalidate()
         for path_str in paths_str:
             Scene.__remove_path_prefix(self._all_meshes, path_str)
             Scene.__remove_path_prefix(self._dir_lights, path_str)
@@ -2,13 +2,13 @@ from __future__ import annotations
 import cgmath as cgm
 import math
 import uuid
-import numpy as np
 from typing import Union, List
 
 from glass.DictList import DictList
 from glass.WeakSet import WeakSet
 from glass.WeakDict import WeakDict
 from glass.MetaInstancesRecorder import MetaInstancesRecorder
+from glass.utils import quat_to_mat4, scale_to_mat4, translate_to_mat4
 from .Pivot import Pivot
 
 
@@ -32,6 +32,7 @@ class SceneNode(metaclass=MetaInstancesRecorder):
         self._scale.on_changed = self._set_dirty
 
         self._yaw_pitch_roll: cgm.vec3 = cgm.vec3()
+        self._yaw_pitch_roll_orientation: cgm.quat = cgm.quat()
         self._pivot:Pivot = Pivot(self)
 
         self.abs_position = cgm.vec3()
@@ -78,9 +79,16 @@ class SceneNode(metaclass=MetaInstancesRecorder):
 
     @visible.setter
     def visible(self, visible: bool):
-        self.set_propagation_prop("visible", visible)
+        self.set_propagation_prop("visible", visible, SceneNode._call_visible_changed)
         self.update_screens()
 
+    @staticmethod
+    def _call_visible_changed(scene_node):
+        scene_node._visible_changed()
+
+    def _visible_changed(self):
+        pass
+
     def hide(self):
         self.visible = False
 
@@ -175,6 +183,7 @@ class SceneNode(metaclass=MetaInstancesRecorder):
         node._add_as_child_callback()
 
         node._add_scenes(self._scenes)
+        self._invalidate_flat_graphs()
         self._set_dirty(False, True)
         self.update_screens()
 
@@ -264,6 +273,7 @@ class SceneNode(metaclass=MetaInstancesRecorder):
             self._name = name
             return
 
+        self._invalidate_flat_graphs()
         for parent in self._parents:
             if name in parent._children:
                 raise NameError(
@@ -299,6 +309,25 @@ class SceneNode(metaclass=MetaInstancesRecorder):
     def orientation(self, orientation: cgm.quat)->None:
         self._orientation[:] = orientation
 
+    @property
+    def transform_mat(self)->cgm.mat4:
+        mat = (
+            translate_to_mat4(self._position)
+            * quat_to_mat4(self._orientation)
+            * scale_to_mat4(self._scale)
+        )
+        if self._pivot._is_set:
+            mat = (
+                mat
+                * scale_to_mat4(1 / self._pivot.scale)
+                * quat_to_mat4(cgm.conjugate(self._pivot.orientation))
+                * translate_to_mat4(-self._pivot.position)
+            )
+        return mat
+
+    def batch_update(self)->cgm.defer_notifications:
+        return cgm.defer_notifications()
+
     def rotate(self, axis:cgm.vec3, angle:float)->None:
         angle_rad = angle/180*math.pi
         self._orientation[:] = cgm.quat(math.cos(angle_rad/2), math.sin(angle_rad/2)*axis) * self._orientation
@@ -312,43 +341,24 @@ class SceneNode(metaclass=MetaInstancesRecorder):
             child._add_scenes(scenes)
 
     def _update_yaw_pitch_roll(self):
-        if not self._should_update_yaw_pitch_roll:
+        if (
+            not self._should_update_yaw_pitch_roll
+            or self._orientation == self._yaw_pitch_roll_orientation
+        ):
             return
 
-        q0 = self._orientation.w
-        q1 = self._orientation.x
-        q2 = self._orientation.y
-        q3 = self._orientation.z
-        self._yaw_pitch_roll[0] = (
-            math.atan2(2 * (q0 * q3 - q1 * q2), 1 - 2 * (q1 * q1 + q3 * q3))
-            / math.pi
-            * 180
-        )
-        self._yaw_pitch_roll[1] = (
-            math.asin(np.clip(2 * (q0 * q1 + q2 * q3), -1, 1)) / math.pi * 180
-        )
-        self._yaw_pitch_roll[2] = (
-            math.atan2(2 * (q0 * q2 - q1 * q3), 1 - 2 * (q1 * q1 + q2 * q2))
-            / math.pi
-            * 180
-        )
+        self._yaw_pitch_roll[:] = cgm.quatToYawPitchRoll(self._orientation) / math.pi * 180
+        self._yaw_pitch_roll_orientation[:] = self._orientation
 
-        self._set_dirty()
+        cgm.defer_notifications._notify(self._set_dirty)
 
     def _update_orientation(self):
-        yaw = self._yaw_pitch_roll[0] / 180 * math.pi
-        pitch = self._yaw_pitch_roll[1] / 180 * math.pi
-        roll = self._yaw_pitch_roll[2] / 180 * math.pi
-
-        quat1 = cgm.quat(math.cos(yaw / 2), 0, 0, math.sin(yaw / 2))
-        quat2 = cgm.quat(math.cos(pitch / 2), math.sin(pitch / 2), 0, 0)
-        quat3 = cgm.quat(math.cos(roll / 2), 0, math.sin(roll / 2), 0)
-
         self._should_update_yaw_pitch_roll = False
-        self.orientation = quat1 * quat2 * quat3
+        self.orientation = cgm.quatYawPitchRoll(self._yaw_pitch_roll / 180 * math.pi)
+        self._yaw_pitch_roll_orientation[:] = self._orientation
         self._should_update_yaw_pitch_roll = True
 
-        self._set_dirty()
+        cgm.defer_notifications._notify(self._set_dirty)
 
     @property
     def yaw(self)->float:
@@ -416,6 +426,10 @@ class SceneNode(metaclass=MetaInstancesRecorder):
         for child in self._children:
             child._clear_dirty_scenes(scenes)
 
+    def _invalidate_flat_graphs(self):
+        for scene in self._scenes:
+            scene._flat_graph.invalidate()
+
     def _update_scenes(self):
         old_scenes = self._scenes
         self._scenes = WeakSet()
@@ -71,11 +71,15 @@ def __init__(self, camera, parent=None) -> None:
     self._before_draw_lines = 0
     self._before_draw_meshes = 0
     self._before_draw_patches = 0
+    self._before_draw_instances = 0
     self._draw_calls = 0
     self._draw_points = 0
     self._draw_lines = 0
     self._draw_meshes = 0
     self._draw_patches = 0
+    self._draw_instances = 0
+    self._culled_instances = 0
+    self._shadow_culled_instances = 0
     self._paint_times = 0
 
     self._fps_filter = SlideAverageFilter()
@@ -292,6 +296,7 @@ def _mark_draw_calls(self):
     self._before_draw_lines = ShaderProgram.accum_draw_lines()
     self._before_draw_meshes = ShaderProgram.accum_draw_meshes()
     self._before_draw_patches = ShaderProgram.accum_draw_patches()
+    self._before_draw_instances = ShaderProgram.accum_draw_instances()
 
 
 def paintGL(self) -> None:
@@ -507,6 +512,10 @@ def _calc_fps(self) -> None:
     self._draw_lines = ShaderProgram.accum_draw_lines() - self._before_draw_lines
     self._draw_meshes = ShaderProgram.accum_draw_meshes() - self._before_draw_meshes
     self._draw_patches = ShaderProgram.accum_draw_patches() - self._before_draw_patches
+    self._draw_instances = ShaderProgram.accum_draw_instances() - self._before_draw_instances
+    if self._renderer is not None:
+        self._culled_instances = self._renderer.culled_instances
+        self._shadow_culled_instances = self._renderer.shadow_culled_instances
     self._paint_times += 1
 
 
@@ -590,6 +599,21 @@ def draw_patches(self) -> int:
     return self._draw_patches
 
 
+@property
+def draw_instances(self) -> int:
+    return self._draw_instances
+
+
+@property
+def culled_instances(self) -> int:
+    return self._culled_instances
+
+
+@property
+def shadow_culled_instances(self) -> int:
+    return self._shadow_culled_instances
+
+
 def timerEvent(self, timer_event) -> None:
     if timer_event.timerId() == self._listen_cursor_timer:
         cursor_global_pos = self.__class__.qt.QtGui.QCursor.pos()
@@ -832,6 +856,9 @@ def init_QtScreen(cls):
     cls.draw_lines = draw_lines
     cls.draw_meshes = draw_meshes
     cls.draw_patches = draw_patches
+    cls.draw_instances = draw_instances
+    cls.culled_instances = culled_instances
+    cls.shadow_culled_instances = shadow_culled_instances
     cls.timerEvent = timerEvent
     cls.capture = capture
     cls.capture_video = capture_video
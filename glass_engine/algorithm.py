@@ -371,6 +371,179 @@ def generate_smooth_TBN(vertices, indices, calculate_normal=True):
                 vertices["normal"].ndarray[index, :] = info["normal"]
 
 
+def vertex_cache_stats(indices: np.ndarray, n_vertices: int = None, cache_size: int = 32):
+    flat = np.asarray(indices).reshape(-1)
+    n_triangles = len(flat) // 3
+    if n_triangles == 0:
+        return {"ACMR": 0.0, "ATVR": 0.0}
+
+    if n_vertices is None:
+        n_vertices = int(flat.max()) + 1
+
+    cache_time = [-cache_size - 1] * n_vertices
+    time = 0
+    misses = 0
+    for vertex in flat.tolist():
+        if time - cache_time[vertex] > cache_size:
+            cache_time[vertex] = time
+            time += 1
+            misses += 1
+
+    n_used_vertices = len(np.unique(flat))
+    return {"ACMR": misses / n_triangles, "ATVR": misses / n_used_vertices}
+
+
+def optimize_vertex_cache(indices: np.ndarray, n_vertices: int = None, cache_size: int = 16):
+    triangles = np.asarray(indices, dtype=np.int64).reshape(-1, 3)
+    n_triangles = len(triangles)
+    if n_triangles == 0:
+        return triangles.astype(np.uint32), np.zeros(1, dtype=np.int64)
+
+    if n_vertices is None:
+        n_vertices = int(triangles.max()) + 1
+
+    flat = triangles.reshape(-1)
+    order = np.argsort(flat, kind="stable")
+    adjacency = (order // 3).tolist()
+    valence = np.bincount(flat, minlength=n_vertices)
+    offsets = np.concatenate(([0], np.cumsum(valence))).tolist()
+    live = valence.tolist()
+    triangle_list = triangles.tolist()
+
+    cache_time = [-cache_size - 1] * n_vertices
+    emitted = [False] * n_triangles
+    output = []
+    cluster_starts = [0]
+    dead_end = []
+    time = cache_size + 1
+    cursor = 0
+    fanning = int(flat[0])
+
+    while fanning >= 0:
+        candidates = []
+        for i in range(offsets[fanning], offsets[fanning + 1]):
+            triangle = adjacency[i]
+            if emitted[triangle]:
+                continue
+
+            emitted[triangle] = True
+            output.append(triangle)
+            for vertex in triangle_list[triangle]:
+                dead_end.append(vertex)
+                candidates.append(vertex)
+                live[vertex] -= 1
+                if time - cache_time[vertex] > cache_size:
+                    cache_time[vertex] = time
+                    time += 1
+
+        fanning = -1
+        best_priority = -1
+        for vertex in candidates:
+            if live[vertex] <= 0:
+                continue
+
+            priority = 0
+            if time - cache_time[vertex] + 2 * live[vertex] <= cache_size:
+                priority = time - cache_time[vertex]
+
+            if priority > best_priority:
+                best_priority = priority
+                fanning = vertex
+
+        if fanning >= 0:
+            continue
+
+        while dead_end:
+            vertex = dead_end.pop()
+            if live[vertex] > 0:
+                fanning = vertex
+                break
+
+        if fanning < 0:
+            while cursor < n_vertices:
+                if live[cursor] > 0:
+                    fanning = cursor
+                    break
+                cursor += 1
+
+        if fanning >= 0 and time - cache_time[fanning] > cache_size:
+            cluster_starts.append(len(output))
+
+    return triangles[output].astype(np.uint32), np.array(cluster_starts, dtype=np.int64)
+
+
+def optimize_overdraw(indices: np.ndarray, positions: np.ndarray, cluster_starts: np.ndarray):
+    triangles = np.asarray(indices).reshape(-1, 3)
+    n_triangles = len(triangles)
+    cluster_starts = np.asarray(cluster_starts, dtype=np.int64)
+    if n_triangles == 0 or len(cluster_starts) <= 1:
+        return triangles
+
+    positions = np.asarray(positions, dtype=np.float64)[:, :3]
+    p0 = positions[triangles[:, 0]]
+    p1 = positions[triangles[:, 1]]
+    p2 = positions[triangles[:, 2]]
+    area_normals = np.cross(p1 - p0, p2 - p0)
+    areas = np.linalg.norm(area_normals, axis=1)
+    centroids = (p0 + p1 + p2) / 3
+
+    total_area = areas.sum()
+    if total_area > 0:
+        mesh_center = (centroids * areas[:, None]).sum(axis=0) / total_area
+    else:
+        mesh_center = centroids.mean(axis=0)
+
+    cluster_areas = np.add.reduceat(areas, cluster_starts)
+    cluster_centers = np.add.reduceat(centroids * areas[:, None], cluster_starts, axis=0)
+    cluster_centers /= np.maximum(cluster_areas, 1e-30)[:, None]
+    cluster_normals = np.add.reduceat(area_normals, cluster_starts, axis=0)
+    occlusion = np.einsum("ij,ij->i", cluster_centers - mesh_center, cluster_normals)
+
+    cluster_ids = np.repeat(
+        np.arange(len(cluster_starts)), np.diff(np.append(cluster_starts, n_triangles))
+    )
+    order = np.argsort(-occlusion[cluster_ids], kind="stable")
+    return triangles[order]
+
+
+def optimize_vertex_fetch(indices: np.ndarray, n_vertices: int):
+    flat = np.asarray(indices).reshape(-1)
+    used_vertices, first_use = np.unique(flat, return_index=True)
+    new_order = used_vertices[np.argsort(first_use, kind="stable")]
+    unused = np.ones(n_vertices, dtype=bool)
+    unused[used_vertices] = False
+    new_order = np.concatenate((new_order, np.flatnonzero(unused))).astype(np.int64)
+
+    remap = np.empty(n_vertices, dtype=np.int64)
+    remap[new_order] = np.arange(n_vertices)
+    new_indices = remap[np.asarray(indices)].astype(np.uint32)
+    return new_indices, new_order
+
+
+def optimize_mesh_buffers(vertices, indices, cache_size: int = 16, overdraw: bool = False):
+    triangles = indices.ndarray.reshape(-1, 3)
+    n_vertices = len(vertices)
+    report = {"before": vertex_cache_stats(triangles, n_vertices, cache_size)}
+
+    triangles, cluster_starts = optimize_vertex_cache(triangles, n_vertices, cache_size)
+    if overdraw and "position" in vertices._attr_list_map:
+        triangles = optimize_overdraw(
+            triangles, vertices["position"].ndarray, cluster_starts
+        )
+
+    triangles, new_order = optimize_vertex_fetch(triangles, n_vertices)
+    for attr_list in vertices._attr_list_map.values():
+        attr_list.ndarray = attr_list.ndarray[new_order]
+
+    for vertex in vertices._index_vertex_map.values():
+        vertex._array_index_map.pop(vertices, None)
+    vertices._index_vertex_map.clear()
+
+    indices.ndarray = triangles
+    report["after"] = vertex_cache_stats(triangles, n_vertices, cache_size)
+    return report
+
+
 def line_intersect_plane(
     line_start: cgm.vec3,
     line_direction: cgm.vec3,
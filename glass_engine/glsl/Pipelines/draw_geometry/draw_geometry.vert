@@ -26,6 +26,7 @@ out VertexOut
     flat int visible;
 } vs_out;
 
+#include "../../include/math.glsl"
 #include "../../include/transform.glsl"
 #include "../../include/tex_coord.glsl"
 #include "../../include/Camera.glsl"
@@ -35,6 +36,8 @@ uniform Camera camera;
 uniform Material material;
 uniform Material back_material;
 
+uniform int octahedral_TBN;
+
 void main()
 {
     mat4 transform = transpose(mat4(
@@ -48,7 +51,7 @@ void main()
     vs_out.color = color;
     vs_out.back_color = back_color;
     vs_out.visible = visible;
-    vs_out.world_TBN = transform_apply_to_TBN(transform, mat3(tangent, bitangent, normal));
+    vs_out.world_TBN = transform_apply_to_TBN(transform, decode_TBN(tangent, bitangent, normal, octahedral_TBN));
     transform_tex_coord(material, back_material, tex_coord, vs_out.tex_coord, vs_out.back_tex_coord);
 
     gl_Position = vec4(transform_apply(transform, position), 1);
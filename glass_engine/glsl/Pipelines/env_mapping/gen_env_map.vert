@@ -36,6 +36,7 @@ out VertexOut
     flat int visible;
 } vs_out;
 
+#include "../../include/math.glsl"
 #include "../../include/transform.glsl"
 #include "../../include/tex_coord.glsl"
 #include "../../include/Material.glsl"
@@ -43,6 +44,8 @@ out VertexOut
 uniform Material material;
 uniform Material back_material;
 
+uniform int octahedral_TBN;
+
 void main()
 {
     mat4 transform = transpose(mat4(
@@ -55,7 +58,7 @@ void main()
     vs_out.affine_transform = transform;
     vs_out.color = color;
     vs_out.back_color = back_color;
-    vs_out.world_TBN = transform_apply_to_TBN(transform, mat3(tangent, bitangent, normal));
+    vs_out.world_TBN = transform_apply_to_TBN(transform, decode_TBN(tangent, bitangent, normal, octahedral_TBN));
 
 #if USE_BINDLESS_TEXTURE && USE_DYNAMIC_ENV_MAPPING
     vs_out.env_map_handle = env_map_handle;
@@ -36,4 +36,22 @@ float max4(vec4 v)
     return max(max(max(v.x, v.y), v.z), v.w);
 }
 
+vec3 decode_octahedral(vec2 e)
+{
+    vec3 n = vec3(e, 1.0 - abs(e.x) - abs(e.y));
+    float t = max(-n.z, 0.0);
+    n.x += (n.x >= 0.0 ? -t : t);
+    n.y += (n.y >= 0.0 ? -t : t);
+    return normalize(n);
+}
+
+mat3 decode_TBN(vec3 tangent, vec3 bitangent, vec3 normal, int octahedral_TBN)
+{
+    return mat3(
+        (octahedral_TBN & 1) != 0 ? decode_octahedral(tangent.xy) : tangent,
+        (octahedral_TBN & 2) != 0 ? decode_octahedral(bitangent.xy) : bitangent,
+        (octahedral_TBN & 4) != 0 ? decode_octahedral(normal.xy) : normal
+    );
+}
+
 #endif
\ No newline at end of file